@@ -0,0 +1,130 @@
+"""
+Headless batch forecasting over every stored demand history.
+
+Takes every series of the storage backend (Data_Storage.storage: the workbooks under
+Uploaded/{family}/{type}/{grade}/{period}/, or the SQLite database with FIMS_STORAGE=sqlite),
+runs Naive, Moving Average and Exponential Smoothing on it, scores them with MAD/MSE
+and writes one table with the best method per series.
+
+Run from the repository root:
+    python -m Batch_Forecasting.batch --output batch_results.csv --workers 8
+    FIMS_STORAGE=sqlite python -m Batch_Forecasting.batch --output batch_results.csv
+"""
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from Data_Storage.storage import discover_series, read_series
+from Forecasting_Methods.Naive_Method.naive import apply_naive_forecast
+from Forecasting_Methods.MovingAvg_Method.movingavg import apply_moving_average
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import apply_exponential_smoothing
+from Forecasting_Methods.Parameter_Tuning.tuning import tune_parameters
+from Forecasting_Error.Error_Engine.engine import error_table
+
+METHODS = ["Naive", "Moving Average", "Exponential Smoothing"]
+
+# --------------------- Evaluate One Series ---------------------
+def forecast_series(df, demand_col="Demand", ma_periods=3, alpha=0.3):
+    """
+    Run the three methods the same way page_forecasting does
+    (the first period's forecast is the first actual demand).
+    Returns {method: forecast Series}.
+    """
+    first = df[demand_col].iloc[0]
+    naive = apply_naive_forecast(df, demand_col=demand_col, forecast_col="Forecast")["Forecast"]
+    ma = apply_moving_average(df, demand_col=demand_col, forecast_col="Forecast", periods=ma_periods)["Forecast"]
+    exp = apply_exponential_smoothing(df, demand_col=demand_col, forecast_col="Forecast", alpha=alpha)["Forecast"]
+    return {
+        "Naive": naive.fillna(first),
+        "Moving Average": ma.fillna(first),
+        "Exponential Smoothing": exp,
+    }
+
+def evaluate_series(job, demand_col="Demand", ma_periods=3, alpha=0.3, criteria="MAD", tune=False):
+    """
+    Load one series (with its pending edits), forecast it with every method and score the forecasts.
+    With tune=True the moving-average window and alpha are optimized per series first.
+    Never raises: failures are reported in the 'Error' column of the returned row.
+    """
+    row = dict(job)
+    try:
+        df = read_series(job["file"]).fillna(0).reset_index(drop=True)
+        if demand_col not in df.columns or df.empty:
+            raise ValueError(f"no '{demand_col}' data")
+        row["Records"] = len(df)
+        if tune:
+            tuned = tune_parameters(df[demand_col].to_numpy(dtype=float), criteria=criteria)
+            ma_periods, alpha = tuned["ma_n"], tuned["alpha"]
+        row["MA Periods"] = ma_periods
+        row["Alpha"] = alpha
+        forecasts = forecast_series(df, demand_col, ma_periods, alpha)
+        errors = error_table(df[demand_col].to_numpy(dtype=float),
+                             np.column_stack([np.asarray(f, dtype=float) for f in forecasts.values()]), forecasts)
+        scores = {}
+        for method, mad, mse in zip(errors["Method"], errors["MAD"], errors["MSE"]):
+            row[f"{method} MAD"] = mad
+            row[f"{method} MSE"] = mse
+            scores[method] = mad if criteria == "MAD" else mse
+        best = min(scores, key=scores.get)
+        row["Best Method"] = best
+        row[f"Best {criteria}"] = scores[best]
+        row["Error"] = ""
+    except Exception as e:
+        row["Error"] = str(e)
+    return row
+
+def _evaluate_job(args):
+    job, options = args
+    return evaluate_series(job, **options)
+
+# --------------------- Batch Runner ---------------------
+def run_batch(root="Uploaded", workers=None, chunksize=16, **options):
+    """
+    Evaluate every stored series (under root for the xlsx backend) on a process pool.
+    Returns (results DataFrame, stats dict with series count, seconds and series/second).
+    """
+    jobs = list(discover_series(root))
+    start = time.perf_counter()
+    tasks = [(job, options) for job in jobs]
+    if workers == 1 or len(jobs) <= 1:
+        rows = [_evaluate_job(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(_evaluate_job, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    results = pd.DataFrame(rows)
+    stats = {
+        "series": len(jobs),
+        "failed": int((results["Error"] != "").sum()) if len(results) else 0,
+        "seconds": elapsed,
+        "series_per_second": len(jobs) / elapsed if elapsed > 0 else 0.0,
+    }
+    return results, stats
+
+def write_results(results, output):
+    if output.endswith(".xlsx"):
+        results.to_excel(output, index=False)
+    else:
+        results.to_csv(output, index=False)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch forecasting over every stored series")
+    parser.add_argument("--root", default="Uploaded", help="workbook tree (xlsx storage)")
+    parser.add_argument("--output", default="batch_results.csv", help=".csv or .xlsx")
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--criteria", choices=["MAD", "MSE"], default="MAD")
+    parser.add_argument("--ma-periods", type=int, default=3)
+    parser.add_argument("--alpha", type=float, default=0.3)
+    parser.add_argument("--tune", action="store_true", help="optimize MA window and alpha per series")
+    args = parser.parse_args()
+
+    results, stats = run_batch(
+        args.root, workers=args.workers, chunksize=args.chunksize,
+        criteria=args.criteria, ma_periods=args.ma_periods, alpha=args.alpha, tune=args.tune,
+    )
+    write_results(results, args.output)
+    print(f"{stats['series']} series ({stats['failed']} failed) in {stats['seconds']:.2f}s "
+          f"→ {stats['series_per_second']:.1f} series/s, results written to {args.output}")
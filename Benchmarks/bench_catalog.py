@@ -0,0 +1,67 @@
+"""
+Material catalog: index build time and cascading-select lookup time
+against the per-rerun DataFrame filtering it replaced.
+
+Run from the repository root:
+    python -m Benchmarks.bench_catalog --grades 100000
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from Data_Storage.catalog import MaterialCatalog
+
+# --------------------- Synthetic Catalog ---------------------
+def make_catalog_frame(grades, families=20, types_per_family=50):
+    rng = np.random.default_rng(0)
+    fam = rng.integers(0, families, grades)
+    typ = rng.integers(0, types_per_family, grades)
+    return pd.DataFrame({
+        "MaterialFamily": [f"Family {f}" for f in fam],
+        "MaterialType": [f"Type {f}-{t}" for f, t in zip(fam, typ)],
+        "MaterialGrade": [f"Grade {i}" for i in range(grades)],
+    })
+
+def filter_select(df, family, m_type):
+    """
+    What select_material used to do on every rerun.
+    """
+    families = sorted(df["MaterialFamily"].unique())
+    family_df = df[df["MaterialFamily"] == family]
+    types = sorted(family_df["MaterialType"].unique())
+    type_df = family_df[family_df["MaterialType"] == m_type]
+    return families, types, sorted(type_df["MaterialGrade"].unique())
+
+def index_select(catalog, family, m_type):
+    return catalog.families(), catalog.types(family), catalog.grades(family, m_type)
+
+def run_benchmark(grades, repeat=20):
+    df = make_catalog_frame(grades)
+    catalog = MaterialCatalog()
+    start = time.perf_counter()
+    catalog._build_index(df)
+    build = time.perf_counter() - start
+
+    family = catalog.families()[0]
+    m_type = catalog.types(family)[0]
+    assert filter_select(df, family, m_type) == index_select(catalog, family, m_type)
+    timings = {}
+    for name, fn, arg in (("filter", filter_select, df), ("index", index_select, catalog)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn(arg, family, m_type)
+        timings[name] = (time.perf_counter() - start) / repeat
+    return pd.DataFrame([{
+        "Grades": grades,
+        "Index build (s)": build,
+        "Filter select (s)": timings["filter"],
+        "Index select (s)": timings["index"],
+        "Speedup": timings["filter"] / timings["index"],
+    }])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Material catalog benchmark")
+    parser.add_argument("--grades", type=int, nargs="+", default=[1_000, 100_000])
+    args = parser.parse_args()
+    result = pd.concat([run_benchmark(g) for g in args.grades], ignore_index=True)
+    print(result.to_string(index=False, float_format="{:.6f}".format))
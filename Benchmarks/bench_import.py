@@ -0,0 +1,80 @@
+"""
+Cold-start cost of the compute API vs the UI stack.
+
+Each measurement runs in a fresh interpreter: import time, peak RSS and whether
+streamlit/matplotlib got pulled in, plus the time for a spawned worker process
+(as used by process pools) to import the module and return its first result.
+
+Run from the repository root:
+    python -m Benchmarks.bench_import --repeat 5
+"""
+import sys
+import time
+import json
+import argparse
+import statistics
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+TARGETS = {
+    "compute core": ["Compute_Core.core"],
+    "batch runner": ["Batch_Forecasting.batch"],
+    "compute core + UI stack": ["Compute_Core.core", "streamlit", "matplotlib.pyplot", "Chart_Rendering.charts"],
+}
+
+PROBE = """
+import sys, time, json, resource
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "streamlit": "streamlit" in sys.modules,
+    "matplotlib": "matplotlib" in sys.modules,
+}}))
+"""
+
+# --------------------- Fresh Interpreter ---------------------
+def import_probe(modules):
+    out = subprocess.run([sys.executable, "-c", PROBE.format(modules=modules)],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+# --------------------- Spawned Worker ---------------------
+def _import_modules(modules):
+    for name in modules:
+        __import__(name)
+    return len(sys.modules)
+
+def worker_startup(modules):
+    """
+    Seconds from creating a one-worker spawn pool to its first result.
+    """
+    start = time.perf_counter()
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pool.submit(_import_modules, modules).result()
+    return time.perf_counter() - start
+
+def run_benchmark(repeat=5):
+    rows = []
+    for label, modules in TARGETS.items():
+        probes = [import_probe(modules) for _ in range(repeat)]
+        workers = [worker_startup(modules) for _ in range(repeat)]
+        rows.append({
+            "Target": label,
+            "Import (ms)": statistics.median(p["seconds"] for p in probes) * 1e3,
+            "Peak RSS (MB)": statistics.median(p["max_rss_mb"] for p in probes),
+            "Worker start (ms)": statistics.median(workers) * 1e3,
+            "streamlit": probes[0]["streamlit"],
+            "matplotlib": probes[0]["matplotlib"],
+        })
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import / worker cold-start benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    import pandas as pd
+    print(pd.DataFrame(run_benchmark(args.repeat)).to_string(index=False, float_format="{:.1f}".format))
@@ -0,0 +1,57 @@
+"""
+Speed of the NumPy exponential smoothing kernel against the per-period Python loop
+it replaced, for single long series and for many series at once.
+
+Run from the repository root:
+    python -m Benchmarks.bench_ses_kernel
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import exponential_smoothing_kernel
+
+# --------------------- Reference Loop ---------------------
+def loop_exponential_smoothing(demand, alpha):
+    """
+    Forecast(t) = alpha * Actual(t-1) + (1-alpha) * Forecast(t-1), one period at a time.
+    """
+    forecast = [demand[0]]
+    for t in range(1, len(demand)):
+        forecast.append(alpha * demand[t - 1] + (1 - alpha) * forecast[-1])
+    return forecast
+
+def time_call(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# --------------------- Benchmark ---------------------
+def run_benchmark(lengths, series_count, series_length, alpha=0.3, repeat=3):
+    rng = np.random.default_rng(0)
+    rows = []
+    for n in lengths:
+        demand = rng.poisson(20, n).astype(float)
+        loop = time_call(lambda: loop_exponential_smoothing(demand.tolist(), alpha), 1)
+        kernel = time_call(lambda: exponential_smoothing_kernel(demand, alpha), repeat)
+        rows.append({"Case": f"1 x {n:,}", "Loop (s)": loop, "Kernel (s)": kernel, "Speedup": loop / kernel})
+
+    demand = rng.poisson(20, (series_count, series_length)).astype(float)
+    loop = time_call(lambda: [loop_exponential_smoothing(row, alpha) for row in demand.tolist()], 1)
+    kernel = time_call(lambda: exponential_smoothing_kernel(demand, alpha), repeat)
+    rows.append({"Case": f"{series_count:,} x {series_length:,}", "Loop (s)": loop,
+                 "Kernel (s)": kernel, "Speedup": loop / kernel})
+    return pd.DataFrame(rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exponential smoothing kernel benchmark")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--series", type=int, default=10_000, help="series count for the 2-D case")
+    parser.add_argument("--series-length", type=int, default=156, help="periods per series for the 2-D case")
+    parser.add_argument("--alpha", type=float, default=0.3)
+    args = parser.parse_args()
+    result = run_benchmark(args.lengths, args.series, args.series_length, args.alpha)
+    print(result.to_string(index=False, float_format="{:.5f}".format))
@@ -0,0 +1,62 @@
+"""
+Cold vs warm load benchmark for the demand-history sidecar cache.
+
+Run from the repository root:
+    python -m Benchmarks.bench_sidecar --rows 1000 10000 100000
+"""
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from Data_Storage.sidecar import read_excel_cached, invalidate_sidecar
+
+# --------------------- Synthetic Workbook ---------------------
+def make_workbook(folder, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Week": np.arange(1, rows + 1),
+        "Demand": rng.poisson(20, rows),
+    })
+    path = os.path.join(folder, f"Demand-History({rows}).xlsx")
+    df.to_excel(path, index=False)
+    return path
+
+def time_call(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# --------------------- Benchmark ---------------------
+def run_benchmark(rows_list, repeat=5):
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in rows_list:
+            path = make_workbook(folder, rows)
+            baseline = time_call(lambda: pd.read_excel(path), 1)
+
+            invalidate_sidecar(path)
+            start = time.perf_counter()
+            read_excel_cached(path)
+            cold = time.perf_counter() - start
+
+            warm = time_call(lambda: read_excel_cached(path), repeat)
+            results.append({
+                "Rows": rows,
+                "read_excel (s)": baseline,
+                "Cold (s)": cold,
+                "Warm (s)": warm,
+                "Speedup": baseline / warm,
+            })
+    return pd.DataFrame(results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sidecar cache cold/warm load benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(run_benchmark(args.rows, args.repeat).to_string(index=False, float_format="{:.4f}".format))
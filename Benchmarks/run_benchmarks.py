@@ -0,0 +1,322 @@
+"""
+Benchmark suite for forecasting, error metrics, charts, EOQ math and table loading.
+
+Each case is timed (best of several runs) and its peak memory is traced,
+across synthetic series lengths and series counts. Results can be saved as
+a baseline JSON and later runs are compared against it.
+
+Run from the repository root:
+    python -m Benchmarks.run_benchmarks                           # compare with Benchmarks/baseline.json
+    python -m Benchmarks.run_benchmarks --save-baseline           # refresh the stored baseline
+    python -m Benchmarks.run_benchmarks --sizes 100 10000000 --output results.json
+"""
+import os
+import ast
+import gc
+import atexit
+import shutil
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from Forecasting_Methods.Naive_Method import naive
+from Forecasting_Methods.MovingAvg_Method import movingavg
+from Forecasting_Methods.ExponentialSmoothing_Method import exponential
+from Forecasting_Methods.Parameter_Tuning.tuning import tune_parameters, tune_holt, tune_holt_winters
+from Forecasting_Error.MAD import mad
+from Forecasting_Error.MSE import mse
+from Forecasting_Error.Error_Engine.engine import error_metrics
+from Chart_Rendering.charts import render_line_chart
+from Data_Storage.sidecar import invalidate_sidecar
+from Compute_Core import core
+from Inventory_Methods.EOQ.catalog_eoq import catalog_eoq
+from Period_Rollup.rollup import rollup_frame
+from Data_Storage import database
+from Inventory_Methods.Safety_Stock.catalog_safety_stock import catalog_safety_stock, series_stats
+from Forecasting_Methods.Backtesting.backtest import backtest_group
+from Compute_Core.evaluation import evaluate_concurrently
+from Forecasting_Cache.session_results import ForecastResults
+from Data_Storage.shared import SharedDatasets
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_SERIES = [1, 100, 10_000]
+SERIES_LENGTH = 156
+MAX_IO_SIZE = 100_000
+MAX_CHART_SIZE = 1_000_000
+MAX_TUNE_ELEMENTS = 10_000 * SERIES_LENGTH
+MAX_RECURSION_SIZE = 100_000
+
+# --------------------- app.py Functions ---------------------
+def load_app_functions(*names, path=APP_FILE):
+    """
+    Pull plain functions out of app.py without running the Streamlit script:
+    only its import statements and the requested function definitions are executed.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    nodes = [node for node in tree.body
+             if isinstance(node, (ast.Import, ast.ImportFrom))
+             or (isinstance(node, ast.FunctionDef) and node.name in names)]
+    namespace = {}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), path, "exec"), namespace)
+    return {name: namespace[name] for name in names}
+
+# --------------------- Synthetic Data ---------------------
+def demand_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"Week": np.arange(1, n + 1), "Demand": rng.poisson(20, n).astype(float)})
+
+def demand_matrix(series, n=SERIES_LENGTH, seed=0):
+    return np.random.default_rng(seed).poisson(20, (series, n)).astype(float)
+
+# --------------------- Cases ---------------------
+def build_cases():
+    """
+    Returns [(name, axis, setup, fn, max_size)]: setup(size) builds the arguments
+    outside the timed region, fn(*args) is the measured call.
+    axis is "length" (one series of that many periods) or "series" (that many series).
+    """
+    app = load_app_functions("load_table")
+
+    def with_forecast(n):
+        df = demand_frame(n)
+        df["Forecast"] = df["Demand"].shift(1).fillna(df["Demand"].iloc[0])
+        return (df,)
+
+    def three_forecasts(n):
+        demand = demand_frame(n)["Demand"].to_numpy()
+        return demand, np.column_stack([demand[::-1], np.roll(demand, 1), exponential.exponential_smoothing_kernel(demand, 0.3)])
+
+    def workbook(n):
+        folder = tempfile.mkdtemp()
+        atexit.register(shutil.rmtree, folder, True)
+        path = os.path.join(folder, "Demand-History.xlsx")
+        demand_frame(n).to_excel(path, index=False)
+        return (path,)
+
+    def cold_load(path):
+        invalidate_sidecar(path)
+        return app["load_table"](path)
+
+    def stored_series(n):
+        folder = tempfile.mkdtemp()
+        atexit.register(shutil.rmtree, folder, True)
+        path = os.path.join(folder, "demand.sqlite")
+        return database.write_series("F", "T", "G", "Weekly", "Demand.xlsx", demand_frame(n), path), path
+
+    def stored_catalog(m):
+        folder = tempfile.mkdtemp()
+        atexit.register(shutil.rmtree, folder, True)
+        path = os.path.join(folder, "demand.sqlite")
+        conn = database.connect(path)
+        for i in range(m):
+            database.write_series("F", "T", str(i), "Weekly", "Demand.xlsx", demand_frame(SERIES_LENGTH, i), path, conn)
+        return (path,)
+
+    def eoq_inputs(n):
+        rng = np.random.default_rng(0)
+        return rng.uniform(1e3, 1e5, n), rng.uniform(50, 500, n), rng.uniform(1, 50, n), rng.integers(1, 30, n)
+
+    def eoq_all(D, S, H, lead):
+        eoq = core.calculate_eoq(D, S, H)
+        rop = core.calculate_reorder_point(D / 365, lead)
+        return eoq, rop, core.days_between_orders(eoq, D / 365)
+
+    def catalog_inputs(m):
+        rng = np.random.default_rng(0)
+        catalog = pd.DataFrame({"MaterialFamily": "F", "MaterialType": "T", "MaterialGrade": np.arange(m)})
+        demand = {("F", "T", str(i)): {"Period": "Weekly", "File": "", "Records": SERIES_LENGTH,
+                                       "Annual Demand": d} for i, d in enumerate(rng.uniform(1e3, 1e5, m))}
+        breaks = pd.DataFrame({"MaterialFamily": "F", "MaterialType": "T", "MaterialGrade": np.repeat(np.arange(m), 3),
+                               "MinQty": np.tile([0, 500, 2000], m), "UnitPrice": np.tile([5.0, 4.8, 4.75], m)})
+        return catalog, demand, None, breaks
+
+    def safety_stock_inputs(m):
+        rng = np.random.default_rng(0)
+        catalog = pd.DataFrame({"MaterialFamily": "F", "MaterialType": "T", "MaterialGrade": np.arange(m)})
+        stats = {("F", "T", str(i)): {"Period": "Weekly", "File": "", "Records": SERIES_LENGTH, "Method": "Naive",
+                                      "Mean Demand": d, "Sigma": s}
+                 for i, (d, s) in enumerate(zip(rng.uniform(5, 50, m), rng.uniform(1, 10, m)))}
+        return catalog, stats
+
+    def simulation_inputs(replications):
+        history = demand_matrix(1)[0]
+        return (core.sample_demand(history, replications, SERIES_LENGTH, rng=np.random.default_rng(0)),
+                core.build_policy(history, "Weekly", 200, 25, 95, 14, lead_time_std_days=3))
+
+    def method_tasks(n):
+        df = demand_frame(n)
+        return ({"Naive": lambda: core.run_naive_forecasting(df, "Week"),
+                 "Moving Average": lambda: core.run_moving_average_forecasting(df, "Week"),
+                 "Exponential Smoothing": lambda: core.run_exponential_forecasting(df, "Week"),
+                 "Holt": lambda: core.run_holt_forecasting(df, "Week"),
+                 "Holt-Winters": lambda: core.run_holt_winters_forecasting(df, "Week", season_length=52)},)
+
+    def method_frames(n):
+        df = demand_frame(n)
+        frames = {method: run(df, "Week") for method, run in core.FORECASTERS.items()}
+        return df, frames
+
+    def open_sessions(sessions):
+        registry = SharedDatasets(mmap=False)
+        df = demand_frame(SERIES_LENGTH)
+        return [registry.acquire("Demand.xlsx", lambda: df, 1) for _ in range(sessions)]
+
+    frame = lambda n: (demand_frame(n),)
+    return [
+        ("naive.apply_naive_forecast", "length", frame, naive.apply_naive_forecast, None),
+        ("movingavg.apply_moving_average", "length", frame, movingavg.apply_moving_average, None),
+        ("exponential.apply_exponential_smoothing", "length", frame, exponential.apply_exponential_smoothing, None),
+        ("core.run_naive_forecasting", "length", frame, lambda df: core.run_naive_forecasting(df, "Week"), None),
+        ("core.run_moving_average_forecasting", "length", frame,
+         lambda df: core.run_moving_average_forecasting(df, "Week"), None),
+        ("core.run_exponential_forecasting", "length", frame,
+         lambda df: core.run_exponential_forecasting(df, "Week"), None),
+        ("mad.calculate_mad", "length", with_forecast, mad.calculate_mad, None),
+        ("mse.calculate_mse", "length", with_forecast, mse.calculate_mse, None),
+        ("engine.error_metrics (3 methods)", "length", three_forecasts, error_metrics, None),
+        ("core.calculate_eoq+reorder_point", "length", eoq_inputs, eoq_all, None),
+        ("charts.render_line_chart (2 series)", "length", three_forecasts,
+         lambda demand, forecasts: render_line_chart(np.arange(demand.size), [{"y": demand}, {"y": forecasts[:, 2]}]),
+         MAX_CHART_SIZE),
+        ("rollup.rollup_frame (Weekly->Monthly)", "length", frame,
+         lambda df: rollup_frame(df, "Weekly", "Monthly"), None),
+        ("backtest (full grid, 4 ahead)", "length", lambda n: (demand_frame(n)["Demand"].to_numpy(),),
+         core.backtest, MAX_RECURSION_SIZE),
+        ("database.read_series", "length", stored_series, database.read_series, MAX_IO_SIZE),
+        ("app.load_table (cold)", "length", workbook, cold_load, MAX_IO_SIZE),
+        ("app.load_table (warm)", "length", workbook, app["load_table"], MAX_IO_SIZE),
+        ("evaluate_concurrently (5 methods)", "length", method_tasks,
+         lambda tasks: evaluate_concurrently(tasks, budget=float("inf")), MAX_RECURSION_SIZE),
+        ("ForecastResults.from_frames (session results)", "length", method_frames,
+         lambda df, frames: ForecastResults.from_frames(df, "Week", frames, core.FORECAST_COLUMNS,
+                                                        max_bytes=float("inf")), MAX_RECURSION_SIZE),
+        ("holt_kernel", "length", lambda n: (demand_frame(n)["Demand"].to_numpy(),), core.holt_kernel,
+         MAX_RECURSION_SIZE),
+        ("holt_winters_kernel (m=12)", "length", lambda n: (demand_frame(n)["Demand"].to_numpy(), 0.3, 0.1, 0.1, 12),
+         core.holt_winters_kernel, MAX_RECURSION_SIZE),
+        ("exponential_smoothing_kernel (2-D)", "series", lambda s: (demand_matrix(s), 0.3),
+         exponential.exponential_smoothing_kernel, None),
+        ("catalog_eoq (discounts)", "series", catalog_inputs, catalog_eoq, None),
+        ("database.demand_summary", "series", stored_catalog, database.demand_summary, None),
+        ("safety stock series_stats (auto, 2-D)", "series", lambda s: (demand_matrix(s), "auto", {}),
+         series_stats, None),
+        ("catalog_safety_stock (cached stats)", "series", safety_stock_inputs,
+         lambda catalog, stats: catalog_safety_stock(catalog, stats, lead_time_std_days=2.0), None),
+        ("simulation.simulate_policy (s,Q)", "series", simulation_inputs,
+         lambda demand, policy: core.simulate_policy(demand, policy, np.random.default_rng(0)), None),
+        ("SharedDatasets.acquire (sessions on one table)", "series", lambda s: (s,), open_sessions, None),
+        ("backtest_group (2-D)", "series", lambda s: (demand_matrix(s),), backtest_group,
+         MAX_TUNE_ELEMENTS // SERIES_LENGTH),
+        ("tune_holt (2-D)", "series", lambda s: (demand_matrix(s),), tune_holt, MAX_TUNE_ELEMENTS // SERIES_LENGTH),
+        ("tune_holt_winters (2-D, m=12)", "series", lambda s: (demand_matrix(s), 12), tune_holt_winters,
+         MAX_TUNE_ELEMENTS // SERIES_LENGTH),
+        ("tune_parameters (2-D)", "series", lambda s: (demand_matrix(s),), tune_parameters,
+         MAX_TUNE_ELEMENTS // SERIES_LENGTH),
+    ]
+
+# --------------------- Measurement ---------------------
+def measure(fn, args, min_time=0.2, max_repeat=20):
+    """
+    Best wall time over repeated calls (one warm-up call first) and peak traced memory of one call.
+    """
+    fn(*args)
+    best, total, runs = float("inf"), 0.0, 0
+    while runs < max_repeat and (runs < 3 or total < min_time):
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+        best, total, runs = min(best, elapsed), total + elapsed, runs + 1
+        if elapsed > min_time:
+            break
+    gc.collect()
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+def run_suite(sizes, series_counts, only=None):
+    results = []
+    for name, axis, setup, fn, max_size in build_cases():
+        if only and not any(key in name for key in only):
+            continue
+        for size in (sizes if axis == "length" else series_counts):
+            if max_size is not None and size > max_size:
+                continue
+            args = setup(size)
+            seconds, peak = measure(fn, args)
+            results.append({"case": name, "axis": axis, "size": size, "seconds": seconds, "peak_bytes": peak})
+            print(f"{name:<42} {axis}={size:<10,} {seconds * 1e3:10.3f} ms {peak / 2 ** 20:10.2f} MiB", flush=True)
+            del args
+    return results
+
+# --------------------- Baseline ---------------------
+def environment():
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+def save_results(results, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+def compare(results, baseline_path, threshold=1.25):
+    """
+    Table of current vs baseline time and memory for every case present in both runs.
+    Rows slower than threshold x baseline are flagged as regressions.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["case"], r["size"]): r for r in json.load(f)["results"]}
+    rows = []
+    for r in results:
+        base = baseline.get((r["case"], r["size"]))
+        if base is None:
+            continue
+        ratio = r["seconds"] / base["seconds"] if base["seconds"] else float("nan")
+        rows.append({
+            "Case": r["case"], "Size": r["size"],
+            "Baseline (ms)": base["seconds"] * 1e3, "Now (ms)": r["seconds"] * 1e3, "Time x": ratio,
+            "Mem x": r["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else float("nan"),
+            "Regression": "YES" if ratio > threshold else "",
+        })
+    return pd.DataFrame(rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Forecasting / error / EOQ / I/O benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="series lengths")
+    parser.add_argument("--series", type=int, nargs="+", default=DEFAULT_SERIES, help="series counts")
+    parser.add_argument("--only", nargs="+", help="run only cases whose name contains one of these strings")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio flagged as regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.series, args.only)
+    if args.output:
+        save_results(results, args.output)
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        report = compare(results, args.baseline, args.threshold)
+        if report.empty:
+            print("No cases in common with the baseline")
+        else:
+            print(report.to_string(index=False, float_format="{:.3f}".format))
+        if args.fail_on_regression and (report["Regression"] == "YES").any():
+            raise SystemExit(1)
@@ -0,0 +1,126 @@
+"""
+Chart layer: downsampled, cached PNG line charts.
+
+Figures are drawn on a standalone matplotlib Figure (never registered with pyplot),
+rendered to PNG bytes and cleared right away, so nothing accumulates across reruns.
+The PNG is cached per (data hash, chart, params) and long series are decimated to a
+few thousand points first (LTTB or min/max), which keeps 100k+ point charts fast.
+"""
+import io
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from Forecasting_Cache.result_cache import ForecastCache
+from Performance_Monitor.timing import timed
+
+DEFAULT_MAX_POINTS = 2000
+MARKER_LIMIT = 300
+CHART_CACHE_BYTES = 32 * 1024 * 1024
+MARKER_CODES = "o.,v^<>1234sp*hH+xXDd|_"
+
+chart_cache = ForecastCache(max_bytes=CHART_CACHE_BYTES)
+
+# --------------------- Downsampling ---------------------
+def lttb_indices(y, threshold, x=None):
+    """
+    Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the visual shape of y.
+    """
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    n = y.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    bounds = np.append(edges, n)
+    # mean of every bucket (the last "bucket" is the final point)
+    counts = np.diff(bounds)
+    avg_x = np.add.reduceat(x, bounds[:-1]) / counts
+    avg_y = np.add.reduceat(y, bounds[:-1]) / counts
+    idx = np.empty(threshold, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        area = np.abs((x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+def minmax_indices(y, threshold):
+    """
+    Min/max decimation: the lowest and highest point of threshold // 2 equal buckets.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    buckets = threshold // 2
+    if threshold >= n or buckets < 1:
+        return np.arange(n)
+    size = -(-n // buckets)
+    offsets = np.arange(buckets) * size
+    blocks = np.full(buckets * size, np.inf)
+    blocks[:n] = np.where(np.isnan(y), np.inf, y)
+    lows = blocks.reshape(buckets, size).argmin(axis=1) + offsets
+    blocks[:n] = np.where(np.isnan(y), -np.inf, y)
+    blocks[n:] = -np.inf
+    highs = blocks.reshape(buckets, size).argmax(axis=1) + offsets
+    idx = np.concatenate([[0, n - 1], lows, highs])
+    return np.unique(idx[idx < n])
+
+DOWNSAMPLERS = {"lttb": lttb_indices, "minmax": minmax_indices}
+
+def downsample(ys, max_points=DEFAULT_MAX_POINTS, method="lttb"):
+    """
+    Shared indices for several series on one x axis: the union of each series' picks,
+    so every line keeps its own peaks.
+    """
+    n = len(ys[0])
+    if n <= max_points:
+        return np.arange(n)
+    per_series = max(max_points // len(ys), 3)
+    return np.unique(np.concatenate([DOWNSAMPLERS[method](y, per_series) for y in ys]))
+
+# --------------------- Rendering ---------------------
+@timed("chart: render")
+def render_line_chart(x, series, title="", xlabel="", ylabel="", hlines=(), figsize=(12, 6),
+                      max_points=DEFAULT_MAX_POINTS, method="lttb"):
+    """
+    Draw a line chart and return it as PNG bytes.
+    series: [{"y": values, "fmt": "o-", "label": ..., **plot kwargs}]
+    hlines: [{"y": value, **axhline kwargs}]
+    Markers are dropped once more than MARKER_LIMIT points are drawn.
+    """
+    x = np.asarray(x)
+    ys = [np.asarray(s["y"], dtype=float) for s in series]
+    idx = downsample(ys, max_points, method)
+    fig = Figure(figsize=figsize)
+    try:
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        for spec, y in zip(series, ys):
+            kwargs = {k: v for k, v in spec.items() if k not in ("y", "fmt")}
+            fmt = spec.get("fmt", "-")
+            if idx.size > MARKER_LIMIT:
+                fmt = "".join(c for c in fmt if c not in MARKER_CODES) or "-"
+            ax.plot(x[idx], y[idx], fmt, **kwargs)
+        for line in hlines:
+            ax.axhline(**line)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        if ax.get_legend_handles_labels()[0]:
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=100)
+        return buffer.getvalue()
+    finally:
+        fig.clear()
+
+def line_chart(x, series, key=None, source=None, **options):
+    """
+    render_line_chart() through the chart cache. key: hashable cache key (e.g.
+    make_key(data digest, chart name, params)); None renders without caching.
+    """
+    if key is None:
+        return render_line_chart(x, series, **options)
+    return chart_cache.get_or_compute(key, lambda: render_line_chart(x, series, **options), source)
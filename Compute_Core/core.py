@@ -0,0 +1,109 @@
+"""
+Headless compute API: forecasting, backtesting, error metrics, EOQ, safety stock and policy simulation.
+
+Imports only NumPy/pandas (plus the repo's own compute modules), never streamlit
+or matplotlib, so batch scripts and worker processes start fast. The Streamlit
+pages and the plot_*/run_* presentation helpers load the UI libraries lazily.
+
+    from Compute_Core.core import run_naive_forecasting, error_table, calculate_eoq
+"""
+import numpy as np
+from Performance_Monitor.timing import timed
+from Forecasting_Methods.Naive_Method.naive import apply_naive_forecast
+from Forecasting_Methods.MovingAvg_Method.movingavg import apply_moving_average
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import (
+    apply_exponential_smoothing, exponential_smoothing_kernel, exponential_smoothing_levels)
+from Forecasting_Methods.Holt_Method.holt import holt_paths, holt_kernel
+from Forecasting_Methods.HoltWinters_Method.holtwinters import (
+    SEASONAL, SEASON_LENGTHS, holt_winters_paths, holt_winters_kernel)
+from Forecasting_Methods.Parameter_Tuning.tuning import (
+    tune_parameters, tune_holt, tune_holt_winters, moving_average_grid, holt_grid, holt_winters_grid)
+from Forecasting_Methods.Backtesting.backtest import (
+    DEFAULT_HORIZON as BACKTEST_HORIZON, forecast_grid, origin_errors, error_summary, backtest, best_per_method)
+from Forecasting_Error.MAD.mad import calculate_mad
+from Forecasting_Error.MSE.mse import calculate_mse
+from Forecasting_Error.Error_Engine.engine import METRICS, SIGNED_METRICS, error_metrics, error_table, score_frame
+from Forecasting_Error.Running_Error.running_error import RunningError
+from Inventory_Methods.EOQ.eoq import (
+    calculate_eoq, calculate_reorder_point, days_between_orders, inventory_level, annual_demand_from_history,
+    annual_costs, quantity_discount_eoq)
+from Inventory_Methods.Safety_Stock.safety_stock import (
+    PERIOD_DAYS, inverse_normal, z_score, residual_sigma, lead_time_sigma, statistical_safety_stock, forecast_safety_stock)
+from Inventory_Methods.Simulation.simulation import (
+    sample_demand, build_policy, simulate_policy, run_simulation, summarize)
+
+FORECAST_COLUMNS = {
+    "Naive": "Naive Forecast",
+    "Moving Average": "Moving Avg Forecast",
+    "Exponential Smoothing": "Exponential Forecast",
+    "Holt": "Holt Forecast",
+    "Holt-Winters": "Holt-Winters Forecast",
+}
+
+# --------------------- Forecast Arrays (first period = first actual) ---------------------
+def naive_forecast(demand):
+    """
+    Forecast(t) = Actual(t-1). demand: (..., periods)
+    """
+    demand = np.asarray(demand, dtype=float)
+    return np.concatenate([demand[..., :1], demand[..., :-1]], axis=-1)
+
+def moving_average_forecast(demand, n=3):
+    """
+    Forecast(t) = mean of the last n actuals (fewer at the start). demand: (..., periods)
+    """
+    return moving_average_grid(np.asarray(demand, dtype=float), [n])[0]
+
+ARRAY_FORECASTERS = {
+    "Naive": lambda demand, **params: naive_forecast(demand),
+    "Moving Average": lambda demand, n=3: moving_average_forecast(demand, n),
+    "Exponential Smoothing": lambda demand, alpha=0.3: exponential_smoothing_kernel(demand, alpha),
+}
+
+# --------------------- Forecast Tables ---------------------
+@timed("forecast: Naive")
+def run_naive_forecasting(df, first_col):
+    df = df.copy()
+    df["Naive Forecast"] = naive_forecast(df["Demand"].to_numpy(dtype=float))
+    return df
+
+@timed("forecast: Moving Average")
+def run_moving_average_forecasting(df, first_col, n=3):
+    df = df.copy()
+    df["Moving Avg Forecast"] = moving_average_forecast(df["Demand"].to_numpy(dtype=float), n)
+    return df
+
+@timed("forecast: Exponential Smoothing")
+def run_exponential_forecasting(df, first_col, alpha=0.3):
+    df = df.copy()
+    df["Exponential Forecast"] = exponential_smoothing_kernel(df["Demand"].to_numpy(dtype=float), alpha)
+    return df
+
+@timed("forecast: Holt")
+def run_holt_forecasting(df, first_col, alpha=0.3, beta=0.1):
+    df = df.copy()
+    df["Holt Forecast"] = holt_kernel(df["Demand"].to_numpy(dtype=float), alpha, beta)
+    return df
+
+@timed("forecast: Holt-Winters")
+def run_holt_winters_forecasting(df, first_col, alpha=0.3, beta=0.1, gamma=0.1, season_length=12, seasonal="additive"):
+    df = df.copy()
+    df["Holt-Winters Forecast"] = holt_winters_kernel(df["Demand"].to_numpy(dtype=float), alpha, beta, gamma,
+                                                      season_length, seasonal)
+    return df
+
+def seasonal_fit(periods, period):
+    """
+    Season length of a period name when a history of that many periods supports
+    Holt-Winters (two full seasons of at least two periods), else None.
+    """
+    m = SEASON_LENGTHS.get(period, 1)
+    return m if m >= 2 and periods >= 2 * m else None
+
+FORECASTERS = {
+    "Naive": run_naive_forecasting,
+    "Moving Average": run_moving_average_forecasting,
+    "Exponential Smoothing": run_exponential_forecasting,
+    "Holt": run_holt_forecasting,
+    "Holt-Winters": run_holt_winters_forecasting,
+}
@@ -0,0 +1,142 @@
+"""
+Concurrent method evaluation on one shared, process-wide thread pool.
+
+Threads let the page give every candidate method a time budget and drop the slow ones
+instead of blocking on them, and they share the in-process forecast cache. They overlap
+only partly: NumPy releases the GIL inside large array operations (the batched tuning
+grids), but the Holt / Holt-Winters recursions step through the periods in Python on small
+arrays and hold it for most of each step.
+
+A budget counts from when the method starts running. A method that misses it is left out
+of the ranking; Python threads cannot be stopped, so it finishes in the background (its
+result still lands in the forecast cache for the next run) and keeps a worker busy until
+then. Such abandoned methods are counted per owner (one Streamlit session): an owner with
+MAX_ABANDONED of them still running waits for its own stragglers before submitting more,
+so one session's slow methods cannot fill the pool every session shares.
+
+    results, status = evaluate_concurrently({"Naive": lambda: ..., "Holt": lambda: ...}, budget=5.0,
+                                            owner=session_id)
+"""
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+DEFAULT_BUDGET_SECONDS = 5.0
+MAX_WORKERS = max(4, min(16, os.cpu_count() or 1))
+POLL_SECONDS = 0.05
+MAX_ABANDONED = 2
+
+_executor = None
+_executor_guard = threading.Lock()
+_abandoned = {}
+_abandoned_guard = threading.Lock()
+
+# --------------------- Shared Executor ---------------------
+def shared_executor():
+    """
+    The process-wide method-evaluation pool, created on first use and shared by every session.
+    """
+    global _executor
+    with _executor_guard:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="method-eval")
+        return _executor
+
+# --------------------- Abandoned Methods ---------------------
+def _abandon(owner, future):
+    """
+    Count a timed-out method that is still running against its owner until it finishes.
+    """
+    with _abandoned_guard:
+        _abandoned.setdefault(owner, set()).add(future)
+
+    def finished(done):
+        with _abandoned_guard:
+            running = _abandoned.get(owner)
+            if running is not None:
+                running.discard(done)
+                if not running:
+                    del _abandoned[owner]
+    future.add_done_callback(finished)
+
+def abandoned(owner):
+    """
+    Number of the owner's timed-out methods still occupying a worker.
+    """
+    with _abandoned_guard:
+        return len(_abandoned.get(owner, ()))
+
+def _wait_for_stragglers(owner, timeout):
+    """
+    Wait up to timeout for the owner to drop below MAX_ABANDONED; True when it did.
+    """
+    deadline = time.perf_counter() + timeout
+    while abandoned(owner) >= MAX_ABANDONED:
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(POLL_SECONDS)
+    return True
+
+def _run(task, started, name):
+    started[name] = time.perf_counter()
+    value = task()
+    return value, started[name], time.perf_counter() - started[name]
+
+# --------------------- Evaluation ---------------------
+def evaluate_concurrently(tasks, budget=DEFAULT_BUDGET_SECONDS, on_result=None, executor=None, owner=None):
+    """
+    Run {name: zero-argument callable} concurrently and collect what finishes within budget.
+    A method's budget runs from when it starts; one still queued budget seconds after
+    submission (every worker busy) is dropped as well. Methods still running past their
+    budget are counted against owner; while it has MAX_ABANDONED of them, a new call first
+    waits up to budget for them and otherwise skips every method.
+    on_result(record, value), called on the calling thread as each method finishes or is dropped,
+    receives {"Method", "Status": "done" | "timed out" | "failed" | "skipped", "Seconds", "Start",
+    "Error"} and the method's return value (None unless done).
+    Returns ({name: value} of the methods that finished, [record] in completion order).
+    """
+    executor = executor or shared_executor()
+    results, status = {}, []
+
+    def report(record, value=None):
+        status.append(record)
+        if on_result is not None:
+            on_result(record, value)
+
+    waited = time.perf_counter()
+    if not _wait_for_stragglers(owner, budget):
+        for name in tasks:
+            report({"Method": name, "Status": "skipped", "Seconds": time.perf_counter() - waited, "Start": waited,
+                    "Error": f"{abandoned(owner)} methods of earlier runs are still running past their budget"})
+        return results, status
+    started = {}
+    submitted = time.perf_counter()
+    futures = {executor.submit(_run, task, started, name): name for name, task in tasks.items()}
+
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = futures[future]
+            try:
+                value, start, seconds = future.result()
+            except Exception as e:
+                start = started.get(name, submitted)
+                report({"Method": name, "Status": "failed", "Seconds": time.perf_counter() - start,
+                        "Start": start, "Error": str(e)})
+                continue
+            results[name] = value
+            report({"Method": name, "Status": "done", "Seconds": seconds, "Start": start, "Error": ""}, value)
+        now = time.perf_counter()
+        for future in list(pending):
+            name = futures[future]
+            start = started.get(name)
+            if now - (submitted if start is None else start) > budget:
+                pending.discard(future)
+                if not future.cancel():
+                    _abandon(owner, future)
+                report({"Method": name, "Status": "timed out", "Seconds": now - (start or submitted),
+                        "Start": start or submitted,
+                        "Error": f"exceeded the {budget:g} s budget" if start else "never started within the budget"})
+    return results, status
@@ -0,0 +1,90 @@
+import os
+import threading
+import pandas as pd
+from Data_Storage.sidecar import read_excel_cached
+
+CATALOG_FILE = "Database/Classification-of-Material.xlsx"
+LEVELS = ["MaterialFamily", "MaterialType", "MaterialGrade"]
+
+_catalogs = {}
+_catalogs_guard = threading.Lock()
+
+def _sort_key(value):
+    """
+    Sort numbers before text and missing values last, without comparing across types.
+    """
+    if pd.isna(value):
+        return (2, 0, "")
+    if isinstance(value, (int, float)):
+        return (0, value, "")
+    return (1, 0, str(value))
+
+# --------------------- Material Catalog ---------------------
+class MaterialCatalog:
+    """
+    Material classification loaded once per process and indexed as a
+    family -> type -> [grades] tree, so the cascading selects are dict lookups.
+    The workbook is reloaded only when its mtime/size change.
+    """
+    def __init__(self, path=CATALOG_FILE):
+        self.path = path
+        self.df = None
+        self.tree = {}
+        self._families = []
+        self._types = {}
+        self._signature = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Reload the workbook if it changed since the last load. Returns True on reload.
+        """
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+        with self._lock:
+            if signature == self._signature:
+                return False
+            df = read_excel_cached(self.path)
+            self._build_index(df)
+            self.df = df
+            self._signature = signature
+        return True
+
+    def _build_index(self, df):
+        rows = df[LEVELS].drop_duplicates()
+        tree = {}
+        for family, m_type, grade in zip(*(rows[col].tolist() for col in LEVELS)):
+            tree.setdefault(family, {}).setdefault(m_type, []).append(grade)
+        for types in tree.values():
+            for grades in types.values():
+                grades.sort(key=_sort_key)
+        self.tree = tree
+        self._families = sorted(tree, key=_sort_key)
+        self._types = {family: sorted(types, key=_sort_key) for family, types in tree.items()}
+
+    # ----- Lookups -----
+    def families(self):
+        return self._families
+
+    def types(self, family):
+        return self._types.get(family, [])
+
+    def grades(self, family, m_type):
+        return self.tree.get(family, {}).get(m_type, [])
+
+    def __len__(self):
+        return sum(len(grades) for types in self.tree.values() for grades in types.values())
+
+def get_catalog(path=CATALOG_FILE):
+    """
+    Process-wide catalog for path, refreshed if the file changed.
+    """
+    key = os.path.abspath(path)
+    with _catalogs_guard:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = MaterialCatalog(path)
+    catalog.refresh()
+    return catalog
@@ -0,0 +1,399 @@
+"""
+Embedded SQLite storage for demand histories (stdlib sqlite3, one database file).
+
+Every uploaded table is a row of `series`, indexed by material and period, and its
+values are rows of `observations` keyed by (series, column, position). Numbers are stored
+as numbers, text cells as text and dates as ISO text; `series.dtypes` restores each
+column's dtype on read. Edits are applied
+in place inside a transaction and logged in `edits` with what they replaced, so undo and
+edit history work like the workbook journal. `version` grows with every change and is
+the series' data signature for the caches.
+
+Series are addressed by keys of the form "sqlite:{id}/{family}/{type}/{grade}/{period}/{name}"
+so the app can keep passing one string around as it does with workbook paths.
+
+Import the existing Uploaded/ tree (journaled edits included) from the repository root:
+    python -m Data_Storage.database --import Uploaded --database Database/demand.sqlite
+"""
+import os
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+DEFAULT_DATABASE = "Database/demand.sqlite"
+DB_PREFIX = "sqlite:"
+
+# value is untyped so text cells stay text (a REAL column would turn "007" into 7.0)
+OBSERVATIONS = """
+CREATE TABLE IF NOT EXISTS observations (
+    series_id INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    value,
+    PRIMARY KEY (series_id, col, position)
+) WITHOUT ROWID;
+"""
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    family TEXT NOT NULL,
+    type TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    period TEXT NOT NULL,
+    name TEXT NOT NULL,
+    columns TEXT NOT NULL,
+    dtypes TEXT NOT NULL,
+    demand_col INTEGER,
+    rows INTEGER NOT NULL DEFAULT 0,
+    version INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (family, type, grade, period, name)
+);
+""" + OBSERVATIONS + """
+CREATE TABLE IF NOT EXISTS edits (
+    id INTEGER PRIMARY KEY,
+    series_id INTEGER NOT NULL,
+    ts TEXT NOT NULL,
+    op TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    undone INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS edits_by_series ON edits (series_id, undone, id);
+"""
+
+_local = threading.local()
+
+# --------------------- Connection ---------------------
+def connect(database=DEFAULT_DATABASE):
+    """
+    One connection per thread and database file (Streamlit reruns run on different threads).
+    WAL mode lets readers proceed while an edit is being written.
+    """
+    connections = _local.__dict__.setdefault("connections", {})
+    path = os.path.abspath(database)
+    conn = connections.get(path)
+    if conn is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        _untype_values(conn)
+        connections[path] = conn
+    return conn
+
+def _untype_values(conn):
+    """
+    Databases created before text columns were kept declare observations.value REAL:
+    move their values to the untyped table in one transaction.
+    """
+    declared = conn.execute("SELECT type FROM pragma_table_info('observations') WHERE name = 'value'").fetchone()
+    if declared is None or declared[0].upper() != "REAL":
+        return
+    conn.executescript("BEGIN;\nALTER TABLE observations RENAME TO observations_real;\n" + OBSERVATIONS +
+                       "INSERT INTO observations SELECT * FROM observations_real;\n"
+                       "DROP TABLE observations_real;\nCOMMIT;")
+
+def make_key(series_id, family, m_type, grade, period, name):
+    return f"{DB_PREFIX}{series_id}/{family}/{m_type}/{grade}/{period}/{name}"
+
+def series_id(key):
+    return int(key[len(DB_PREFIX):].split("/", 1)[0])
+
+def _meta(conn, sid):
+    row = conn.execute("SELECT columns, dtypes, rows, version FROM series WHERE id = ?", (sid,)).fetchone()
+    if row is None:
+        raise KeyError(f"No series {sid} in the database")
+    return json.loads(row[0]), json.loads(row[1]), row[2], row[3]
+
+def _value(value):
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, str):
+        return value
+    return float(value)
+
+def _dtype(column):
+    """
+    Stored dtype name of a column: "int", "float", "bool", "text" or a datetime64 dtype.
+    Raises ValueError for columns that cannot be stored exactly (e.g. [1, "a"]).
+    """
+    if pd.api.types.is_bool_dtype(column):
+        return "bool"
+    if pd.api.types.is_integer_dtype(column):
+        return "int"
+    if pd.api.types.is_float_dtype(column):
+        return "float"
+    if pd.api.types.is_datetime64_dtype(column):
+        return str(column.dtype)
+    if pd.api.types.is_string_dtype(column) and all(isinstance(v, str) for v in column.dropna()):
+        return "text"
+    raise ValueError(f"Column '{column.name}' ({column.dtype}) cannot be stored: "
+                     "only numbers, dates and text columns are supported")
+
+def _cells(column, dtype):
+    """
+    Values of one column as stored: numbers, text, ISO dates; None for missing.
+    """
+    if dtype == "text":
+        return [None if pd.isna(v) else v for v in column]
+    if dtype.startswith("datetime64"):
+        return [None if pd.isna(v) else v.isoformat() for v in column]
+    return [None if np.isnan(v) else v for v in column.to_numpy(dtype=float).tolist()]
+
+def _column(cells, dtype):
+    """
+    Inverse of _cells: a column of stored values with its dtype.
+    """
+    if dtype == "text":
+        return np.array([np.nan if v is None else v for v in cells], dtype=object)
+    if dtype.startswith("datetime64"):
+        return pd.to_datetime(pd.Series(cells, dtype=object)).astype(dtype).to_numpy()
+    values = np.array(cells, dtype=float)
+    whole = np.array_equal(values, np.round(values))
+    if dtype == "int" and whole:
+        return values.astype(np.int64)
+    if dtype == "bool" and whole:
+        return values.astype(bool)
+    return values
+
+# --------------------- Write ---------------------
+def write_series(family, m_type, grade, period, name, df, database=DEFAULT_DATABASE, conn=None):
+    """
+    Store (or replace) one table, keeping its dtypes and text values. Returns its key.
+    Raises ValueError (before writing anything) for columns that cannot be stored exactly.
+    """
+    conn = conn or connect(database)
+    family, m_type, grade = str(family), str(m_type), str(grade)
+    columns = [str(c) for c in df.columns]
+    dtypes = [_dtype(df.iloc[:, i]) for i in range(df.shape[1])]
+    demand_col = columns.index("Demand") if "Demand" in columns else None
+    cells = [_cells(df.iloc[:, i], dtype) for i, dtype in enumerate(dtypes)]
+    with conn:
+        row = conn.execute("SELECT id, version FROM series WHERE family = ? AND type = ? AND grade = ? "
+                           "AND period = ? AND name = ?", (family, m_type, grade, period, name)).fetchone()
+        if row is None:
+            sid = conn.execute("INSERT INTO series (family, type, grade, period, name, columns, dtypes, demand_col, "
+                               "rows) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                               (family, m_type, grade, period, name, json.dumps(columns), json.dumps(dtypes),
+                                demand_col, len(df))).lastrowid
+        else:
+            sid = row[0]
+            conn.execute("DELETE FROM observations WHERE series_id = ?", (sid,))
+            conn.execute("DELETE FROM edits WHERE series_id = ?", (sid,))
+            conn.execute("UPDATE series SET columns = ?, dtypes = ?, demand_col = ?, rows = ?, version = version + 1 "
+                         "WHERE id = ?", (json.dumps(columns), json.dumps(dtypes), demand_col, len(df), sid))
+        conn.executemany("INSERT INTO observations (series_id, col, position, value) VALUES (?, ?, ?, ?)",
+                         ((sid, i, position, value) for i, column in enumerate(cells)
+                          for position, value in enumerate(column)))
+    return make_key(sid, family, m_type, grade, period, name)
+
+# --------------------- Read ---------------------
+def read_series(key, database=DEFAULT_DATABASE):
+    """
+    The stored table as a DataFrame with its stored dtypes (integer and boolean columns
+    stay so while every value is whole).
+    """
+    conn = connect(database)
+    sid = series_id(key)
+    columns, dtypes, rows, _ = _meta(conn, sid)
+    flat = [value for (value,) in conn.execute(
+        "SELECT value FROM observations WHERE series_id = ? ORDER BY col, position", (sid,))]
+    return pd.DataFrame({column: _column(flat[i * rows:(i + 1) * rows], dtype)
+                         for i, (column, dtype) in enumerate(zip(columns, dtypes))})
+
+def signature(key, database=DEFAULT_DATABASE):
+    """
+    [database file, series id, version]: changes with every write or edit of the series.
+    """
+    sid = series_id(key)
+    return [os.path.abspath(database), sid, _meta(connect(database), sid)[3]]
+
+def list_series(family, m_type, grade, period, database=DEFAULT_DATABASE):
+    """
+    [(name, key)] of the tables stored for one material and period.
+    """
+    rows = connect(database).execute(
+        "SELECT id, name FROM series WHERE family = ? AND type = ? AND grade = ? AND period = ? ORDER BY name",
+        (str(family), str(m_type), str(grade), period)).fetchall()
+    return [(name, make_key(sid, family, m_type, grade, period, name)) for sid, name in rows]
+
+def discover_series(database=DEFAULT_DATABASE):
+    """
+    Job dicts like Data_Storage.storage.discover_workbooks, with the series key as "file".
+    """
+    rows = connect(database).execute(
+        "SELECT id, family, type, grade, period, name FROM series ORDER BY family, type, grade, period, name")
+    for sid, family, m_type, grade, period, name in rows:
+        yield {"family": family, "type": m_type, "grade": grade, "period": period,
+               "file": make_key(sid, family, m_type, grade, period, name)}
+
+def demand_summary(database=DEFAULT_DATABASE):
+    """
+    One row per stored series with the count, sum and mean of its Demand column,
+    aggregated inside SQLite (no table is loaded into Python).
+    """
+    return pd.read_sql_query(
+        "SELECT s.id, s.family, s.type, s.grade, s.period, s.name, COUNT(o.value) AS records, "
+        "SUM(o.value) AS total, AVG(o.value) AS mean FROM series s "
+        "LEFT JOIN observations o ON o.series_id = s.id AND o.col = s.demand_col "
+        "GROUP BY s.id ORDER BY s.family, s.type, s.grade, s.period, s.name", connect(database))
+
+# --------------------- Edits ---------------------
+def _shift(conn, sid, start, step):
+    """
+    Move positions >= start by step (+1 / -1) without tripping the primary key midway.
+    """
+    conn.execute("UPDATE observations SET position = -(position + ?) - 1 WHERE series_id = ? AND position >= ?",
+                 (step, sid, start))
+    conn.execute("UPDATE observations SET position = -position - 1 WHERE series_id = ? AND position < 0", (sid,))
+
+def _renumber(conn, sid, columns, first_col):
+    if first_col in columns:
+        conn.execute("UPDATE observations SET value = position + 1 WHERE series_id = ? AND col = ?",
+                     (sid, columns.index(first_col)))
+
+def _row(conn, sid, columns, index):
+    values = dict(conn.execute("SELECT col, value FROM observations WHERE series_id = ? AND position = ?",
+                               (sid, index)).fetchall())
+    return {column: values.get(i) for i, column in enumerate(columns)}
+
+def _insert_row(conn, sid, columns, index, row):
+    conn.executemany("INSERT INTO observations (series_id, col, position, value) VALUES (?, ?, ?, ?)",
+                     [(sid, i, index, _value(row.get(column))) for i, column in enumerate(columns)])
+
+def _apply(conn, sid, op, fields):
+    """
+    Apply one row operation; returns what undo needs to reverse it.
+    """
+    columns, _, rows, _ = _meta(conn, sid)
+    if op == "add":
+        _insert_row(conn, sid, columns, rows, fields["row"])
+        conn.execute("UPDATE series SET rows = rows + 1 WHERE id = ?", (sid,))
+        return {}
+    if op == "edit":
+        index = fields["index"]
+        if not 0 <= index < rows:
+            raise IndexError(f"row {index} out of range")
+        old = _row(conn, sid, columns, index)
+        conn.executemany("UPDATE observations SET value = ? WHERE series_id = ? AND col = ? AND position = ?",
+                         [(_value(v), sid, columns.index(c), index) for c, v in fields["values"].items()
+                          if c in columns])
+        _renumber(conn, sid, columns, fields.get("first_col"))
+        return {"old": {c: old[c] for c in fields["values"] if c in old}}
+    if op == "delete":
+        index = fields["index"]
+        if not 0 <= index < rows:
+            raise IndexError(f"row {index} out of range")
+        old = _row(conn, sid, columns, index)
+        conn.execute("DELETE FROM observations WHERE series_id = ? AND position = ?", (sid, index))
+        _shift(conn, sid, index + 1, -1)
+        conn.execute("UPDATE series SET rows = rows - 1 WHERE id = ?", (sid,))
+        _renumber(conn, sid, columns, fields.get("first_col"))
+        return {"old": old}
+    raise ValueError(f"Unknown edit '{op}'")
+
+def _revert(conn, sid, op, fields, undo):
+    columns, _, rows, _ = _meta(conn, sid)
+    if op == "add":
+        conn.execute("DELETE FROM observations WHERE series_id = ? AND position = ?", (sid, rows - 1))
+        conn.execute("UPDATE series SET rows = rows - 1 WHERE id = ?", (sid,))
+    elif op == "edit":
+        conn.executemany("UPDATE observations SET value = ? WHERE series_id = ? AND col = ? AND position = ?",
+                         [(_value(v), sid, columns.index(c), fields["index"]) for c, v in undo["old"].items()])
+        _renumber(conn, sid, columns, fields.get("first_col"))
+    elif op == "delete":
+        _shift(conn, sid, fields["index"], 1)
+        _insert_row(conn, sid, columns, fields["index"], undo["old"])
+        conn.execute("UPDATE series SET rows = rows + 1 WHERE id = ?", (sid,))
+        _renumber(conn, sid, columns, fields.get("first_col"))
+
+def append_op(key, op, database=DEFAULT_DATABASE, **fields):
+    """
+    Apply one row operation ('add', 'edit', 'delete' or 'undo'), same arguments as
+    Data_Storage.journal.append_op, and log it for history / undo.
+    """
+    if op == "undo":
+        return undo_last(key, database)
+    conn = connect(database)
+    sid = series_id(key)
+    record = {"ts": datetime.now().isoformat(timespec="milliseconds"), "op": op}
+    record.update({k: v for k, v in fields.items()})
+    payload = json.loads(json.dumps(fields, default=_value))
+    with conn:
+        undo = _apply(conn, sid, op, payload)
+        conn.execute("INSERT INTO edits (series_id, ts, op, payload) VALUES (?, ?, ?, ?)",
+                     (sid, record["ts"], op, json.dumps({"fields": payload, "undo": undo})))
+        conn.execute("UPDATE series SET version = version + 1 WHERE id = ?", (sid,))
+    return record
+
+def undo_last(key, database=DEFAULT_DATABASE):
+    """
+    Revert the latest edit still in effect. Returns False when there is nothing to undo.
+    """
+    conn = connect(database)
+    sid = series_id(key)
+    with conn:
+        row = conn.execute("SELECT id, op, payload FROM edits WHERE series_id = ? AND undone = 0 "
+                           "ORDER BY id DESC LIMIT 1", (sid,)).fetchone()
+        if row is None:
+            return False
+        payload = json.loads(row[2])
+        _revert(conn, sid, row[1], payload["fields"], payload["undo"])
+        conn.execute("UPDATE edits SET undone = 1 WHERE id = ?", (row[0],))
+        conn.execute("UPDATE series SET version = version + 1 WHERE id = ?", (sid,))
+    return True
+
+def history(key, database=DEFAULT_DATABASE):
+    """
+    Edits currently in effect, oldest first (records shaped like the workbook journal's).
+    """
+    rows = connect(database).execute("SELECT ts, op, payload FROM edits WHERE series_id = ? AND undone = 0 "
+                                     "ORDER BY id", (series_id(key),)).fetchall()
+    return [{"ts": ts, "op": op, **json.loads(payload)["fields"]} for ts, op, payload in rows]
+
+def compact(key, database=DEFAULT_DATABASE):
+    """
+    Edits are already in the table; folding them only drops the undo history.
+    Returns the number of edit records removed.
+    """
+    conn = connect(database)
+    with conn:
+        return conn.execute("DELETE FROM edits WHERE series_id = ?", (series_id(key),)).rowcount
+
+# --------------------- Bulk Import ---------------------
+def import_tree(root="Uploaded", database=DEFAULT_DATABASE):
+    """
+    Copy every workbook under root/{family}/{type}/{grade}/{period}/ (with its pending
+    journal replayed) into the database in one transaction per table.
+    Returns (tables imported, seconds).
+    """
+    from Data_Storage.storage import discover_workbooks
+    from Data_Storage.journal import read_journaled
+    conn = connect(database)
+    start = time.perf_counter()
+    count = 0
+    for job in discover_workbooks(root):
+        try:
+            write_series(job["family"], job["type"], job["grade"], job["period"], os.path.basename(job["file"]),
+                         read_journaled(job["file"]), database, conn)
+        except ValueError as e:
+            raise ValueError(f"{job['file']}: {e}") from e
+        count += 1
+    return count, time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite storage for demand histories")
+    parser.add_argument("--database", default=DEFAULT_DATABASE)
+    parser.add_argument("--import", dest="root", help="import every workbook under this Uploaded/ tree")
+    parser.add_argument("--summary", action="store_true", help="print the per-series demand summary")
+    args = parser.parse_args()
+    if args.root:
+        tables, seconds = import_tree(args.root, args.database)
+        print(f"Imported {tables} table(s) from {args.root} into {args.database} in {seconds:.2f}s")
+    if args.summary:
+        print(demand_summary(args.database).to_string(index=False))
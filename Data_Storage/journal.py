@@ -0,0 +1,287 @@
+import os
+import json
+import threading
+from datetime import datetime
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+import numpy as np
+import pandas as pd
+from Data_Storage.sidecar import read_excel_cached, write_sidecar
+
+JOURNAL_DIR = ".journal"
+COMPACT_THRESHOLD = 200
+
+_locks = {}
+_locks_guard = threading.Lock()
+_op_counts = {}
+_compacting = set()
+
+# --------------------- Paths & Locks ---------------------
+def journal_path(file_path):
+    """
+    Append-only edit journal of a workbook, kept in a hidden '.journal' folder next to it.
+    """
+    folder, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(folder, JOURNAL_DIR, name + ".jsonl")
+
+class _WorkbookLock:
+    """
+    Reentrant lock of one workbook and its journal, held across threads and processes
+    (Streamlit, the batch job and the service edit and compact the same workbooks):
+    a thread lock plus an OS lock on '.journal/<name>.lock' taken by the outermost holder.
+    Without a writable '.journal' folder it only locks within the process.
+    """
+    def __init__(self, file_path):
+        self.path = journal_path(file_path)[:-len(".jsonl")] + ".lock"
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, "a+b")
+                _lock_file(self._file)
+            except OSError:
+                self._file = None
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0 and self._file is not None:
+            _unlock_file(self._file)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            # LK_LOCK gives up after ~10 s of contention: keep waiting
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _lock_for(file_path):
+    key = os.path.abspath(file_path)
+    with _locks_guard:
+        if key not in _locks:
+            _locks[key] = _WorkbookLock(key)
+        return _locks[key]
+
+def _base_signature(file_path):
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def data_signature(file_path):
+    """
+    Cheap O(1) fingerprint of a workbook's data: its size/mtime plus the size of its
+    edit journal (which grows with every edit).
+    """
+    stat = os.stat(file_path)
+    journal = journal_path(file_path)
+    return [stat.st_size, stat.st_mtime_ns, os.path.getsize(journal) if os.path.exists(journal) else 0]
+
+def _jsonable(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+# --------------------- Read Journal ---------------------
+def read_ops(file_path):
+    """
+    All journal records that apply to the current workbook, oldest first.
+    A journal written against an older workbook (already compacted) is ignored,
+    and a torn last line from a crash mid-write is skipped.
+    """
+    path = journal_path(file_path)
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    if not records or records[0].get("op") != "base" or records[0]["base"] != _base_signature(file_path):
+        return []
+    return records[1:]
+
+def effective_ops(ops):
+    """
+    Resolve undo records: each 'undo' cancels the latest op that is still in effect.
+    """
+    stack = []
+    for op in ops:
+        if op["op"] == "undo":
+            if stack:
+                stack.pop()
+        else:
+            stack.append(op)
+    return stack
+
+# --------------------- Replay ---------------------
+def _renumber(df, first_col):
+    if first_col and first_col in df.columns:
+        df[first_col] = range(1, len(df) + 1)
+    return df
+
+def apply_ops(df, ops):
+    """
+    Replay row operations on df (same semantics as edit_table).
+    """
+    for op in ops:
+        if op["op"] == "add":
+            df = pd.concat([df, pd.DataFrame({col: [op["row"].get(col)] for col in df.columns})], ignore_index=True)
+        elif op["op"] == "edit":
+            for col, val in op["values"].items():
+                df.loc[op["index"], col] = val
+            df = _renumber(df, op.get("first_col"))
+        elif op["op"] == "delete":
+            df = df.drop(index=op["index"]).reset_index(drop=True)
+            df = _renumber(df, op.get("first_col"))
+    return df
+
+def read_journaled(file_path):
+    """
+    Load a workbook (through the sidecar cache) with its pending journal replayed on top.
+    Anything that is not a path (uploaded buffers) has no journal and is read directly.
+    """
+    if not isinstance(file_path, (str, os.PathLike)):
+        return read_excel_cached(file_path)
+    with _lock_for(file_path):
+        df = read_excel_cached(file_path)
+        ops = effective_ops(read_ops(file_path))
+    return apply_ops(df, ops) if ops else df
+
+# --------------------- Append ---------------------
+def append_op(file_path, op, **fields):
+    """
+    Record one row operation ('add', 'edit', 'delete' or 'undo') at the end of the journal.
+    Cost does not depend on the workbook size. Schedules a background compaction
+    once COMPACT_THRESHOLD records have accumulated.
+    """
+    record = {"ts": datetime.now().isoformat(timespec="milliseconds"), "op": op}
+    record.update({k: _jsonable(v) if not isinstance(v, dict) else {c: _jsonable(x) for c, x in v.items()}
+                   for k, v in fields.items()})
+    path = journal_path(file_path)
+    key = os.path.abspath(file_path)
+    with _lock_for(file_path):
+        base = _base_signature(file_path)
+        # The cached count holds while the journal is as this process left it (another
+        # process may have appended to or compacted it since)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if _op_counts.get(key, (None, 0, None))[::2] != (base, size):
+            _op_counts[key] = (base, len(read_ops(file_path)), size)
+        count = _op_counts[key][1]
+        lines = [record]
+        if count == 0:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            lines.insert(0, {"op": "base", "base": base})
+        with open(path, "w" if count == 0 else "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(line) + "\n" for line in lines))
+            f.flush()
+            os.fsync(f.fileno())
+        count += 1
+        _op_counts[key] = (base, count, os.path.getsize(path))
+    if count >= COMPACT_THRESHOLD:
+        compact_in_background(file_path)
+    return record
+
+def undo_last(file_path):
+    """
+    Undo the latest edit still in effect (recorded as an 'undo' op, so history is kept).
+    Returns False when there is nothing to undo.
+    """
+    with _lock_for(file_path):
+        if not effective_ops(read_ops(file_path)):
+            return False
+        append_op(file_path, "undo")
+    return True
+
+def history(file_path):
+    """
+    Edits currently in effect, oldest first (for display / undo).
+    """
+    return effective_ops(read_ops(file_path))
+
+# --------------------- Compaction ---------------------
+def compact(file_path):
+    """
+    Fold the journal back into the workbook. The replayed table is written to a
+    temporary workbook without holding the lock, so edits keep appending meanwhile;
+    ops still in effect that were recorded during the write are carried over into a
+    fresh journal, then the workbook is replaced atomically. When an undo recorded
+    meanwhile cancelled an op already folded into the temporary workbook, the table is
+    written again (under the lock) without it. Undo history before this point is folded in.
+    Returns the number of journal records compacted.
+    """
+    key = os.path.abspath(file_path)
+    with _lock_for(file_path):
+        ops = read_ops(file_path)
+        if not ops or key in _compacting:
+            return 0
+        _compacting.add(key)
+        base = _base_signature(file_path)
+
+    folder, name = os.path.split(key)
+    tmp = os.path.join(folder, f".{name}.{os.getpid()}.tmp.xlsx")
+    tmp_journal = journal_path(file_path) + ".tmp"
+    try:
+        folded = effective_ops(ops)
+        df = apply_ops(read_excel_cached(file_path), folded)
+        df.to_excel(tmp, index=False)
+        with _lock_for(file_path):
+            if _base_signature(file_path) != base:
+                # Another process compacted the workbook meanwhile
+                return 0
+            current = effective_ops(read_ops(file_path))
+            if current[:len(folded)] != folded:
+                folded = current
+                df = apply_ops(read_excel_cached(file_path), folded)
+                df.to_excel(tmp, index=False)
+            pending = current[len(folded):]
+            with open(tmp_journal, "w", encoding="utf-8") as f:
+                records = [{"op": "base", "base": _base_signature(tmp)}] + pending
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+            os.replace(tmp, file_path)
+            os.replace(tmp_journal, journal_path(file_path))
+            _op_counts.pop(key, None)
+        write_sidecar(file_path, df)
+    finally:
+        _compacting.discard(key)
+        for path in (tmp, tmp_journal):
+            if os.path.exists(path):
+                os.remove(path)
+    return len(ops)
+
+def compact_in_background(file_path):
+    """
+    Run compact() on a daemon thread (at most one per workbook at a time).
+    """
+    if os.path.abspath(file_path) in _compacting:
+        return None
+    thread = threading.Thread(target=compact, args=(file_path,), daemon=True)
+    thread.start()
+    return thread
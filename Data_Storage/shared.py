@@ -0,0 +1,186 @@
+"""
+Process-wide, reference-counted cache of read-only demand tables shared by every session.
+
+Sessions that open the same table (same key and data signature) get the same DataFrame
+object, whose columns are read-only arrays, instead of each parsing and holding a copy.
+A session keeps a DatasetLease in its state; the table is released when the lease is
+released or garbage-collected (the session ends or opens another table) and dropped once
+no session holds it. Edits work on a private copy (copy-on-write):
+
+    lease = shared_datasets.acquire(key, lambda: read_series(key), signature(key))
+    df = lease.frame        # shared, read-only: in-place assignment raises
+    edited = df.copy()      # private and writable
+
+With FIMS_SHARED_MMAP=1 the numeric columns are written once as .npy files under
+FIMS_SHARED_DIR (default <tmp>/fims-shared) and memory-mapped, so several server
+processes opening the same table share its pages through the OS page cache.
+"""
+import os
+import shutil
+import hashlib
+import tempfile
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+from Forecasting_Cache.result_cache import estimate_size
+
+MMAP = os.environ.get("FIMS_SHARED_MMAP", "0").lower() in ("1", "true", "yes")
+SHARED_DIR = os.environ.get("FIMS_SHARED_DIR", os.path.join(tempfile.gettempdir(), "fims-shared"))
+
+# --------------------- Read-only Frames ---------------------
+def _read_only(values):
+    values = np.array(values)
+    values.flags.writeable = False
+    return values
+
+def _mapped(values, path):
+    """
+    values as a read-only memory map of path, writing the .npy file first if no process has.
+    """
+    if not os.path.exists(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                np.save(f, values)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    return np.load(path, mmap_mode="r")
+
+def freeze(df, folder=None):
+    """
+    A copy of df backed by read-only column arrays; numeric columns are memory-mapped
+    from folder when one is given (other columns stay in memory).
+    """
+    if folder is not None:
+        os.makedirs(folder, exist_ok=True)
+    columns = {}
+    for i, col in enumerate(df.columns):
+        values = df.iloc[:, i].to_numpy()
+        if folder is not None and values.dtype.kind in "biufc":
+            columns[col] = _mapped(values, os.path.join(folder, f"c{i}.npy"))
+        else:
+            columns[col] = _read_only(values)
+    return pd.DataFrame(columns, columns=df.columns, copy=False)
+
+# --------------------- Leases ---------------------
+class DatasetLease:
+    """
+    One session's hold on a shared table. release() (or garbage collection) drops it.
+    """
+    def __init__(self, registry, key, frame):
+        self.key = key
+        self.frame = frame
+        self._release = weakref.finalize(self, registry._release, key, id(frame))
+
+    def release(self):
+        self._release()
+
+    @property
+    def released(self):
+        return not self._release.alive
+
+# --------------------- Shared Dataset Cache ---------------------
+class SharedDatasets:
+    """
+    Thread-safe {key: read-only table} registry counting the leases held on each table.
+    A table is reloaded when its signature changes; sessions still holding the old one
+    keep it until they release it. Memory-mapped files of a superseded version are removed
+    once its last lease goes (mapped pages stay valid for anyone still holding them).
+    """
+    def __init__(self, mmap=MMAP, folder=SHARED_DIR):
+        self.mmap = mmap
+        self.folder = folder
+        self._entries = {}
+        # Superseded versions still leased, by id(frame), and the last folder written per key
+        self._retired = {}
+        self._folders = {}
+        # Reentrant: a lease finalizer may run during garbage collection inside acquire()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _folder(self, key, signature):
+        if not self.mmap:
+            return None
+        name = hashlib.sha1(repr((key, signature)).encode("utf-8")).hexdigest()
+        return os.path.join(self.folder, name)
+
+    def acquire(self, key, load, signature):
+        """
+        Lease on the shared table of key at signature, loading it with load() on a miss.
+        Returns None when load() returns None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["signature"] == signature:
+                entry["refs"] += 1
+                self.hits += 1
+                return DatasetLease(self, key, entry["frame"])
+        df = load()
+        if df is None:
+            return None
+        folder = self._folder(key, signature)
+        frame = freeze(df, folder)
+        with self._lock:
+            entry = self._entries.get(key)
+            # Another session may have loaded the same version meanwhile
+            if entry is None or entry["signature"] != signature:
+                if entry is not None:
+                    self._retire(entry)
+                previous = self._folders.get(key)
+                if previous and previous != folder and not self._in_use(previous):
+                    shutil.rmtree(previous, ignore_errors=True)
+                if folder:
+                    self._folders[key] = folder
+                entry = {"signature": signature, "frame": frame, "folder": folder, "refs": 0,
+                         "bytes": estimate_size(frame)}
+                self._entries[key] = entry
+                self.misses += 1
+            entry["refs"] += 1
+            return DatasetLease(self, key, entry["frame"])
+
+    def _in_use(self, folder):
+        return any(e["folder"] == folder for e in list(self._entries.values()) + list(self._retired.values()))
+
+    def _retire(self, entry):
+        """
+        Keep a superseded version until its last lease goes; remove its files then.
+        """
+        if entry["refs"] > 0:
+            self._retired[id(entry["frame"])] = entry
+        elif entry["folder"]:
+            shutil.rmtree(entry["folder"], ignore_errors=True)
+
+    def _release(self, key, frame_id):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and id(entry["frame"]) == frame_id:
+                entry["refs"] -= 1
+                if entry["refs"] <= 0:
+                    # The current version's files stay for the next session or process
+                    del self._entries[key]
+                return
+            entry = self._retired.get(frame_id)
+            if entry is None:
+                return
+            entry["refs"] -= 1
+            if entry["refs"] <= 0:
+                del self._retired[frame_id]
+                if entry["folder"] and not self._in_use(entry["folder"]):
+                    shutil.rmtree(entry["folder"], ignore_errors=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "tables": len(self._entries),
+                "leases": sum(e["refs"] for e in self._entries.values()),
+                "bytes": sum(e["bytes"] for e in self._entries.values()),
+                "mmap": self.mmap,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+shared_datasets = SharedDatasets()
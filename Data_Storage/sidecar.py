@@ -0,0 +1,166 @@
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+
+SIDECAR_DIR = ".sidecar"
+SIDECAR_VERSION = 2
+# Column labels stored as JSON values, so they come back with their type (2023 stays an int)
+LABEL_TYPES = (str, int, float, bool, type(None))
+
+# --------------------- Sidecar Paths ---------------------
+def sidecar_paths(file_path):
+    """
+    Return (data_path, meta_path) of the columnar sidecar for a workbook.
+    Sidecars live in a hidden '.sidecar' folder next to the workbook.
+    """
+    folder, name = os.path.split(os.path.abspath(file_path))
+    base = os.path.join(folder, SIDECAR_DIR, name)
+    return base + ".npz", base + ".json"
+
+def file_digest(file_path, chunk_size=1 << 20):
+    """
+    SHA-1 of the file content (used when the mtime changed but the bytes may not have).
+    """
+    h = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def _atomic_write(path, write_fn):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        write_fn(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+# --------------------- Encode / Decode ---------------------
+def _encode_frame(df):
+    """
+    Split a DataFrame into plain NumPy column arrays.
+    Numeric/bool/datetime columns are stored as-is, text columns as unicode + null mask.
+    Returns None when df cannot be stored exactly: labels JSON cannot carry with their
+    type, or object columns holding anything but strings (e.g. [1, "a"]).
+    """
+    if not all(isinstance(col, LABEL_TYPES) for col in df.columns.tolist()):
+        return None
+    arrays, kinds = {}, []
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        values = column.to_numpy()
+        if values.dtype.kind in "biufcmM":
+            arrays[f"c{i}"] = values
+            kinds.append("raw")
+        else:
+            mask = column.isna().to_numpy()
+            if not all(isinstance(value, str) for value in values[~mask]):
+                return None
+            arrays[f"c{i}"] = np.asarray(column.where(~mask, ""), dtype=str)
+            arrays[f"m{i}"] = mask
+            kinds.append("text")
+    return arrays, kinds
+
+def _decode_frame(npz, columns, kinds):
+    data = {}
+    for i, kind in enumerate(kinds):
+        values = npz[f"c{i}"]
+        if kind == "text":
+            values = values.astype(object)
+            values[npz[f"m{i}"]] = np.nan
+        data[i] = values
+    return pd.DataFrame(data).set_axis(pd.Index(columns), axis=1)
+
+# --------------------- Sidecar Read / Write ---------------------
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == SIDECAR_VERSION else None
+
+def _write_meta(meta_path, meta):
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    _atomic_write(meta_path, write)
+
+def write_sidecar(file_path, df, stat=None, digest=None):
+    """
+    Store df as the columnar sidecar of file_path. Tables the sidecar cannot reproduce
+    exactly get none (and lose a stale one), so they are always read from the workbook.
+    Errors (read-only folder, disk full, ...) are swallowed: the sidecar is only a cache.
+    """
+    data_path, meta_path = sidecar_paths(file_path)
+    try:
+        encoded = _encode_frame(df)
+        if encoded is None:
+            invalidate_sidecar(file_path)
+            return
+        arrays, kinds = encoded
+        stat = stat or os.stat(file_path)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+        def write(tmp):
+            with open(tmp, "wb") as f:
+                np.savez(f, **arrays)
+        _atomic_write(data_path, write)
+        _write_meta(meta_path, {
+            "version": SIDECAR_VERSION,
+            "columns": df.columns.tolist(),
+            "kinds": kinds,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha1": digest or file_digest(file_path),
+        })
+    except OSError:
+        pass
+
+def invalidate_sidecar(file_path):
+    """
+    Remove the sidecar of file_path (next read rebuilds it from the workbook).
+    """
+    for path in sidecar_paths(file_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+# --------------------- Cached Excel Loader ---------------------
+def read_excel_cached(file_path):
+    """
+    Drop-in replacement for pd.read_excel(file_path).
+    First read parses the workbook and writes a NumPy sidecar; later reads load the sidecar.
+    The sidecar is reused while the workbook mtime/size match, or while the content hash
+    matches after a touch/copy. Anything that is not a path (uploaded buffers) is read directly.
+    """
+    if not isinstance(file_path, (str, os.PathLike)):
+        return pd.read_excel(file_path)
+
+    stat = os.stat(file_path)
+    data_path, meta_path = sidecar_paths(file_path)
+    meta = _read_meta(meta_path)
+    digest = None
+    if meta is not None:
+        fresh = meta["mtime_ns"] == stat.st_mtime_ns and meta["size"] == stat.st_size
+        if not fresh and meta["size"] == stat.st_size:
+            digest = file_digest(file_path)
+            if digest == meta["sha1"]:
+                meta.update(mtime_ns=stat.st_mtime_ns)
+                try:
+                    _write_meta(meta_path, meta)
+                except OSError:
+                    pass
+                fresh = True
+        if fresh:
+            try:
+                with np.load(data_path, allow_pickle=False) as npz:
+                    return _decode_frame(npz, meta["columns"], meta["kinds"])
+            except (OSError, KeyError, ValueError):
+                pass
+
+    df = pd.read_excel(file_path)
+    write_sidecar(file_path, df, stat=stat, digest=digest)
+    return df
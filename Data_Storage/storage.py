@@ -0,0 +1,113 @@
+"""
+Storage backend switch: the xlsx tree under Uploaded/ (default) or the SQLite database.
+
+    FIMS_STORAGE=sqlite FIMS_DATABASE=Database/demand.sqlite streamlit run app.py
+
+Every function takes the series key the other backend functions return: a workbook path
+for xlsx, a "sqlite:..." key for the database. Keys are dispatched by their form, so series
+from both backends can be read side by side (e.g. while importing).
+"""
+import os
+from Data_Storage import database
+from Data_Storage import journal
+from Data_Storage.sidecar import read_excel_cached
+
+BACKEND = os.environ.get("FIMS_STORAGE", "xlsx").lower()
+DATABASE = os.environ.get("FIMS_DATABASE", database.DEFAULT_DATABASE)
+PERIODS = ["Weekly", "Monthly", "Quarterly", "Semi-Annual", "Annual"]
+
+def using_database():
+    return BACKEND == "sqlite"
+
+def is_database_key(key):
+    return isinstance(key, str) and key.startswith(database.DB_PREFIX)
+
+# --------------------- Listing ---------------------
+def list_series(family, m_type, grade, period, root="Uploaded"):
+    """
+    [(name, key)] of the tables stored for one material and period.
+    """
+    if using_database():
+        return database.list_series(family, m_type, grade, period, DATABASE)
+    folder = os.path.join(root, str(family), str(m_type), str(grade), period)
+    if not os.path.isdir(folder):
+        return []
+    return [(name, os.path.join(folder, name)) for name in sorted(os.listdir(folder))
+            if name.endswith(".xlsx") and not name.startswith("~$")]
+
+def finer_sources(family, m_type, grade, period, root="Uploaded"):
+    """
+    [(source period, name, key)] for every period finer than period that has a table, finest first.
+    """
+    return [(source, name, key) for source in PERIODS[:PERIODS.index(period)]
+            for name, key in list_series(family, m_type, grade, source, root)]
+
+def discover_workbooks(root="Uploaded"):
+    """
+    Yield one job dict per workbook found at Uploaded/{family}/{type}/{grade}/{period}/*.xlsx.
+    Files at any other depth are ignored.
+    """
+    root = os.path.normpath(root)
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        parts = os.path.relpath(folder, root).split(os.sep)
+        if len(parts) != 4:
+            continue
+        family, m_type, grade, period = parts
+        for name in sorted(files):
+            if name.endswith(".xlsx") and not name.startswith("~$"):
+                yield {
+                    "family": family,
+                    "type": m_type,
+                    "grade": grade,
+                    "period": period,
+                    "file": os.path.join(folder, name),
+                }
+
+def discover_series(root="Uploaded"):
+    """
+    One job dict per stored table (family, type, grade, period and its key as "file").
+    """
+    return database.discover_series(DATABASE) if using_database() else discover_workbooks(root)
+
+# --------------------- Read / Write ---------------------
+def save_upload(family, m_type, grade, period, uploaded, root="Uploaded"):
+    """
+    Store an uploaded workbook and return its key.
+    """
+    if using_database():
+        return database.write_series(family, m_type, grade, period, uploaded.name,
+                                     read_excel_cached(uploaded), DATABASE)
+    folder = os.path.join(root, str(family), str(m_type), str(grade), period)
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, uploaded.name)
+    with open(path, "wb") as f:
+        f.write(uploaded.getbuffer())
+    return path
+
+def read_series(key):
+    """
+    The table behind a key, with pending edits applied.
+    """
+    return database.read_series(key, DATABASE) if is_database_key(key) else journal.read_journaled(key)
+
+def signature(key):
+    """
+    Cheap fingerprint that changes whenever the table behind key changes.
+    """
+    return database.signature(key, DATABASE) if is_database_key(key) else journal.data_signature(key)
+
+# --------------------- Edits ---------------------
+def append_op(key, op, **fields):
+    if is_database_key(key):
+        return database.append_op(key, op, DATABASE, **fields)
+    return journal.append_op(key, op, **fields)
+
+def undo_last(key):
+    return database.undo_last(key, DATABASE) if is_database_key(key) else journal.undo_last(key)
+
+def history(key):
+    return database.history(key, DATABASE) if is_database_key(key) else journal.history(key)
+
+def compact(key):
+    return database.compact(key, DATABASE) if is_database_key(key) else journal.compact(key)
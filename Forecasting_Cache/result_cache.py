@@ -0,0 +1,119 @@
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# --------------------- Keys ---------------------
+def frame_digest(df):
+    """
+    Content hash of a DataFrame (values + column names, index ignored).
+    """
+    h = hashlib.sha1()
+    h.update(repr(list(df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def make_key(digest, method, params=None, metric=None):
+    """
+    Cache key: (data content hash, method, parameters, metric).
+    metric is None for the forecast itself and "MAD"/"MSE"/... for error values.
+    """
+    return (digest, method, tuple(sorted((params or {}).items())), metric)
+
+def estimate_size(value):
+    """
+    Approximate memory held by a cached value, in bytes.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray) or hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+# --------------------- LRU Cache ---------------------
+class ForecastCache:
+    """
+    Process-wide, thread-safe LRU cache for forecast results with a memory budget.
+    Entries can be tagged with a source (the workbook path) so edits drop them at once.
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, source=None):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size, source)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, old_size, _) = self._entries.popitem(last=False)
+                self.current_bytes -= old_size
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute, source=None):
+        """
+        Return the cached value for key, computing and storing it on a miss.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute(), source)
+        return value
+
+    def invalidate(self, source=None):
+        """
+        Drop every entry tagged with source (all entries when source is None).
+        """
+        with self._lock:
+            if source is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self.current_bytes = 0
+                return removed
+            keys = [k for k, (_, _, s) in self._entries.items() if s == source]
+            for k in keys:
+                self.current_bytes -= self._entries.pop(k)[1]
+            return len(keys)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+forecast_cache = ForecastCache()
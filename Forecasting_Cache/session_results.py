@@ -0,0 +1,107 @@
+"""
+Compact per-session storage of a forecasting run.
+
+A run used to keep one full copy of the input table per method in st.session_state.
+ForecastResults keeps the period numbers and the demand once and each method's forecast
+as a float32 array; the forecast tables and charts are rebuilt from them on demand.
+Every session's results are held to a memory budget (FIMS_SESSION_MAX_MB, default 16 MB):
+methods are kept in ranking order and the ones that no longer fit are dropped (their
+full results usually remain in the shared forecast cache).
+"""
+import os
+import numpy as np
+import pandas as pd
+from Forecasting_Cache.result_cache import estimate_size, frame_digest
+
+SESSION_MAX_BYTES = int(float(os.environ.get("FIMS_SESSION_MAX_MB", 16)) * 1024 ** 2)
+FORECAST_DTYPE = np.float32
+
+# --------------------- Results ---------------------
+def _read_only(values, dtype):
+    values = np.array(values, dtype=dtype)
+    values.flags.writeable = False
+    return values
+
+class ForecastResults:
+    """
+    Forecasts of several methods over one demand history. Behaves like a read-only
+    {method: forecast array} mapping in ranking order. digest identifies the table the
+    forecasts were made from (frame_digest), so callers can tell when they no longer apply.
+    """
+    def __init__(self, first_col, periods, demand, max_bytes=SESSION_MAX_BYTES, digest=None):
+        self.first_col = first_col
+        self.digest = digest
+        self.periods = _read_only(periods, None)
+        self.demand = _read_only(demand, float)
+        self.max_bytes = max_bytes
+        self.dropped = []
+        self._forecasts = {}
+
+    @classmethod
+    def from_frames(cls, df, first_col, frames, forecast_cols, order=None, max_bytes=SESSION_MAX_BYTES, digest=None):
+        """
+        Build from {method: forecast DataFrame} (the method runners' output) of the table df,
+        adding the methods in order (default: as given) while they fit in max_bytes.
+        """
+        results = cls(first_col, df[first_col].to_numpy(), df["Demand"].to_numpy(dtype=float), max_bytes,
+                      digest or frame_digest(df))
+        for method in order or frames:
+            results.add(method, frames[method][forecast_cols[method]].to_numpy())
+        return results
+
+    def add(self, method, forecast):
+        """
+        Store one method's forecast as float32. The first method is always kept; a later one
+        that would take the results over the budget is recorded in dropped instead.
+        Returns True when stored.
+        """
+        forecast = _read_only(forecast, FORECAST_DTYPE)
+        if forecast.shape != self.demand.shape:
+            raise ValueError(f"{method} forecast has {forecast.size} periods, the demand has {self.demand.size}")
+        if self._forecasts and self.nbytes + forecast.nbytes > self.max_bytes:
+            self.dropped.append(method)
+            return False
+        self._forecasts[method] = forecast
+        return True
+
+    # Mapping interface
+    def __contains__(self, method):
+        return method in self._forecasts
+
+    def __iter__(self):
+        return iter(self._forecasts)
+
+    def __len__(self):
+        return len(self._forecasts)
+
+    def __getitem__(self, method):
+        return self._forecasts[method]
+
+    def matches(self, df):
+        """
+        True when the forecasts were made from a table with the same content as df.
+        """
+        return df is not None and len(df) == len(self.demand) and frame_digest(df) == self.digest
+
+    def forecast(self, method):
+        return self._forecasts[method]
+
+    def table(self, method):
+        """
+        [period, Demand, Forecast] DataFrame of one method, built from the stored arrays.
+        """
+        return pd.DataFrame({self.first_col: self.periods, "Demand": self.demand,
+                             "Forecast": self._forecasts[method]})
+
+    @property
+    def nbytes(self):
+        return self.periods.nbytes + self.demand.nbytes + sum(f.nbytes for f in self._forecasts.values())
+
+# --------------------- Accounting ---------------------
+def session_memory(state):
+    """
+    Approximate bytes held by each session-state entry, largest first: [{"Key", "MB"}].
+    """
+    sizes = [(key, estimate_size(value)) for key, value in state.items()]
+    return [{"Key": key, "MB": round(size / 1024 ** 2, 3)}
+            for key, size in sorted(sizes, key=lambda item: item[1], reverse=True)]
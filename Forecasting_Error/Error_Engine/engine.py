@@ -0,0 +1,72 @@
+"""
+Fused error engine: every error metric for every forecast column in one vectorized pass.
+
+The demand vector is broadcast against a (periods x methods) forecast matrix, so
+scoring k methods costs one error matrix instead of k DataFrame copies per metric.
+"""
+import numpy as np
+import pandas as pd
+from Performance_Monitor.timing import timed
+
+METRICS = ["MAD", "MSE", "RMSE", "MAPE", "Bias", "Tracking Signal"]
+# Signed metrics: best is closest to zero, so rank them by absolute value
+SIGNED_METRICS = ["Bias", "Tracking Signal"]
+
+# --------------------- Engine ---------------------
+@timed("error: engine")
+def error_metrics(demand, forecasts):
+    """
+    demand: (n,) actuals. forecasts: (n,) or (n, k) forecasts, one column per method.
+    Returns {metric: (k,) array} for METRICS (plain floats when forecasts is 1-D).
+    MAPE (in %) skips periods with zero demand; Tracking Signal = sum(error) / MAD.
+    """
+    demand = np.asarray(demand, dtype=float)
+    forecasts = np.asarray(forecasts, dtype=float)
+    single = forecasts.ndim == 1
+    if single:
+        forecasts = forecasts[:, None]
+    n = demand.shape[0]
+    # (methods x periods) so every per-method reduction runs over contiguous memory
+    err = np.subtract(demand, forecasts.T, order="C")
+    sum_err = err.sum(axis=1)
+    mse = np.einsum("ij,ij->i", err, err) / n
+    np.abs(err, out=err)
+    mad = err.sum(axis=1) / n
+    nonzero = demand != 0
+    inverse_demand = np.divide(1.0, np.abs(demand), out=np.zeros(n), where=nonzero)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mape = err @ inverse_demand * 100 / nonzero.sum()
+        tracking = np.where(mad > 0, sum_err / mad, 0.0)
+    result = {
+        "MAD": mad,
+        "MSE": mse,
+        "RMSE": np.sqrt(mse),
+        "MAPE": mape,
+        "Bias": sum_err / n,
+        "Tracking Signal": tracking,
+    }
+    if single:
+        return {metric: float(values[0]) for metric, values in result.items()}
+    return result
+
+def error_table(demand, forecasts, names):
+    """
+    error_metrics() as a DataFrame with one row per method ("Method" column first).
+    """
+    table = pd.DataFrame(error_metrics(demand, np.asarray(forecasts, dtype=float).reshape(len(demand), -1)))
+    table.insert(0, "Method", list(names))
+    return table
+
+def score_frame(df, forecast_cols, actual_col="Demand"):
+    """
+    Score forecast columns of a DataFrame without copying it.
+    forecast_cols: list of column names, or {method name: column name}.
+    """
+    if not isinstance(forecast_cols, dict):
+        forecast_cols = {col: col for col in forecast_cols}
+    missing = [col for col in forecast_cols.values() if col not in df.columns]
+    if missing:
+        raise KeyError(f"Forecast column(s) not found: {missing}")
+    return error_table(df[actual_col].to_numpy(dtype=float),
+                       df[list(forecast_cols.values())].to_numpy(dtype=float),
+                       forecast_cols.keys())
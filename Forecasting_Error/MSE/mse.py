@@ -1,13 +1,17 @@
 import pandas as pd
-import streamlit as st
+from Data_Storage.storage import read_series
+from Performance_Monitor.timing import timed
+from Forecasting_Error.Streaming_Error.streaming import streaming_metrics, DEFAULT_CHUNKSIZE
 
 # ====================== MSE Calculation ======================
+@timed()
 def calculate_mse(df, actual_col="Demand", forecast_col="Forecast"):
     """
     Calculate Mean Squared Error (MSE) between actual and forecast
     MSE = mean((Actual - Forecast)^2)
     """
     if forecast_col not in df.columns:
+        import streamlit as st
         st.error(f"Forecast column '{forecast_col}' not found in DataFrame!")
         return None
 
@@ -17,17 +21,24 @@ def calculate_mse(df, actual_col="Demand", forecast_col="Forecast"):
     return mse_value, df
 
 # ====================== Example Usage in Streamlit ======================
-def run_mse_analysis(file_path_or_df, forecast_col="Forecast", actual_col="Demand"):
+def run_mse_analysis(file_path_or_df, forecast_col="Forecast", actual_col="Demand", streaming=False,
+                     chunksize=DEFAULT_CHUNKSIZE):
     """
     Load data, calculate MSE, and display results
+    streaming=True: read a CSV/Parquet file in chunks and only show the MSE (bounded memory)
     """
-    # Load data
+    import streamlit as st
+
+    if streaming:
+        mse_value = streaming_metrics(file_path_or_df, actual_col, forecast_col, chunksize=chunksize)["MSE"]
+        st.subheader(f"📌 MSE (Mean Squared Error) for '{forecast_col}': {round(mse_value,2)}")
+        return mse_value, None
+
+    # Load data (calculate_mse makes the only copy)
     if isinstance(file_path_or_df, pd.DataFrame):
-        df = file_path_or_df.copy()
+        df = file_path_or_df.reset_index(drop=True)
     else:
-        df = pd.read_excel(file_path_or_df)
-
-    df.reset_index(drop=True, inplace=True)
+        df = read_series(file_path_or_df).reset_index(drop=True)
 
     # Calculate MSE
     mse_value, df_with_error = calculate_mse(df, actual_col=actual_col, forecast_col=forecast_col)
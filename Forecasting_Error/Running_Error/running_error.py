@@ -0,0 +1,79 @@
+import numpy as np
+
+# ====================== Running Error Accumulator ======================
+class RunningError:
+    """
+    Single-pass accumulator of forecast errors.
+    Each update is O(1); MAD / MSE / bias are read from the running sums at any time.
+    """
+    def __init__(self, count=0, sum_abs=0.0, sum_sq=0.0, sum_err=0.0, sum_ape=0.0, nonzero=0):
+        self.count = count
+        self.sum_abs = sum_abs
+        self.sum_sq = sum_sq
+        self.sum_err = sum_err
+        # Absolute percentage errors over the periods with non-zero demand (MAPE)
+        self.sum_ape = sum_ape
+        self.nonzero = nonzero
+
+    def update(self, actual, forecast):
+        actual = float(actual)
+        err = actual - float(forecast)
+        self.count += 1
+        self.sum_abs += abs(err)
+        self.sum_sq += err * err
+        self.sum_err += err
+        if actual != 0:
+            self.sum_ape += abs(err) / abs(actual)
+            self.nonzero += 1
+        return err
+
+    def update_many(self, actual, forecast):
+        """
+        Add a whole block of (actual, forecast) pairs in one vectorized step.
+        """
+        actual = np.asarray(actual, dtype=float)
+        err = actual - np.asarray(forecast, dtype=float)
+        nonzero = actual != 0
+        self.count += int(err.size)
+        self.sum_abs += float(np.abs(err).sum())
+        self.sum_sq += float((err * err).sum())
+        self.sum_err += float(err.sum())
+        self.sum_ape += float((np.abs(err[nonzero]) / np.abs(actual[nonzero])).sum())
+        self.nonzero += int(nonzero.sum())
+
+    @property
+    def mad(self):
+        return self.sum_abs / self.count if self.count else float("nan")
+
+    @property
+    def mse(self):
+        return self.sum_sq / self.count if self.count else float("nan")
+
+    @property
+    def bias(self):
+        return self.sum_err / self.count if self.count else float("nan")
+
+    def metrics(self):
+        """
+        The error engine's METRICS from the running sums, with the engine's conventions:
+        MAPE (in %) skips periods with zero demand; Tracking Signal = sum(error) / MAD.
+        """
+        mad = self.mad
+        mse = self.mse
+        return {
+            "MAD": mad,
+            "MSE": mse,
+            "RMSE": float(np.sqrt(mse)),
+            "MAPE": self.sum_ape * 100 / self.nonzero if self.nonzero else float("nan"),
+            "Bias": self.bias,
+            "Tracking Signal": self.sum_err / mad if mad > 0 else 0.0,
+        }
+
+    def to_dict(self):
+        return {"count": self.count, "sum_abs": self.sum_abs, "sum_sq": self.sum_sq, "sum_err": self.sum_err,
+                "sum_ape": self.sum_ape, "nonzero": self.nonzero}
+
+    @classmethod
+    def from_dict(cls, data):
+        # Every field is required: a state saved without the MAPE sums must be rebuilt
+        return cls(data["count"], data["sum_abs"], data["sum_sq"], data["sum_err"], data["sum_ape"], data["nonzero"])
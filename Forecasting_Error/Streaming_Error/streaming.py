@@ -0,0 +1,132 @@
+"""
+Streaming forecast-error pipeline for very long demand histories.
+
+CSV/Parquet files are read in fixed-size chunks and pushed through
+reader -> forecaster -> error accumulator generators, so memory depends on the
+chunk size, never on the length of the history.
+
+Run from the repository root:
+    python -m Forecasting_Error.Streaming_Error.streaming history.csv --method "Exponential Smoothing" --alpha 0.3
+"""
+import os
+import argparse
+import numpy as np
+import pandas as pd
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import exponential_smoothing_levels
+from Forecasting_Error.Running_Error.running_error import RunningError
+
+DEFAULT_CHUNKSIZE = 1_000_000
+METHODS = ["Naive", "Moving Average", "Exponential Smoothing"]
+
+# --------------------- Chunked Reader ---------------------
+def read_chunks(path, columns, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Yield DataFrames of at most chunksize rows holding only the requested columns.
+    CSV uses pandas' chunked reader; Parquet needs pyarrow and streams record batches.
+    """
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Streaming Parquet files requires 'pyarrow' (pip install pyarrow)") from e
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=list(columns)):
+            yield batch.to_pandas()
+    elif ext in (".csv", ".txt"):
+        yield from pd.read_csv(path, usecols=list(columns), chunksize=chunksize)
+    else:
+        raise ValueError(f"Streaming supports CSV and Parquet files, got '{ext}'")
+
+# --------------------- Chunked Forecaster ---------------------
+class ChunkForecaster:
+    """
+    Forecast a series chunk by chunk with the same results as forecasting it in one piece
+    (first period's forecast = first actual). Carried state between chunks:
+    Naive -> last actual, Moving Average -> last n actuals, Exponential Smoothing -> level.
+    """
+    def __init__(self, method="Exponential Smoothing", ma_n=3, alpha=0.3):
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}', choose from {METHODS}")
+        self.method = method
+        self.ma_n = int(ma_n)
+        self.alpha = float(alpha)
+        self.tail = np.empty(0)
+        self.level = None
+
+    def forecast(self, demand):
+        demand = np.asarray(demand, dtype=float)
+        if demand.size == 0:
+            return demand.copy()
+        first_chunk = self.tail.size == 0
+        if self.method == "Naive":
+            prev = demand[:1] if first_chunk else self.tail[-1:]
+            forecast = np.concatenate([prev, demand[:-1]])
+        elif self.method == "Moving Average":
+            ext = np.concatenate([self.tail, demand])
+            cum = np.concatenate([[0.0], np.cumsum(ext)])
+            idx = np.arange(self.tail.size, ext.size)
+            start = np.maximum(idx - self.ma_n, 0)
+            count = idx - start
+            forecast = (cum[idx] - cum[start]) / np.maximum(count, 1)
+            forecast[count == 0] = demand[0]
+        else:
+            levels = exponential_smoothing_levels(demand, self.alpha, initial_level=self.level)
+            prev = demand[:1] if self.level is None else np.array([self.level])
+            forecast = np.concatenate([prev, levels[:-1]])
+            self.level = float(levels[-1])
+        self.tail = np.concatenate([self.tail, demand])[-max(self.ma_n, 1):]
+        return forecast
+
+# --------------------- Generator Pipeline ---------------------
+def forecast_stream(frames, method="Exponential Smoothing", demand_col="Demand", forecast_col="Forecast", **params):
+    """
+    Add a forecast column to every chunk flowing through.
+    """
+    forecaster = ChunkForecaster(method, **params)
+    for frame in frames:
+        frame[forecast_col] = forecaster.forecast(frame[demand_col].to_numpy(dtype=float))
+        yield frame
+
+def accumulate_errors(frames, accumulator, actual_col="Demand", forecast_col="Forecast"):
+    """
+    Feed every chunk into a RunningError and pass it through unchanged (so the
+    forecast stream can still be written out downstream).
+    """
+    for frame in frames:
+        accumulator.update_many(frame[actual_col].to_numpy(dtype=float), frame[forecast_col].to_numpy(dtype=float))
+        yield frame
+
+def streaming_metrics(path, actual_col="Demand", forecast_col="Forecast", method=None,
+                      chunksize=DEFAULT_CHUNKSIZE, forecast_out=None, **params):
+    """
+    MAD / MSE / bias of a long history in one bounded-memory pass.
+    method=None scores a forecast column already in the file; otherwise the forecast is
+    produced on the fly with that method (params: ma_n, alpha). forecast_out optionally
+    receives the forecast stream as CSV.
+    """
+    if method is None:
+        frames = read_chunks(path, [actual_col, forecast_col], chunksize)
+    else:
+        frames = forecast_stream(read_chunks(path, [actual_col], chunksize), method, actual_col, forecast_col, **params)
+    accumulator = RunningError()
+    header = True
+    for frame in accumulate_errors(frames, accumulator, actual_col, forecast_col):
+        if forecast_out:
+            frame.to_csv(forecast_out, mode="w" if header else "a", header=header, index=False)
+            header = False
+    return {"Count": accumulator.count, "MAD": accumulator.mad, "MSE": accumulator.mse, "Bias": accumulator.bias}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bounded-memory MAD/MSE over a CSV/Parquet demand history")
+    parser.add_argument("path")
+    parser.add_argument("--actual-col", default="Demand")
+    parser.add_argument("--forecast-col", default="Forecast")
+    parser.add_argument("--method", choices=METHODS, help="forecast on the fly (default: score --forecast-col)")
+    parser.add_argument("--ma-n", type=int, default=3)
+    parser.add_argument("--alpha", type=float, default=0.3)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--forecast-out", help="write the forecast stream to this CSV")
+    args = parser.parse_args()
+    params = {"ma_n": args.ma_n, "alpha": args.alpha} if args.method else {}
+    print(streaming_metrics(args.path, args.actual_col, args.forecast_col, args.method,
+                            args.chunksize, args.forecast_out, **params))
@@ -0,0 +1,277 @@
+"""
+Rolling-origin backtesting: out-of-sample errors for every method and parameter setting.
+
+From each forecast origin the methods see only the history up to that period and forecast
+the next `horizon` periods. Naive, Moving Average and Exponential Smoothing forecasts are
+flat, so the forecast from origin t for every horizon is the one-step forecast of period t+1;
+computing all origins is therefore one grid of one-step forecasts (the same kernels as
+Parameter_Tuning) compared with a sliding window of the actuals, with no refitting per origin.
+Holt and Holt-Winters forecasts are not flat: their batched recursions return the whole
+forecast path from every origin in the same single pass over the periods.
+
+Catalog-wide runs read and evaluate chunks of series on a process pool.
+
+Run from the repository root:
+    python -m Forecasting_Methods.Backtesting.backtest --horizon 4 --criteria MAD --output backtest.csv --workers 4
+"""
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from Forecasting_Methods.HoltWinters_Method.holtwinters import SEASONAL, SEASON_LENGTHS
+from Forecasting_Methods.Parameter_Tuning.tuning import (
+    MAX_GRID_ELEMENTS, default_windows, parameter_grid,
+    moving_average_grid, exponential_smoothing_grid, holt_grid, holt_winters_grid)
+
+DEFAULT_HORIZON = 4
+DEFAULT_ALPHAS = np.round(np.arange(0.05, 1.0001, 0.05), 2)
+# Coarser than the Parameter_Tuning grids: the recursive methods cost one pass per setting
+TREND_ALPHAS = np.array([0.1, 0.3, 0.5, 0.7, 0.9])
+TREND_BETAS = np.array([0.01, 0.1, 0.3])
+SEASONAL_GAMMAS = np.array([0.05, 0.2, 0.5])
+FLAT_METHODS = ["Naive", "Moving Average", "Exponential Smoothing"]
+CRITERIA = ["MAD", "MSE"]
+JOBS_PER_TASK = 64
+
+# --------------------- Configurations ---------------------
+def default_min_train(periods):
+    """
+    First origin: half of the history is used for training.
+    """
+    return max(2, periods // 2)
+
+def default_configs(demand, windows=None, alphas=None, season_length=None):
+    """
+    [(method, params)] of the default grid: Naive, every window and alpha, Holt over its
+    alpha/beta grid and, when the history holds two full seasons, Holt-Winters over its grid
+    (multiplicative only for positive demand).
+    """
+    demand = np.asarray(demand, dtype=float)
+    n = demand.shape[-1]
+    windows = default_windows(default_min_train(n)) if windows is None else windows
+    alphas = DEFAULT_ALPHAS if alphas is None else alphas
+    configs = ([("Naive", {})] + [("Moving Average", {"n": int(w)}) for w in windows]
+               + [("Exponential Smoothing", {"alpha": float(a)}) for a in alphas]
+               + [("Holt", {"alpha": float(a), "beta": float(b)}) for a, b in parameter_grid(TREND_ALPHAS, TREND_BETAS)])
+    if season_length and season_length >= 2 and n >= 2 * season_length:
+        forms = SEASONAL if np.all(demand > 0) else ["additive"]
+        configs += [("Holt-Winters", {"alpha": float(a), "beta": float(b), "gamma": float(g), "seasonal": form})
+                    for form in forms for a, b, g in parameter_grid(TREND_ALPHAS, TREND_BETAS, SEASONAL_GAMMAS)]
+    return configs
+
+def forecast_grid(demand, configs, horizon=1, season_length=None):
+    """
+    Forecasts of every configuration at once, in configs order: (configs, ..., periods, horizon),
+    where [..., t, k] is the forecast of period t+k made from the actuals before t.
+    Flat methods are computed as one-step grids and broadcast along the horizon axis.
+    """
+    demand = np.asarray(demand, dtype=float)
+    grid = np.empty((len(configs),) + demand.shape + (horizon,))
+    flat = [i for i, (method, _) in enumerate(configs) if method in FLAT_METHODS]
+    if flat:
+        windows = sorted({p["n"] for m, p in configs if m == "Moving Average"}) or [1]
+        alphas = sorted({p["alpha"] for m, p in configs if m == "Exponential Smoothing"}) or [1.0]
+        naive = np.concatenate([demand[..., :1], demand[..., :-1]], axis=-1)
+        one_step = np.concatenate([naive[None], moving_average_grid(demand, windows),
+                                   exponential_smoothing_grid(demand, alphas)])
+        row = {("Naive", None): 0, **{("Moving Average", w): 1 + i for i, w in enumerate(windows)},
+               **{("Exponential Smoothing", a): 1 + len(windows) + i for i, a in enumerate(alphas)}}
+        index = [row[(m, p.get("n", p.get("alpha")))] for m, p in (configs[i] for i in flat)]
+        grid[flat] = one_step[index][..., None]
+    trend = [i for i, (method, _) in enumerate(configs) if method not in FLAT_METHODS]
+    for form in [None] + SEASONAL:
+        members = [i for i in trend if configs[i][1].get("seasonal") == form]
+        if not members:
+            continue
+        params = np.array([[configs[i][1][k] for k in ("alpha", "beta", "gamma") if k in configs[i][1]] for i in members])
+        if form is None:
+            grid[members] = holt_grid(demand, params, horizon)
+        else:
+            grid[members] = holt_winters_grid(demand, params, season_length, form, horizon)
+    return grid
+
+# --------------------- Origin Errors ---------------------
+def origin_starts(periods, horizon=DEFAULT_HORIZON, min_train=None, step=1):
+    """
+    First forecast period of every origin (= the number of training periods it sees).
+    """
+    min_train = default_min_train(periods) if min_train is None else min_train
+    starts = np.arange(max(1, min_train), periods - horizon + 1, step)
+    if starts.size == 0:
+        raise ValueError(f"{periods} periods leave no origin for a {horizon}-period horizon after {min_train} training periods")
+    return starts
+
+def origin_errors(demand, grid, horizon=DEFAULT_HORIZON, min_train=None, step=1):
+    """
+    Actual - forecast for every configuration, origin and horizon step.
+    demand: (..., periods), grid: (configs, ..., periods, horizon) -> (configs, ..., origins, horizon)
+    """
+    demand = np.asarray(demand, dtype=float)
+    starts = origin_starts(demand.shape[-1], horizon, min_train, step)
+    actual = sliding_window_view(demand, horizon, axis=-1)[..., starts, :]
+    return actual - grid[..., starts, :]
+
+def error_summary(errors):
+    """
+    MAD, MSE, RMSE and Bias over all origins and horizon steps, MAD per horizon step and the
+    90th percentile of the per-origin MAD. errors: (..., origins, horizon)
+    """
+    absolute = np.abs(errors)
+    mse = np.mean(errors * errors, axis=(-2, -1))
+    return {
+        "MAD": absolute.mean(axis=(-2, -1)),
+        "MSE": mse,
+        "RMSE": np.sqrt(mse),
+        "Bias": errors.mean(axis=(-2, -1)),
+        "MAD P90": np.percentile(absolute.mean(axis=-1), 90, axis=-1),
+        "MAD by Horizon": absolute.mean(axis=-2),
+    }
+
+# --------------------- One Series ---------------------
+def _params_label(params):
+    return ", ".join(f"{k} = {v:g}" if not isinstance(v, str) else v for k, v in params.items()) or "-"
+
+def backtest(demand, horizon=DEFAULT_HORIZON, min_train=None, step=1, windows=None, alphas=None, configs=None,
+             season_length=None, max_elements=MAX_GRID_ELEMENTS):
+    """
+    Out-of-sample error table of one series, one row per configuration (default: the whole
+    grid of default_configs; configs=[(method, params)] evaluates only those). season_length
+    enables Holt-Winters. Configurations are scored in chunks so the forecast and error grids
+    stay under max_elements.
+    """
+    demand = np.asarray(demand, dtype=float)
+    configs = default_configs(demand, windows, alphas, season_length) if configs is None else configs
+    origins = origin_starts(demand.size, horizon, min_train, step).size
+    chunk = max(1, max_elements // ((demand.size + origins) * horizon))
+    parts = [error_summary(origin_errors(demand, forecast_grid(demand, configs[lo:lo + chunk], horizon, season_length),
+                                         horizon, min_train, step))
+             for lo in range(0, len(configs), chunk)]
+    summary = {k: np.concatenate([part[k] for part in parts]) for k in parts[0]}
+    table = pd.DataFrame({
+        "Method": [m for m, _ in configs],
+        "Params": [_params_label(p) for _, p in configs],
+        "Origins": origins,
+        **{k: v for k, v in summary.items() if k != "MAD by Horizon"},
+    })
+    for h in range(horizon):
+        table[f"MAD h={h + 1}"] = summary["MAD by Horizon"][:, h]
+    return table
+
+def best_per_method(table, criteria="MAD"):
+    """
+    The best configuration of each method in a backtest table, best first.
+    """
+    best = table.loc[table.groupby("Method", sort=False)[criteria].idxmin()]
+    return best.sort_values(criteria).reset_index(drop=True)
+
+# --------------------- Catalog ---------------------
+def backtest_group(demand, horizon=DEFAULT_HORIZON, min_train=None, step=1, criteria="MAD", season_length=None,
+                   max_elements=MAX_GRID_ELEMENTS):
+    """
+    Equal-length series (series, periods) at once: per series, the best configuration of each
+    method and overall by out-of-sample criteria. Methods are scored one after another and
+    series in chunks, so the forecast and error grids of one method stay under max_elements.
+    """
+    if criteria not in CRITERIA:
+        raise ValueError(f"Unknown criteria {criteria!r}, expected one of {CRITERIA}")
+    demand = np.asarray(demand, dtype=float)
+    configs = default_configs(demand, season_length=season_length)
+    methods = list(dict.fromkeys(m for m, _ in configs))
+    members = {m: np.array([i for i, (c, _) in enumerate(configs) if c == m]) for m in methods}
+    origins = origin_starts(demand.shape[-1], horizon, min_train, step).size
+    largest = max(len(index) for index in members.values())
+    chunk = max(1, max_elements // (largest * (demand.shape[-1] + origins) * horizon))
+    rows = []
+    for lo in range(0, demand.shape[0], chunk):
+        block = demand[lo:lo + chunk]
+        scores = np.empty((len(configs), block.shape[0]))
+        for index in members.values():
+            grid = forecast_grid(block, [configs[i] for i in index], horizon, season_length)
+            errors = origin_errors(block, grid, horizon, min_train, step)
+            np.abs(errors, out=errors) if criteria == "MAD" else np.square(errors, out=errors)
+            scores[index] = errors.reshape(errors.shape[:2] + (-1,)).mean(axis=-1)
+        for s in range(block.shape[0]):
+            row = {"Origins": origins}
+            for method in methods:
+                i = members[method][np.argmin(scores[members[method], s])]
+                row[f"{method} {criteria}"] = scores[i, s]
+                row[f"{method} Params"] = _params_label(configs[i][1])
+            best = min(methods, key=lambda m: row[f"{m} {criteria}"])
+            row["Best Method"] = best
+            row["Best Params"] = row[f"{best} Params"]
+            row[f"Best {criteria}"] = row[f"{best} {criteria}"]
+            rows.append(row)
+    return rows
+
+def _backtest_jobs(args):
+    """
+    Read and backtest a chunk of series (runs in a worker process). Series of the same length
+    and period are scored together; failures go to 'Error'.
+    """
+    from Data_Storage.storage import read_series
+    jobs, options = args
+    rows, groups = [], {}
+    for job in jobs:
+        row = dict(job)
+        try:
+            df = read_series(job["file"]).fillna(0)
+            if "Demand" not in df.columns:
+                raise ValueError("no 'Demand' data")
+            demand = df["Demand"].to_numpy(dtype=float)
+            origin_starts(demand.size, options.get("horizon", DEFAULT_HORIZON), options.get("min_train"))
+            row["Records"] = demand.size
+            groups.setdefault((demand.size, job["period"]), []).append((row, demand))
+        except Exception as e:
+            row["Error"] = str(e)
+        rows.append(row)
+    for (_, period), members in groups.items():
+        results = backtest_group(np.stack([demand for _, demand in members]),
+                                 season_length=SEASON_LENGTHS.get(period), **options)
+        for (row, _), result in zip(members, results):
+            row.update(result)
+            row["Error"] = ""
+    return rows
+
+def backtest_catalog(root="Uploaded", workers=None, jobs_per_task=JOBS_PER_TASK, **options):
+    """
+    Backtest every stored series (Data_Storage.storage backend) on a process pool.
+    options: horizon, min_train, step, criteria. Returns (results DataFrame, stats dict).
+    """
+    from Data_Storage.storage import discover_series
+    jobs = list(discover_series(root))
+    tasks = [(jobs[i:i + jobs_per_task], options) for i in range(0, len(jobs), jobs_per_task)]
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        chunks = [_backtest_jobs(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_backtest_jobs, tasks))
+    elapsed = time.perf_counter() - start
+    results = pd.DataFrame([row for chunk in chunks for row in chunk])
+    stats = {
+        "series": len(jobs),
+        "failed": int((results["Error"] != "").sum()) if len(results) else 0,
+        "seconds": elapsed,
+        "series_per_second": len(jobs) / elapsed if elapsed > 0 else 0.0,
+    }
+    return results, stats
+
+if __name__ == "__main__":
+    from Batch_Forecasting.batch import write_results
+    parser = argparse.ArgumentParser(description="Rolling-origin backtest of every stored series")
+    parser.add_argument("--root", default="Uploaded")
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON)
+    parser.add_argument("--min-train", type=int, default=None, help="training periods before the first origin")
+    parser.add_argument("--step", type=int, default=1, help="periods between origins")
+    parser.add_argument("--criteria", default="MAD", choices=CRITERIA)
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: CPU count)")
+    parser.add_argument("--output", default="backtest_results.csv", help=".csv or .xlsx")
+    args = parser.parse_args()
+
+    results, stats = backtest_catalog(args.root, args.workers, horizon=args.horizon, min_train=args.min_train,
+                                      step=args.step, criteria=args.criteria)
+    write_results(results, args.output)
+    print(f"{stats['series']} series ({stats['failed']} failed) in {stats['seconds']:.2f}s "
+          f"({stats['series_per_second']:.1f} series/s), written to {args.output}")
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
-import streamlit as st
-import matplotlib.pyplot as plt
+from Data_Storage.storage import read_series
+from Performance_Monitor.timing import timed
+from Forecasting_Cache.result_cache import frame_digest, make_key
 
 # --------------------- Load Data ---------------------
 def load_demand_data(file_path_or_df):
@@ -10,26 +12,65 @@ def load_demand_data(file_path_or_df):
     if isinstance(file_path_or_df, pd.DataFrame):
         df = file_path_or_df.copy()
     else:
-        df = pd.read_excel(file_path_or_df)
+        df = read_series(file_path_or_df)
     df = df.reset_index(drop=True)
     return df
 
+# --------------------- Exponential Smoothing Kernel ---------------------
+def exponential_smoothing_levels(demand, alpha=0.3, initial_level=None):
+    """
+    Smoothed level along the last axis of a 1-D or 2-D (series x periods) array:
+    Level(t) = alpha * Actual(t) + (1-alpha) * Level(t-1)
+
+    The linear recurrence is solved as a log-depth prefix scan: after the step with
+    shift s every level holds the weighted sum of the last 2s actuals, so the whole
+    array needs log2(n) vectorized passes instead of n Python iterations.
+    alpha may be a scalar or an array broadcastable to demand[..., :1]
+    (e.g. one alpha per series, or a leading axis of alphas).
+    Level(0) = Actual(0) unless initial_level (the level before the first period) is given.
+    """
+    demand = np.asarray(demand, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    beta = 1.0 - alpha
+    levels = np.array(np.broadcast_to(alpha * demand, np.broadcast_shapes(alpha.shape, demand.shape)))
+    if levels.shape[-1] == 0:
+        return levels
+    if initial_level is None:
+        levels[..., 0] = demand[..., 0]
+    else:
+        levels[..., 0] += np.asarray(beta * np.asarray(initial_level, dtype=float)[..., None])[..., 0]
+
+    coef = np.broadcast_to(beta, levels[..., :1].shape)
+    shift = 1
+    while shift < levels.shape[-1] and coef.any():
+        levels[..., shift:] += coef * levels[..., :-shift]
+        coef = coef * coef
+        shift *= 2
+    return levels
+
+def exponential_smoothing_kernel(demand, alpha=0.3):
+    """
+    Simple Exponential Smoothing forecasts for one or many series at once.
+    Forecast(t) = alpha * Actual(t-1) + (1-alpha) * Forecast(t-1), Forecast(0) = Actual(0)
+    """
+    demand = np.asarray(demand, dtype=float)
+    levels = exponential_smoothing_levels(demand, alpha)
+    forecast = np.empty_like(levels)
+    if forecast.shape[-1] == 0:
+        return forecast
+    forecast[..., 0] = levels[..., 0]
+    forecast[..., 1:] = levels[..., :-1]
+    return forecast
+
 # --------------------- Exponential Smoothing Forecast ---------------------
+@timed()
 def apply_exponential_smoothing(df, demand_col="Demand", forecast_col="Exp_Forecast", alpha=0.3):
     """
     Apply Simple Exponential Smoothing
     Forecast(t) = alpha * Actual(t-1) + (1-alpha) * Forecast(t-1)
     """
     df = df.copy()
-    df[forecast_col] = 0.0
-
-    # Initialize first forecast as first actual demand
-    df[forecast_col].iloc[0] = df[demand_col].iloc[0]
-
-    # Calculate forecast recursively
-    for t in range(1, len(df)):
-        df[forecast_col].iloc[t] = alpha * df[demand_col].iloc[t-1] + (1 - alpha) * df[forecast_col].iloc[t-1]
-
+    df[forecast_col] = exponential_smoothing_kernel(df[demand_col].to_numpy(dtype=float), alpha)
     return df
 
 # --------------------- Next Period Forecast ---------------------
@@ -51,19 +92,22 @@ def next_period_exponential(df, period_col, demand_col="Demand", alpha=0.3, fore
     return next_period, next_forecast
 
 # --------------------- Plot Forecast ---------------------
+@timed()
 def plot_exponential_forecast(df, period_col, demand_col="Demand", forecast_col="Exp_Forecast"):
     """
     Professional line chart comparing actual vs exponential forecast
     """
-    fig, ax = plt.subplots(figsize=(10,5))
-    ax.plot(df[period_col], df[demand_col], marker="o", linewidth=2, label="Actual Demand")
-    ax.plot(df[period_col], df[forecast_col], marker="o", linestyle="--", linewidth=2, label="Exponential Forecast")
-    ax.set_title(f"Exponential Smoothing Forecast vs Actual Demand", fontsize=14)
-    ax.set_xlabel(period_col)
-    ax.set_ylabel("Quantity")
-    ax.grid(True, alpha=0.3)
-    ax.legend()
-    st.pyplot(fig)
+    import streamlit as st
+    from Chart_Rendering.charts import line_chart
+
+    chart_df = df[[period_col, demand_col, forecast_col]]
+    png = line_chart(
+        chart_df[period_col].to_numpy(),
+        [{"y": chart_df[demand_col], "fmt": "o-", "linewidth": 2, "label": "Actual Demand"},
+         {"y": chart_df[forecast_col], "fmt": "o--", "linewidth": 2, "label": "Exponential Forecast"}],
+        key=make_key(frame_digest(chart_df), "chart: plot_exponential_forecast"),
+        figsize=(10, 5), title="Exponential Smoothing Forecast vs Actual Demand", xlabel=period_col, ylabel="Quantity")
+    st.image(png, use_container_width=True)
 
 # --------------------- Full Exponential Forecast Pipeline ---------------------
 def run_exponential_forecasting(file_path_or_df, period_col, demand_col="Demand"):
@@ -76,6 +120,8 @@ def run_exponential_forecasting(file_path_or_df, period_col, demand_col="Demand"
     - Plot chart
     - Forecast next period
     """
+    import streamlit as st
+
     df = load_demand_data(file_path_or_df)
 
     # ================= User input for alpha =================
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+from Data_Storage.storage import read_series
+from Performance_Monitor.timing import timed
+from Forecasting_Cache.result_cache import frame_digest, make_key
+
+SEASONAL = ["additive", "multiplicative"]
+SEASON_LENGTHS = {"Weekly": 52, "Monthly": 12, "Quarterly": 4, "Semi-Annual": 2, "Annual": 1}
+
+# --------------------- Load Data ---------------------
+def load_demand_data(file_path_or_df):
+    """
+    Load data from Excel file or accept DataFrame directly.
+    """
+    if isinstance(file_path_or_df, pd.DataFrame):
+        df = file_path_or_df.copy()
+    else:
+        df = read_series(file_path_or_df)
+    df = df.reset_index(drop=True)
+    return df
+
+# --------------------- Holt-Winters Kernel ---------------------
+def _ratio(numerator, denominator, fallback):
+    """
+    numerator / denominator where the denominator is positive, fallback elsewhere.
+    """
+    shape = np.broadcast_shapes(np.shape(numerator), np.shape(denominator), np.shape(fallback))
+    out = np.array(np.broadcast_to(fallback, shape), dtype=float)
+    return np.divide(numerator, denominator, out=out, where=denominator > 0)
+
+def holt_winters_paths(demand, alpha=0.3, beta=0.1, gamma=0.1, season_length=12, seasonal="additive", horizon=1):
+    """
+    Holt-Winters (level, trend and season of season_length periods) for one or many series at once.
+    additive:       Level(t) = alpha * (Actual(t) - Season(t-m)) + (1-alpha) * (Level(t-1) + Trend(t-1))
+                    Season(t) = gamma * (Actual(t) - Level(t)) + (1-gamma) * Season(t-m)
+                    Forecast = Level + k * Trend + Season
+    multiplicative: Actual / Season and Actual / Level instead of the differences,
+                    Forecast = (Level + k * Trend) * Season
+    Trend(t) = beta * (Level(t) - Level(t-1)) + (1-beta) * Trend(t-1)
+
+    The first season only initializes the state (Level = its mean, Trend = 0, Season = each
+    period's deviation from or ratio to the mean), and its forecasts are Naive, so no forecast
+    uses the actual it forecasts. Non-positive levels or seasonal indices in the multiplicative
+    form leave the affected term unchanged.
+
+    Returns (..., periods + 1, horizon) like holt_paths: row t holds the forecasts of periods
+    t .. t+horizon-1 made from the actuals before t. alpha, beta and gamma may be scalars or
+    arrays broadcastable to demand[..., :1]; the recursion steps through the periods once,
+    each step vectorized over every series and parameter set.
+    """
+    if seasonal not in SEASONAL:
+        raise ValueError(f"Unknown seasonal form '{seasonal}', choose from {SEASONAL}")
+    demand = np.asarray(demand, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    beta = np.asarray(beta, dtype=float)
+    gamma = np.asarray(gamma, dtype=float)
+    shape = np.broadcast_shapes(alpha.shape, beta.shape, gamma.shape, demand[..., :1].shape)
+    m, n = max(1, int(season_length)), demand.shape[-1]
+    multiplicative = seasonal == "multiplicative"
+    steps = np.arange(1, horizon + 1)
+    # Time-major buffers keep every per-period read and write contiguous
+    paths = np.empty((n + 1,) + shape[:-1] + (horizon,))
+    if n == 0:
+        return np.moveaxis(paths, 0, -2)
+    paths[0] = np.broadcast_to(demand[..., :1], shape)
+    for t in range(1, min(m, n) + 1):
+        paths[t] = np.broadcast_to(demand[..., t - 1:t], shape)
+    if n <= m:
+        return np.moveaxis(paths, 0, -2)
+
+    level = np.array(np.broadcast_to(demand[..., :m].mean(axis=-1, keepdims=True), shape))
+    trend = np.zeros(shape)
+    first = np.moveaxis(demand[..., :m], -1, 0)[..., None]
+    first = first.reshape((m,) + (1,) * (len(shape) - first.ndim + 1) + first.shape[1:])
+    season = _ratio(first, level, 1.0) if multiplicative else first - level
+    season = np.array(np.broadcast_to(season, (m,) + shape))
+
+    def forecast(start):
+        index = (start + steps - 1) % m
+        base = level + steps * trend
+        factor = season[index[0]] if horizon == 1 else np.moveaxis(season[index], 0, -1)[..., 0, :]
+        return base * factor if multiplicative else base + factor
+
+    paths[m] = forecast(m)
+    for t in range(m, n):
+        actual = demand[..., t:t + 1]
+        previous_season = season[t % m]
+        previous = level
+        deseasonalized = _ratio(actual, previous_season, actual) if multiplicative else actual - previous_season
+        level = alpha * deseasonalized + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous) + (1 - beta) * trend
+        observed = _ratio(actual, level, previous_season) if multiplicative else actual - level
+        season[t % m] = gamma * observed + (1 - gamma) * previous_season
+        paths[t + 1] = forecast(t + 1)
+    return np.moveaxis(paths, 0, -2)
+
+def holt_winters_kernel(demand, alpha=0.3, beta=0.1, gamma=0.1, season_length=12, seasonal="additive"):
+    """
+    One-step Holt-Winters forecasts, Forecast(0) = Actual(0). demand: (..., periods)
+    """
+    return holt_winters_paths(demand, alpha, beta, gamma, season_length, seasonal)[..., :-1, 0]
+
+# --------------------- Holt-Winters Forecast ---------------------
+@timed()
+def apply_holt_winters(df, demand_col="Demand", forecast_col="HW_Forecast", alpha=0.3, beta=0.1, gamma=0.1,
+                       season_length=12, seasonal="additive"):
+    """
+    Apply Holt-Winters seasonal smoothing
+    Forecast(t) = Level(t-1) + Trend(t-1) + Season(t-m)   (additive)
+    """
+    df = df.copy()
+    df[forecast_col] = holt_winters_kernel(df[demand_col].to_numpy(dtype=float), alpha, beta, gamma,
+                                           season_length, seasonal)
+    return df
+
+# --------------------- Next Period Forecast ---------------------
+def next_period_holt_winters(df, period_col, demand_col="Demand", alpha=0.3, beta=0.1, gamma=0.1,
+                             season_length=12, seasonal="additive"):
+    """
+    Forecast next period using Holt-Winters
+    """
+    last_period = df[period_col].iloc[-1]
+    paths = holt_winters_paths(df[demand_col].to_numpy(dtype=float), alpha, beta, gamma, season_length, seasonal)
+    next_forecast = float(paths[-1, 0])
+
+    if isinstance(last_period, (int, float)):
+        next_period = last_period + 1
+    else:
+        next_period = f"After {last_period}"
+
+    return next_period, next_forecast
+
+# --------------------- Plot Forecast ---------------------
+@timed()
+def plot_holt_winters_forecast(df, period_col, demand_col="Demand", forecast_col="HW_Forecast"):
+    """
+    Professional line chart comparing actual vs Holt-Winters forecast
+    """
+    import streamlit as st
+    from Chart_Rendering.charts import line_chart
+
+    chart_df = df[[period_col, demand_col, forecast_col]]
+    png = line_chart(
+        chart_df[period_col].to_numpy(),
+        [{"y": chart_df[demand_col], "fmt": "o-", "linewidth": 2, "label": "Actual Demand"},
+         {"y": chart_df[forecast_col], "fmt": "o--", "linewidth": 2, "label": "Holt-Winters Forecast"}],
+        key=make_key(frame_digest(chart_df), "chart: plot_holt_winters_forecast"),
+        figsize=(10, 5), title="Holt-Winters Forecast vs Actual Demand", xlabel=period_col, ylabel="Quantity")
+    st.image(png, use_container_width=True)
+
+# --------------------- Full Holt-Winters Pipeline ---------------------
+def run_holt_winters_forecasting(file_path_or_df, period_col, demand_col="Demand", season_length=12):
+    """
+    Full pipeline:
+    - Load data
+    - Ask user for alpha, beta, gamma and the seasonal form
+    - Apply Holt-Winters Forecast
+    - Display table
+    - Plot chart
+    - Forecast next period
+    """
+    import streamlit as st
+
+    df = load_demand_data(file_path_or_df)
+
+    # ================= User input for the parameters =================
+    st.sidebar.markdown("### 🌦 Holt-Winters α / β / γ")
+    alpha = st.sidebar.slider("Level smoothing (α)", min_value=0.01, max_value=1.0, value=0.3, step=0.01)
+    beta = st.sidebar.slider("Trend smoothing (β)", min_value=0.01, max_value=1.0, value=0.1, step=0.01)
+    gamma = st.sidebar.slider("Seasonal smoothing (γ)", min_value=0.01, max_value=1.0, value=0.1, step=0.01)
+    seasonal = st.sidebar.radio("Seasonality", SEASONAL, horizontal=True)
+
+    # Apply Holt-Winters
+    df = apply_holt_winters(df, demand_col=demand_col, alpha=alpha, beta=beta, gamma=gamma,
+                            season_length=season_length, seasonal=seasonal)
+
+    # Show table
+    st.subheader(f"📊 Holt-Winters Forecast Table ({seasonal}, α = {alpha}, β = {beta}, γ = {gamma})")
+    st.dataframe(df, use_container_width=True)
+
+    # Plot forecast
+    plot_holt_winters_forecast(df, period_col, demand_col=demand_col)
+
+    # Forecast next period
+    next_period, next_forecast = next_period_holt_winters(df, period_col, demand_col, alpha, beta, gamma,
+                                                          season_length, seasonal)
+    st.info(f"📌 Holt-Winters Forecast for next period (**{next_period}**) = **{round(next_forecast,2)}**")
+
+    return df
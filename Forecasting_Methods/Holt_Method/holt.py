@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+from Data_Storage.storage import read_series
+from Performance_Monitor.timing import timed
+from Forecasting_Cache.result_cache import frame_digest, make_key
+
+# --------------------- Load Data ---------------------
+def load_demand_data(file_path_or_df):
+    """
+    Load data from Excel file or accept DataFrame directly.
+    """
+    if isinstance(file_path_or_df, pd.DataFrame):
+        df = file_path_or_df.copy()
+    else:
+        df = read_series(file_path_or_df)
+    df = df.reset_index(drop=True)
+    return df
+
+# --------------------- Holt Kernel ---------------------
+def holt_paths(demand, alpha=0.3, beta=0.1, horizon=1):
+    """
+    Holt's linear trend method for one or many series at once:
+    Level(t) = alpha * Actual(t) + (1-alpha) * (Level(t-1) + Trend(t-1))
+    Trend(t) = beta * (Level(t) - Level(t-1)) + (1-beta) * Trend(t-1)
+
+    Returns (..., periods + 1, horizon): row t holds the forecasts of periods t .. t+horizon-1
+    made from the actuals before t (Level + k * Trend); row 0 is Actual(0) and the last row
+    forecasts the periods after the history. Level(0) = Actual(0), Trend(0) = 0.
+    The recursion steps through the periods once, each step vectorized over every series and
+    parameter set: alpha and beta may be scalars or arrays broadcastable to demand[..., :1]
+    (e.g. a leading axis of parameter sets).
+    """
+    demand = np.asarray(demand, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    beta = np.asarray(beta, dtype=float)
+    shape = np.broadcast_shapes(alpha.shape, beta.shape, demand[..., :1].shape)
+    n = demand.shape[-1]
+    steps = np.arange(1, horizon + 1)
+    # Time-major buffer keeps every per-period write contiguous
+    paths = np.empty((n + 1,) + shape[:-1] + (horizon,))
+    if n == 0:
+        return np.moveaxis(paths, 0, -2)
+    level = np.array(np.broadcast_to(demand[..., :1], shape))
+    trend = np.zeros(shape)
+    paths[0] = level
+    paths[1] = level
+    for t in range(1, n):
+        previous = level
+        level = alpha * demand[..., t:t + 1] + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous) + (1 - beta) * trend
+        paths[t + 1] = level + steps * trend
+    return np.moveaxis(paths, 0, -2)
+
+def holt_kernel(demand, alpha=0.3, beta=0.1):
+    """
+    One-step Holt forecasts, Forecast(0) = Actual(0). demand: (..., periods)
+    """
+    return holt_paths(demand, alpha, beta)[..., :-1, 0]
+
+# --------------------- Holt Forecast ---------------------
+@timed()
+def apply_holt(df, demand_col="Demand", forecast_col="Holt_Forecast", alpha=0.3, beta=0.1):
+    """
+    Apply Holt's linear trend method
+    Forecast(t) = Level(t-1) + Trend(t-1)
+    """
+    df = df.copy()
+    df[forecast_col] = holt_kernel(df[demand_col].to_numpy(dtype=float), alpha, beta)
+    return df
+
+# --------------------- Next Period Forecast ---------------------
+def next_period_holt(df, period_col, demand_col="Demand", alpha=0.3, beta=0.1):
+    """
+    Forecast next period using Holt's method
+    """
+    last_period = df[period_col].iloc[-1]
+    next_forecast = float(holt_paths(df[demand_col].to_numpy(dtype=float), alpha, beta)[-1, 0])
+
+    if isinstance(last_period, (int, float)):
+        next_period = last_period + 1
+    else:
+        next_period = f"After {last_period}"
+
+    return next_period, next_forecast
+
+# --------------------- Plot Forecast ---------------------
+@timed()
+def plot_holt_forecast(df, period_col, demand_col="Demand", forecast_col="Holt_Forecast"):
+    """
+    Professional line chart comparing actual vs Holt forecast
+    """
+    import streamlit as st
+    from Chart_Rendering.charts import line_chart
+
+    chart_df = df[[period_col, demand_col, forecast_col]]
+    png = line_chart(
+        chart_df[period_col].to_numpy(),
+        [{"y": chart_df[demand_col], "fmt": "o-", "linewidth": 2, "label": "Actual Demand"},
+         {"y": chart_df[forecast_col], "fmt": "o--", "linewidth": 2, "label": "Holt Forecast"}],
+        key=make_key(frame_digest(chart_df), "chart: plot_holt_forecast"),
+        figsize=(10, 5), title="Holt Forecast vs Actual Demand", xlabel=period_col, ylabel="Quantity")
+    st.image(png, use_container_width=True)
+
+# --------------------- Full Holt Forecast Pipeline ---------------------
+def run_holt_forecasting(file_path_or_df, period_col, demand_col="Demand"):
+    """
+    Full pipeline:
+    - Load data
+    - Ask user for alpha and beta
+    - Apply Holt Forecast
+    - Display table
+    - Plot chart
+    - Forecast next period
+    """
+    import streamlit as st
+
+    df = load_demand_data(file_path_or_df)
+
+    # ================= User input for alpha / beta =================
+    st.sidebar.markdown("### 📈 Holt α / β")
+    alpha = st.sidebar.slider("Level smoothing (α)", min_value=0.01, max_value=1.0, value=0.3, step=0.01)
+    beta = st.sidebar.slider("Trend smoothing (β)", min_value=0.01, max_value=1.0, value=0.1, step=0.01)
+
+    # Apply Holt's method
+    df = apply_holt(df, demand_col=demand_col, alpha=alpha, beta=beta)
+
+    # Show table
+    st.subheader(f"📊 Holt Forecast Table (α = {alpha}, β = {beta})")
+    st.dataframe(df, use_container_width=True)
+
+    # Plot forecast
+    plot_holt_forecast(df, period_col, demand_col=demand_col)
+
+    # Forecast next period
+    next_period, next_forecast = next_period_holt(df, period_col, demand_col=demand_col, alpha=alpha, beta=beta)
+    st.info(f"📌 Holt Forecast for next period (**{next_period}**) = **{round(next_forecast,2)}**")
+
+    return df
@@ -0,0 +1,170 @@
+import os
+import json
+from collections import deque
+import numpy as np
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import exponential_smoothing_levels
+from Forecasting_Methods.Parameter_Tuning.tuning import moving_average_grid
+from Forecasting_Error.Running_Error.running_error import RunningError
+from Data_Storage.journal import data_signature
+
+STATE_DIR = ".state"
+METHODS = ["Naive", "Moving Average", "Exponential Smoothing"]
+
+# --------------------- Incremental Forecaster ---------------------
+class IncrementalForecaster:
+    """
+    Naive, Moving Average and Exponential Smoothing kept up to date one observation at a time.
+    State: last actual, the last ma_n actuals with their running sum, the smoothed level
+    and a RunningError per method, so append() costs O(1) regardless of history length.
+    Conventions match page_forecasting: the first period's forecast is the first actual.
+    """
+    def __init__(self, ma_n=3, alpha=0.3):
+        self.ma_n = int(ma_n)
+        self.alpha = float(alpha)
+        self.count = 0
+        self.last = None
+        self.level = None
+        self.window = deque()
+        self.window_sum = 0.0
+        self.errors = {method: RunningError() for method in METHODS}
+
+    def next_forecasts(self):
+        """
+        Forecast of every method for the next (not yet observed) period.
+        """
+        if self.count == 0:
+            return {method: None for method in METHODS}
+        return {
+            "Naive": self.last,
+            "Moving Average": self.window_sum / len(self.window),
+            "Exponential Smoothing": self.level,
+        }
+
+    def append(self, actual):
+        """
+        Add one observation: score the forecasts made for it, then roll the state forward.
+        Returns the forecasts that were made for this period.
+        """
+        actual = float(actual)
+        forecasts = self.next_forecasts() if self.count else {method: actual for method in METHODS}
+        for method, forecast in forecasts.items():
+            self.errors[method].update(actual, forecast)
+
+        self.level = actual if self.count == 0 else self.alpha * actual + (1 - self.alpha) * self.level
+        self.window.append(actual)
+        self.window_sum += actual
+        if len(self.window) > self.ma_n:
+            self.window_sum -= self.window.popleft()
+        self.last = actual
+        self.count += 1
+        return forecasts
+
+    def metrics(self):
+        """
+        {method: {metric: value}} of the error engine's METRICS over every observation appended so far.
+        """
+        return {method: err.metrics() for method, err in self.errors.items()}
+
+    # ----- Full recompute fallback -----
+    @classmethod
+    def from_series(cls, demand, ma_n=3, alpha=0.3):
+        """
+        Rebuild the state from a whole series (used when a past row is edited or deleted).
+        """
+        fc = cls(ma_n, alpha)
+        demand = np.asarray(demand, dtype=float)
+        if demand.size == 0:
+            return fc
+        naive = np.concatenate([demand[:1], demand[:-1]])
+        ma = moving_average_grid(demand, [fc.ma_n])[0]
+        levels = exponential_smoothing_levels(demand, fc.alpha)
+        ses = np.concatenate([demand[:1], levels[:-1]])
+        for method, forecast in zip(METHODS, (naive, ma, ses)):
+            fc.errors[method].update_many(demand, forecast)
+        fc.count = int(demand.size)
+        fc.last = float(demand[-1])
+        fc.level = float(levels[-1])
+        fc.window = deque(demand[-fc.ma_n:].tolist())
+        fc.window_sum = float(sum(fc.window))
+        return fc
+
+    # ----- Persistence -----
+    def to_dict(self):
+        return {
+            "ma_n": self.ma_n, "alpha": self.alpha, "count": self.count,
+            "last": self.last, "level": self.level, "window": list(self.window),
+            "errors": {method: err.to_dict() for method, err in self.errors.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        fc = cls(data["ma_n"], data["alpha"])
+        fc.count = data["count"]
+        fc.last = data["last"]
+        fc.level = data["level"]
+        fc.window = deque(data["window"])
+        fc.window_sum = float(sum(fc.window))
+        fc.errors = {method: RunningError.from_dict(err) for method, err in data["errors"].items()}
+        return fc
+
+# --------------------- Per-Series State Store ---------------------
+def state_path(file_path):
+    folder, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(folder, STATE_DIR, name + ".json")
+
+def save_state(file_path, forecaster):
+    path = state_path(file_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = forecaster.to_dict()
+    data["signature"] = data_signature(file_path)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+def load_state(file_path):
+    """
+    Returns (forecaster, signature it was saved with) or (None, None).
+    """
+    try:
+        with open(state_path(file_path), encoding="utf-8") as f:
+            data = json.load(f)
+        return IncrementalForecaster.from_dict(data), data.get("signature")
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+def _same_params(fc, ma_n, alpha):
+    return fc is not None and fc.ma_n == int(ma_n) and fc.alpha == float(alpha)
+
+def state_for(file_path, demand, ma_n=3, alpha=0.3):
+    """
+    Persisted forecaster of a workbook, rebuilt from demand when it is missing,
+    was built with other parameters, or does not cover exactly len(demand) observations.
+    """
+    fc, signature = load_state(file_path)
+    if not _same_params(fc, ma_n, alpha) or fc.count != len(demand) or signature != data_signature(file_path):
+        fc = IncrementalForecaster.from_series(demand, ma_n, alpha)
+        save_state(file_path, fc)
+    return fc
+
+def record_append(file_path, demand, ma_n=3, alpha=0.3):
+    """
+    Update the persisted state after one row was appended (demand includes the new row).
+    O(1) when the state covered the previous rows, full recompute otherwise.
+    """
+    demand = np.asarray(demand, dtype=float)
+    fc, _ = load_state(file_path)
+    if _same_params(fc, ma_n, alpha) and fc.count == len(demand) - 1 and fc.count and fc.last == float(demand[-2]):
+        fc.append(demand[-1])
+    else:
+        fc = IncrementalForecaster.from_series(demand, ma_n, alpha)
+    save_state(file_path, fc)
+    return fc
+
+def record_rewrite(file_path, demand, ma_n=3, alpha=0.3):
+    """
+    Full recompute after a past row was edited or deleted.
+    """
+    fc = IncrementalForecaster.from_series(demand, ma_n, alpha)
+    save_state(file_path, fc)
+    return fc
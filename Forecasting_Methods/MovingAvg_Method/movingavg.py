@@ -1,6 +1,7 @@
 import pandas as pd
-import streamlit as st
-import matplotlib.pyplot as plt
+from Data_Storage.storage import read_series
+from Performance_Monitor.timing import timed
+from Forecasting_Cache.result_cache import frame_digest, make_key
 
 # --------------------- Load Data ---------------------
 def load_demand_data(file_path_or_df):
@@ -10,11 +11,12 @@ def load_demand_data(file_path_or_df):
     if isinstance(file_path_or_df, pd.DataFrame):
         df = file_path_or_df.copy()
     else:
-        df = pd.read_excel(file_path_or_df)
+        df = read_series(file_path_or_df)
     df = df.reset_index(drop=True)
     return df
 
 # --------------------- Moving Average Forecast ---------------------
+@timed()
 def apply_moving_average(df, demand_col="Demand", forecast_col="MA_Forecast", periods=3):
     """
     Apply Simple Moving Average Forecast
@@ -41,19 +43,22 @@ def next_period_moving_average(df, period_col, demand_col="Demand", periods=3):
     return next_period, next_forecast
 
 # --------------------- Plot Forecast ---------------------
+@timed()
 def plot_moving_average(df, period_col, demand_col="Demand", forecast_col="MA_Forecast"):
     """
     Professional line chart comparing actual vs moving average forecast
     """
-    fig, ax = plt.subplots(figsize=(10,5))
-    ax.plot(df[period_col], df[demand_col], marker="o", linewidth=2, label="Actual Demand")
-    ax.plot(df[period_col], df[forecast_col], marker="o", linestyle="--", linewidth=2, label="Moving Avg Forecast")
-    ax.set_title(f"Moving Average Forecast vs Actual Demand", fontsize=14)
-    ax.set_xlabel(period_col)
-    ax.set_ylabel("Quantity")
-    ax.grid(True, alpha=0.3)
-    ax.legend()
-    st.pyplot(fig)
+    import streamlit as st
+    from Chart_Rendering.charts import line_chart
+
+    chart_df = df[[period_col, demand_col, forecast_col]]
+    png = line_chart(
+        chart_df[period_col].to_numpy(),
+        [{"y": chart_df[demand_col], "fmt": "o-", "linewidth": 2, "label": "Actual Demand"},
+         {"y": chart_df[forecast_col], "fmt": "o--", "linewidth": 2, "label": "Moving Avg Forecast"}],
+        key=make_key(frame_digest(chart_df), "chart: plot_moving_average"),
+        figsize=(10, 5), title="Moving Average Forecast vs Actual Demand", xlabel=period_col, ylabel="Quantity")
+    st.image(png, use_container_width=True)
 
 # --------------------- Full Moving Average Pipeline ---------------------
 def run_moving_average_forecasting(file_path_or_df, period_col, demand_col="Demand"):
@@ -66,6 +71,8 @@ def run_moving_average_forecasting(file_path_or_df, period_col, demand_col="Dema
     - Plot chart
     - Forecast next period
     """
+    import streamlit as st
+
     df = load_demand_data(file_path_or_df)
 
     # ===== User Input for Number of Periods =====
@@ -1,6 +1,7 @@
 import pandas as pd
-import streamlit as st
-import matplotlib.pyplot as plt
+from Data_Storage.storage import read_series
+from Performance_Monitor.timing import timed
+from Forecasting_Cache.result_cache import frame_digest, make_key
 
 # --------------------- Load Data ---------------------
 def load_demand_data(file_path_or_df):
@@ -10,11 +11,12 @@ def load_demand_data(file_path_or_df):
     if isinstance(file_path_or_df, pd.DataFrame):
         df = file_path_or_df.copy()
     else:
-        df = pd.read_excel(file_path_or_df)
+        df = read_series(file_path_or_df)
     df = df.reset_index(drop=True)
     return df
 
 # --------------------- Naive Forecast ---------------------
+@timed()
 def apply_naive_forecast(df, demand_col="Demand", forecast_col="Naive_Forecast"):
     """
     Apply Naive Forecast: Forecast(t) = Actual(t-1)
@@ -40,19 +42,22 @@ def next_period_naive_forecast(df, period_col, demand_col="Demand"):
     return next_period, last_demand
 
 # --------------------- Plot Forecast ---------------------
+@timed()
 def plot_naive_forecast(df, period_col, demand_col="Demand", forecast_col="Naive_Forecast"):
     """
     Professional line chart comparing actual vs naive forecast
     """
-    fig, ax = plt.subplots(figsize=(10,5))
-    ax.plot(df[period_col], df[demand_col], marker="o", linewidth=2, label="Actual Demand")
-    ax.plot(df[period_col], df[forecast_col], marker="o", linestyle="--", linewidth=2, label="Naive Forecast")
-    ax.set_title("Naive Forecast vs Actual Demand", fontsize=14)
-    ax.set_xlabel(period_col)
-    ax.set_ylabel("Quantity")
-    ax.grid(True, alpha=0.3)
-    ax.legend()
-    st.pyplot(fig)
+    import streamlit as st
+    from Chart_Rendering.charts import line_chart
+
+    chart_df = df[[period_col, demand_col, forecast_col]]
+    png = line_chart(
+        chart_df[period_col].to_numpy(),
+        [{"y": chart_df[demand_col], "fmt": "o-", "linewidth": 2, "label": "Actual Demand"},
+         {"y": chart_df[forecast_col], "fmt": "o--", "linewidth": 2, "label": "Naive Forecast"}],
+        key=make_key(frame_digest(chart_df), "chart: plot_naive_forecast"),
+        figsize=(10, 5), title="Naive Forecast vs Actual Demand", xlabel=period_col, ylabel="Quantity")
+    st.image(png, use_container_width=True)
 
 # --------------------- Full Naive Forecast Pipeline ---------------------
 def run_naive_forecasting(file_path_or_df, period_col, demand_col="Demand"):
@@ -64,6 +69,8 @@ def run_naive_forecasting(file_path_or_df, period_col, demand_col="Demand"):
     - Plot chart
     - Forecast next period
     """
+    import streamlit as st
+
     # Load data
     df = load_demand_data(file_path_or_df)
 
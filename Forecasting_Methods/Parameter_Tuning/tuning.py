@@ -0,0 +1,171 @@
+import numpy as np
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import exponential_smoothing_kernel
+from Forecasting_Methods.Holt_Method.holt import holt_paths
+from Forecasting_Methods.HoltWinters_Method.holtwinters import SEASONAL, holt_winters_paths
+
+DEFAULT_ALPHAS = np.round(np.arange(0.01, 1.0001, 0.01), 2)
+TREND_ALPHAS = np.round(np.arange(0.1, 1.0001, 0.1), 1)
+TREND_BETAS = np.array([0.01, 0.05, 0.1, 0.2, 0.3])
+SEASONAL_GAMMAS = np.array([0.05, 0.1, 0.2, 0.3, 0.5])
+MAX_DEFAULT_WINDOW = 52
+MAX_GRID_ELEMENTS = 4_000_000
+
+# --------------------- Parameter Grids ---------------------
+def default_windows(n_periods):
+    """
+    Every moving-average window from 1 up to n-1 periods (capped at one year of weeks).
+    """
+    return np.arange(1, max(1, min(n_periods - 1, MAX_DEFAULT_WINDOW)) + 1)
+
+def moving_average_grid(demand, windows):
+    """
+    Moving-average forecasts for every window at once, using one cumulative sum:
+    Forecast(t) = (Cum(t) - Cum(t-n)) / n, averaged over fewer periods near the start,
+    Forecast(0) = Actual(0) (same convention as page_forecasting).
+    demand: (periods,) or (series, periods) -> returns (windows, ..., periods)
+    """
+    demand = np.asarray(demand, dtype=float)
+    windows = np.asarray(windows, dtype=int)[:, None]
+    n = demand.shape[-1]
+    cum = np.zeros(demand.shape[:-1] + (n + 1,))
+    np.cumsum(demand, axis=-1, out=cum[..., 1:])
+
+    t = np.arange(n)
+    start = np.maximum(t - windows, 0)
+    count = np.maximum(t - start, 1)
+    forecast = (cum[..., None, t] - cum[..., start]) / count
+    if demand.ndim == 2:
+        forecast = np.moveaxis(forecast, -2, 0)
+    forecast[..., 0] = demand[..., 0]
+    return forecast
+
+def exponential_smoothing_grid(demand, alphas):
+    """
+    Exponential smoothing forecasts for every alpha at once (alpha broadcast on a leading axis).
+    demand: (periods,) or (series, periods) -> returns (alphas, ..., periods)
+    """
+    demand = np.asarray(demand, dtype=float)
+    alphas = np.asarray(alphas, dtype=float).reshape((-1,) + (1,) * demand.ndim)
+    return exponential_smoothing_kernel(demand, alphas)
+
+def parameter_grid(*values):
+    """
+    Every combination of the given parameter values, one row per combination: (combinations, len(values)).
+    """
+    return np.stack(np.meshgrid(*values, indexing="ij"), axis=-1).reshape(-1, len(values))
+
+def _column(values, demand):
+    return np.asarray(values, dtype=float).reshape((-1,) + (1,) * np.ndim(demand))
+
+def holt_grid(demand, params, horizon=None):
+    """
+    Holt forecasts for every (alpha, beta) row of params at once (parameter sets on a leading axis).
+    demand: (periods,) or (series, periods) -> returns (params, ..., periods), or the
+    (params, ..., periods, horizon) forecast paths when horizon is given.
+    """
+    demand = np.asarray(demand, dtype=float)
+    params = np.asarray(params, dtype=float).reshape(-1, 2)
+    paths = holt_paths(demand, _column(params[:, 0], demand), _column(params[:, 1], demand), horizon or 1)
+    return paths[..., :-1, 0] if horizon is None else paths[..., :-1, :]
+
+def holt_winters_grid(demand, params, season_length, seasonal="additive", horizon=None):
+    """
+    Holt-Winters forecasts for every (alpha, beta, gamma) row of params at once, like holt_grid.
+    """
+    demand = np.asarray(demand, dtype=float)
+    params = np.asarray(params, dtype=float).reshape(-1, 3)
+    alpha, beta, gamma = (_column(params[:, i], demand) for i in range(3))
+    paths = holt_winters_paths(demand, alpha, beta, gamma, season_length, seasonal, horizon or 1)
+    return paths[..., :-1, 0] if horizon is None else paths[..., :-1, :]
+
+def grid_errors(demand, forecasts, criteria="MAD"):
+    """
+    MAD or MSE of every grid forecast against the actual demand (reduced over periods).
+    """
+    errors = np.asarray(demand, dtype=float) - forecasts
+    if criteria == "MSE":
+        return np.mean(errors * errors, axis=-1)
+    return np.mean(np.abs(errors), axis=-1)
+
+# --------------------- Tuning ---------------------
+def _best_on_grid(demand, grid_fn, values, criteria, max_elements):
+    """
+    Evaluate grid_fn over all values and return (best value, best error) per series.
+    Series are processed in chunks so the grid never exceeds max_elements floats.
+    """
+    n = demand.shape[-1]
+    chunk = max(1, max_elements // max(1, len(values) * n))
+    best_values, best_errors = [], []
+    for lo in range(0, demand.shape[0], chunk):
+        block = demand[lo:lo + chunk]
+        errors = grid_errors(block, grid_fn(block, values), criteria)
+        idx = np.argmin(errors, axis=0)
+        best_values.append(values[idx])
+        best_errors.append(np.take_along_axis(errors, idx[None], axis=0)[0])
+    return np.concatenate(best_values), np.concatenate(best_errors)
+
+def tune_parameters(demand, criteria="MAD", windows=None, alphas=None, max_elements=MAX_GRID_ELEMENTS):
+    """
+    Find the MAD/MSE-optimal moving-average window and smoothing alpha.
+    demand: one series (periods,) or equal-length series (series, periods).
+    Returns {"ma_n", "ma_error", "alpha", "alpha_error"}: scalars for one series,
+    arrays (one entry per series) for a 2-D input.
+    """
+    demand = np.asarray(demand, dtype=float)
+    single = demand.ndim == 1
+    demand2d = demand[None, :] if single else demand
+    windows = default_windows(demand2d.shape[-1]) if windows is None else np.asarray(windows, dtype=int)
+    alphas = DEFAULT_ALPHAS if alphas is None else np.asarray(alphas, dtype=float)
+
+    ma_n, ma_error = _best_on_grid(demand2d, moving_average_grid, windows, criteria, max_elements)
+    alpha, alpha_error = _best_on_grid(demand2d, exponential_smoothing_grid, alphas, criteria, max_elements)
+    result = {"ma_n": ma_n, "ma_error": ma_error, "alpha": alpha, "alpha_error": alpha_error}
+    if single:
+        result = {
+            "ma_n": int(ma_n[0]), "ma_error": float(ma_error[0]),
+            "alpha": float(alpha[0]), "alpha_error": float(alpha_error[0]),
+        }
+    return result
+
+def tune_holt(demand, criteria="MAD", alphas=None, betas=None, max_elements=MAX_GRID_ELEMENTS):
+    """
+    Find the MAD/MSE-optimal Holt alpha and beta over their grid, every series at once.
+    Returns {"alpha", "beta", "error"}: scalars for one series, arrays for a 2-D input.
+    """
+    demand = np.asarray(demand, dtype=float)
+    demand2d = demand[None, :] if demand.ndim == 1 else demand
+    grid = parameter_grid(TREND_ALPHAS if alphas is None else alphas, TREND_BETAS if betas is None else betas)
+    best, error = _best_on_grid(demand2d, holt_grid, grid, criteria, max_elements)
+    result = {"alpha": best[:, 0], "beta": best[:, 1], "error": error}
+    if demand.ndim == 1:
+        result = {key: float(value[0]) for key, value in result.items()}
+    return result
+
+def tune_holt_winters(demand, season_length, criteria="MAD", seasonal=None, alphas=None, betas=None, gammas=None,
+                      max_elements=MAX_GRID_ELEMENTS):
+    """
+    Find the MAD/MSE-optimal Holt-Winters alpha, beta, gamma and seasonal form, every series at once.
+    seasonal=None tries both forms (multiplicative only for series with positive demand).
+    Returns {"alpha", "beta", "gamma", "seasonal", "error"}: scalars for one series, arrays for a 2-D input.
+    """
+    demand = np.asarray(demand, dtype=float)
+    demand2d = demand[None, :] if demand.ndim == 1 else demand
+    grid = parameter_grid(TREND_ALPHAS if alphas is None else alphas, TREND_BETAS if betas is None else betas,
+                          SEASONAL_GAMMAS if gammas is None else gammas)
+    forms = SEASONAL if seasonal is None else [seasonal]
+    bests, errors = [], []
+    for form in forms:
+        fit = lambda block, params: holt_winters_grid(block, params, season_length, form)
+        best, error = _best_on_grid(demand2d, fit, grid, criteria, max_elements)
+        if form == "multiplicative" and seasonal is None:
+            error = np.where((demand2d > 0).all(axis=-1), error, np.inf)
+        bests.append(best)
+        errors.append(error)
+    rows = np.arange(demand2d.shape[0])
+    choice = np.argmin(np.stack(errors), axis=0)
+    best = np.stack(bests)[choice, rows]
+    result = {"alpha": best[:, 0], "beta": best[:, 1], "gamma": best[:, 2],
+              "seasonal": np.array(forms)[choice], "error": np.stack(errors)[choice, rows]}
+    if demand.ndim == 1:
+        result = {key: value[0].item() for key, value in result.items()}
+    return result
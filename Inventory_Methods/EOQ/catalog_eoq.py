@@ -0,0 +1,204 @@
+"""
+Catalog-wide EOQ / reorder point / order cycle.
+
+Annual and daily demand come from each material's demand history under Uploaded/, or in
+the database when FIMS_STORAGE=sqlite (the finest period available), ordering cost S, holding cost H, lead time and unit
+price from an optional parameter table, and optional all-units quantity discounts
+from a price-break table. All materials are computed in one vectorized pass and
+the result is sorted by total annual cost.
+
+Parameter table (CSV/xlsx): MaterialFamily, MaterialType, MaterialGrade and any of
+    OrderingCost, HoldingCost, HoldingRate, LeadTimeDays, UnitPrice
+Discount table (CSV/xlsx): MaterialFamily, MaterialType, MaterialGrade, MinQty, UnitPrice
+
+Run from the repository root:
+    python -m Inventory_Methods.EOQ.catalog_eoq --params eoq_params.csv --discounts breaks.csv --output eoq.xlsx
+"""
+import argparse
+import numpy as np
+import pandas as pd
+from Data_Storage.catalog import CATALOG_FILE, LEVELS
+from Data_Storage.sidecar import read_excel_cached
+from Data_Storage.storage import discover_series, read_series, using_database, DATABASE
+from Data_Storage.database import demand_summary, make_key as make_db_key
+from Batch_Forecasting.batch import write_results
+from Inventory_Methods.EOQ.eoq import (
+    PERIODS_PER_YEAR, annual_demand_from_history, calculate_eoq, calculate_reorder_point,
+    days_between_orders, annual_costs, quantity_discount_eoq)
+
+DEFAULTS = {"OrderingCost": 200.0, "HoldingCost": 25.0, "LeadTimeDays": 7.0, "UnitPrice": 0.0}
+
+def _label(value):
+    """
+    A catalog level as text; integral floats (a grade column read as float) drop the ".0"
+    so they match the Uploaded/ folder names.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _key(family, m_type, grade):
+    return (_label(family), _label(m_type), _label(grade))
+
+def read_table(path_or_buffer):
+    """
+    CSV or Excel parameter table (a path or an uploaded file object).
+    """
+    name = getattr(path_or_buffer, "name", str(path_or_buffer))
+    if name.lower().endswith(".csv"):
+        return pd.read_csv(path_or_buffer)
+    return read_excel_cached(path_or_buffer)
+
+# --------------------- Demand from History ---------------------
+def finest_series(root="Uploaded"):
+    """
+    {(family, type, grade): job} with the workbook of the finest period each material has
+    (Weekly before Monthly before ... Annual).
+    """
+    rank = {period: i for i, period in enumerate(PERIODS_PER_YEAR)}
+    chosen = {}
+    for job in discover_series(root):
+        if job["period"] not in rank:
+            continue
+        key = _key(job["family"], job["type"], job["grade"])
+        if key not in chosen or rank[job["period"]] < rank[chosen[key]["period"]]:
+            chosen[key] = job
+    return chosen
+
+def demand_by_material(root="Uploaded", demand_col="Demand"):
+    """
+    {(family, type, grade): {"Period", "File", "Records", "Annual Demand"}} from finest_series().
+    With the database backend the per-series means are aggregated in SQL instead.
+    """
+    if using_database():
+        return _demand_from_database()
+    demand = {}
+    for key, job in finest_series(root).items():
+        df = read_series(job["file"])
+        values = df[demand_col].to_numpy(dtype=float) if demand_col in df.columns else np.empty(0)
+        demand[key] = {
+            "Period": job["period"],
+            "File": job["file"],
+            "Records": int(values.size),
+            "Annual Demand": annual_demand_from_history(values, job["period"]),
+        }
+    return demand
+
+def _demand_from_database():
+    summary = demand_summary(DATABASE)
+    summary = summary[summary["period"].isin(list(PERIODS_PER_YEAR))]
+    summary = summary.assign(rank=summary["period"].map({p: i for i, p in enumerate(PERIODS_PER_YEAR)}))
+    summary = summary.sort_values(["rank", "name"]).drop_duplicates(["family", "type", "grade"])
+    return {
+        _key(row.family, row.type, row.grade): {
+            "Period": row.period,
+            "File": make_db_key(row.id, row.family, row.type, row.grade, row.period, row.name),
+            "Records": int(row.records),
+            "Annual Demand": row.mean * PERIODS_PER_YEAR[row.period] if row.records else float("nan"),
+        }
+        for row in summary.itertuples(index=False)
+    }
+
+# --------------------- Catalog EOQ ---------------------
+def _lookup(catalog, table):
+    """
+    Align a per-material table (keyed by the three LEVELS columns) to the catalog rows.
+    """
+    table = table.copy()
+    table["_key"] = [_key(*row) for row in table[LEVELS].itertuples(index=False)]
+    return catalog[["_key"]].merge(table.drop(columns=LEVELS).drop_duplicates("_key"), on="_key", how="left")
+
+def _price_breaks(catalog, discounts):
+    """
+    (materials, breaks) NaN-padded MinQty / UnitPrice matrices, breaks sorted by MinQty.
+    """
+    discounts = discounts.copy()
+    discounts["_key"] = [_key(*row) for row in discounts[LEVELS].itertuples(index=False)]
+    discounts = discounts.sort_values(["_key", "MinQty"])
+    discounts["_break"] = discounts.groupby("_key").cumcount()
+    width = int(discounts["_break"].max()) + 1 if len(discounts) else 1
+    position = pd.Series(np.arange(len(catalog)), index=catalog["_key"])
+    rows = position.reindex(discounts["_key"]).to_numpy()
+    keep = ~np.isnan(rows)
+    min_qty = np.full((len(catalog), width), np.nan)
+    price = np.full((len(catalog), width), np.nan)
+    rows, cols = rows[keep].astype(int), discounts["_break"].to_numpy()[keep]
+    min_qty[rows, cols] = discounts["MinQty"].to_numpy(dtype=float)[keep]
+    price[rows, cols] = discounts["UnitPrice"].to_numpy(dtype=float)[keep]
+    return min_qty, price
+
+def catalog_eoq(catalog=None, demand=None, params=None, discounts=None, root="Uploaded"):
+    """
+    EOQ, reorder point, order cycle and annual costs for every catalog material, sorted by
+    total annual cost (materials without a demand history last).
+    catalog: DataFrame with the LEVELS columns (default: the material classification workbook).
+    demand: output of demand_by_material(); params / discounts: DataFrames as described above.
+    """
+    if catalog is None:
+        catalog = read_excel_cached(CATALOG_FILE)
+    catalog = catalog[LEVELS].drop_duplicates().reset_index(drop=True)
+    catalog["_key"] = [_key(*row) for row in catalog.itertuples(index=False)]
+    demand = demand_by_material(root) if demand is None else demand
+    history = pd.DataFrame([demand.get(k, {}) for k in catalog["_key"]], index=catalog.index)
+    history = history.reindex(columns=["Period", "File", "Records", "Annual Demand"])
+
+    values = _lookup(catalog, params) if params is not None and len(params) else pd.DataFrame(index=catalog.index)
+    given = lambda name: (values[name].astype(float) if name in values.columns
+                          else pd.Series(np.nan, index=catalog.index)).to_numpy()
+    column = lambda name: np.where(np.isnan(given(name)), DEFAULTS.get(name, np.nan), given(name))
+    D = history["Annual Demand"].to_numpy(dtype=float)
+    S, L, P = column("OrderingCost"), column("LeadTimeDays"), column("UnitPrice")
+    rate, fixed_holding = column("HoldingRate"), column("HoldingCost")
+    # A holding rate needs a unit price; without one the fixed HoldingCost applies
+    priced = ~np.isnan(given("UnitPrice"))
+    H = np.where(~np.isnan(rate) & priced, rate * P, fixed_holding)
+    daily = D / 365
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Q = calculate_eoq(D, S, H)
+        price = P
+        if discounts is not None and len(discounts):
+            min_qty, break_price = _price_breaks(catalog, discounts)
+            has_breaks = ~np.isnan(break_price).all(axis=1)
+            q_disc, p_disc, _ = quantity_discount_eoq(D, S, min_qty, break_price, fixed_holding, rate)
+            Q = np.where(has_breaks, q_disc, Q)
+            price = np.where(has_breaks, p_disc, P)
+            H = np.where(~np.isnan(rate) & (priced | has_breaks), rate * price, fixed_holding)
+        ordering, holding, purchase, total = annual_costs(D, Q, S, H, price)
+
+    result = catalog[LEVELS].copy()
+    result[["Period", "Records", "File"]] = history[["Period", "Records", "File"]]
+    result["Annual Demand"] = D
+    result["Daily Demand"] = daily
+    result["Ordering Cost (S)"] = S
+    result["Holding Cost (H)"] = H
+    result["Lead Time (days)"] = L
+    result["Unit Price"] = price
+    result["EOQ"] = Q
+    result["Reorder Point"] = calculate_reorder_point(daily, L)
+    result["Order Cycle (days)"] = np.where(np.isnan(D), np.nan, days_between_orders(Q, np.nan_to_num(daily)))
+    result["Orders per Year"] = D / Q
+    result["Annual Ordering Cost"] = ordering
+    result["Annual Holding Cost"] = holding
+    result["Annual Purchase Cost"] = purchase
+    result["Total Annual Cost"] = total
+    return result.sort_values("Total Annual Cost", ascending=False, na_position="last").reset_index(drop=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EOQ / reorder point for the whole material catalog")
+    parser.add_argument("--root", default="Uploaded")
+    parser.add_argument("--catalog", default=CATALOG_FILE)
+    parser.add_argument("--params", help="CSV/xlsx with per-material S/H/lead time/unit price")
+    parser.add_argument("--discounts", help="CSV/xlsx with per-material quantity price breaks")
+    parser.add_argument("--output", default="catalog_eoq.csv", help=".csv or .xlsx")
+    parser.add_argument("--sort", default="Total Annual Cost", help="column to sort by (descending)")
+    args = parser.parse_args()
+
+    result = catalog_eoq(
+        read_excel_cached(args.catalog),
+        params=read_table(args.params) if args.params else None,
+        discounts=read_table(args.discounts) if args.discounts else None,
+        root=args.root,
+    ).sort_values(args.sort, ascending=False, na_position="last")
+    write_results(result, args.output)
+    print(f"{result['EOQ'].notna().sum()} of {len(result)} materials with demand history, written to {args.output}")
@@ -0,0 +1,82 @@
+import numpy as np
+
+# --------------------- EOQ ---------------------
+def calculate_eoq(annual_demand, ordering_cost, holding_cost):
+    """
+    Economic Order Quantity: EOQ = sqrt(2 * D * S / H)
+    Works on scalars or NumPy arrays (one value per material).
+    """
+    return ((2 * annual_demand * ordering_cost) / holding_cost) ** 0.5
+
+# --------------------- Reorder Point ---------------------
+def calculate_reorder_point(daily_demand, lead_time_days):
+    """
+    Reorder Point = daily demand * lead time (days)
+    """
+    return daily_demand * lead_time_days
+
+# --------------------- Order Cycle ---------------------
+def days_between_orders(eoq, daily_demand):
+    """
+    Days one order lasts: EOQ / daily demand (0 when there is no demand).
+    """
+    daily_demand = np.asarray(daily_demand, dtype=float)
+    cycle = np.divide(eoq, daily_demand, out=np.zeros(np.broadcast(eoq, daily_demand).shape), where=daily_demand > 0)
+    return cycle if cycle.ndim else float(cycle)
+
+def inventory_level(eoq, daily_demand, days):
+    """
+    On-hand inventory after each day in days, starting from a full order of EOQ units.
+    """
+    return eoq - daily_demand * np.asarray(days, dtype=float)
+
+# --------------------- Annual Demand from History ---------------------
+PERIODS_PER_YEAR = {"Weekly": 52, "Monthly": 12, "Quarterly": 4, "Semi-Annual": 2, "Annual": 1}
+
+def annual_demand_from_history(demand, period):
+    """
+    Annual demand D estimated from a demand history: mean demand per period * periods per year.
+    """
+    demand = np.asarray(demand, dtype=float)
+    demand = demand[~np.isnan(demand)]
+    return float(demand.mean() * PERIODS_PER_YEAR[period]) if demand.size else float("nan")
+
+# --------------------- Annual Costs ---------------------
+def annual_costs(annual_demand, order_quantity, ordering_cost, holding_cost, unit_price=0.0):
+    """
+    Annual ordering (D/Q * S), holding (Q/2 * H) and purchase (D * P) cost and their total.
+    """
+    ordering = np.divide(annual_demand * ordering_cost, order_quantity)
+    holding = order_quantity / 2 * holding_cost
+    purchase = annual_demand * unit_price
+    return ordering, holding, purchase, ordering + holding + purchase
+
+# --------------------- Quantity Discounts ---------------------
+def quantity_discount_eoq(annual_demand, ordering_cost, min_qty, unit_price, holding_cost=None, holding_rate=None):
+    """
+    All-units quantity discount EOQ for many materials at once.
+    annual_demand, ordering_cost: (m,). min_qty, unit_price: (m, breaks), NaN-padded.
+    Holding cost is fixed per unit (holding_cost, (m,)) or, where holding_rate (m,) is given
+    and not NaN, that share of each break's unit price. For every break the EOQ is raised to the break's minimum quantity;
+    breaks whose EOQ already reaches the next break are skipped, then the cheapest total cost wins.
+    Returns (order quantity, unit price, total annual cost), each (m,).
+    """
+    D = np.asarray(annual_demand, dtype=float)[:, None]
+    S = np.asarray(ordering_cost, dtype=float)[:, None]
+    min_qty = np.asarray(min_qty, dtype=float)
+    price = np.asarray(unit_price, dtype=float)
+    rate = np.full(D.shape[0], np.nan) if holding_rate is None else np.asarray(holding_rate, dtype=float)
+    fixed = np.full(D.shape[0], np.nan) if holding_cost is None else np.asarray(holding_cost, dtype=float)
+    H = np.where(np.isnan(rate)[:, None], fixed[:, None], rate[:, None] * price)
+    next_min = np.concatenate([min_qty[:, 1:], np.full((min_qty.shape[0], 1), np.nan)], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        q_star = np.sqrt(2 * D * S / H)
+        quantity = np.maximum(q_star, np.nan_to_num(min_qty, nan=0.0))
+        total = annual_costs(D, quantity, S, H, price)[3]
+    feasible = ~np.isnan(price) & ~(q_star >= next_min)
+    total = np.where(feasible, total, np.inf)
+    best = np.argmin(total, axis=1)
+    rows = np.arange(total.shape[0])
+    found = np.isfinite(total[rows, best])
+    pick = lambda values: np.where(found, values[rows, best], np.nan)
+    return pick(quantity), pick(price), pick(total)
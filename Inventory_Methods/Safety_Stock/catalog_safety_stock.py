@@ -0,0 +1,147 @@
+"""
+Catalog-wide statistical safety stock driven by forecast errors.
+
+Each material's demand history under Uploaded/ (the finest period available) is forecast
+with the chosen method, or with every method when method is "auto" (the one with the
+smallest error wins), and the residual standard deviation is scaled to the lead time:
+
+    sigma_LT = sqrt(L * sigma^2 + d^2 * sigma_L^2),   Safety Stock = z(service level) * sigma_LT
+
+Series of equal length are forecast together as one 2-D array, and the per-series
+statistics are cached by workbook signature, so recomputing the catalog after changing
+the service level or lead time only redoes the vectorized formula.
+
+Parameter table (CSV/xlsx): MaterialFamily, MaterialType, MaterialGrade and any of
+    ServiceLevel, LeadTimeDays, LeadTimeStdDays
+
+Run from the repository root:
+    python -m Inventory_Methods.Safety_Stock.catalog_safety_stock --service-level 97.5 --lead-time 14 --output ss.csv
+"""
+import argparse
+import numpy as np
+import pandas as pd
+from Data_Storage.catalog import CATALOG_FILE, LEVELS
+from Data_Storage.sidecar import read_excel_cached
+from Data_Storage.storage import read_series, signature
+from Batch_Forecasting.batch import write_results
+from Forecasting_Cache.result_cache import forecast_cache, make_key
+from Compute_Core.core import ARRAY_FORECASTERS
+from Inventory_Methods.EOQ.catalog_eoq import finest_series, read_table, _key, _lookup
+from Inventory_Methods.Safety_Stock.safety_stock import (
+    PERIOD_DAYS, residual_sigma, lead_time_sigma, statistical_safety_stock)
+
+DEFAULTS = {"ServiceLevel": 95.0, "LeadTimeDays": 7.0, "LeadTimeStdDays": 0.0}
+METHODS = ["auto"] + list(ARRAY_FORECASTERS)
+
+# --------------------- Residual Statistics ---------------------
+def series_stats(series, method, params):
+    """
+    Stats for many series of the same length at once. series: (m, periods)
+    """
+    methods = list(ARRAY_FORECASTERS) if method == "auto" else [method]
+    sigmas = np.stack([residual_sigma(series, ARRAY_FORECASTERS[m](series, **params.get(m, {}))) for m in methods])
+    best = np.nanargmin(np.where(np.isnan(sigmas), np.inf, sigmas), axis=0)
+    sigma = sigmas[best, np.arange(series.shape[0])]
+    if series.shape[1] < 2:
+        sigma = np.full(series.shape[0], np.nan)
+    return series.mean(axis=1), sigma, [methods[b] for b in best]
+
+def residual_stats(root="Uploaded", method="auto", ma_n=3, alpha=0.3, demand_col="Demand"):
+    """
+    {(family, type, grade): {"Period", "File", "Records", "Method", "Mean Demand", "Sigma"}}:
+    mean demand and forecast-error standard deviation per period of each material's finest series.
+    """
+    if method != "auto" and method not in ARRAY_FORECASTERS:
+        raise ValueError(f"Unknown method '{method}', choose from {METHODS}")
+    params = {"Moving Average": {"n": ma_n}, "Exponential Smoothing": {"alpha": alpha}}
+    stats, pending = {}, {}
+    for key, job in finest_series(root).items():
+        cache_key = make_key(repr(signature(job["file"])), f"safety stock: {method}",
+                             {"n": ma_n, "alpha": alpha, "column": demand_col})
+        cached = forecast_cache.get(cache_key)
+        if cached is not None:
+            stats[key] = cached
+            continue
+        df = read_series(job["file"])
+        values = np.nan_to_num(df[demand_col].to_numpy(dtype=float)) if demand_col in df.columns else np.empty(0)
+        pending.setdefault(values.size, []).append((key, job, cache_key, values))
+
+    for size, group in pending.items():
+        if size:
+            mean, sigma, chosen = series_stats(np.stack([values for *_, values in group]), method, params)
+        else:
+            mean, sigma, chosen = np.full(len(group), np.nan), np.full(len(group), np.nan), [None] * len(group)
+        for i, (key, job, cache_key, _) in enumerate(group):
+            stats[key] = forecast_cache.put(cache_key, {
+                "Period": job["period"],
+                "File": job["file"],
+                "Records": size,
+                "Method": chosen[i],
+                "Mean Demand": float(mean[i]),
+                "Sigma": float(sigma[i]),
+            }, job["file"])
+    return stats
+
+# --------------------- Catalog Safety Stock ---------------------
+def catalog_safety_stock(catalog=None, stats=None, params=None, service_level=DEFAULTS["ServiceLevel"],
+                         lead_time_days=DEFAULTS["LeadTimeDays"], lead_time_std_days=DEFAULTS["LeadTimeStdDays"],
+                         method="auto", root="Uploaded", ma_n=3, alpha=0.3):
+    """
+    Exact z-score, lead-time sigma, safety stock and reorder point for every catalog material,
+    sorted by safety stock (materials without a demand history last).
+    catalog: DataFrame with the LEVELS columns (default: the material classification workbook).
+    stats: output of residual_stats(); params: per-material overrides of the scalar defaults.
+    """
+    if catalog is None:
+        catalog = read_excel_cached(CATALOG_FILE)
+    catalog = catalog[LEVELS].drop_duplicates().reset_index(drop=True)
+    catalog["_key"] = [_key(*row) for row in catalog.itertuples(index=False)]
+    stats = residual_stats(root, method, ma_n, alpha) if stats is None else stats
+    history = pd.DataFrame([stats.get(k, {}) for k in catalog["_key"]], index=catalog.index)
+    history = history.reindex(columns=["Period", "File", "Records", "Method", "Mean Demand", "Sigma"])
+
+    values = _lookup(catalog, params) if params is not None and len(params) else pd.DataFrame(index=catalog.index)
+    defaults = {"ServiceLevel": service_level, "LeadTimeDays": lead_time_days, "LeadTimeStdDays": lead_time_std_days}
+    column = lambda name: (values[name].astype(float) if name in values.columns
+                           else pd.Series(np.nan, index=catalog.index)).fillna(defaults[name]).to_numpy()
+    level, lead_days, lead_std_days = column("ServiceLevel"), column("LeadTimeDays"), column("LeadTimeStdDays")
+    days = history["Period"].map(PERIOD_DAYS).to_numpy(dtype=float)
+    mean = history["Mean Demand"].to_numpy(dtype=float)
+    sigma = history["Sigma"].to_numpy(dtype=float)
+
+    lead_time = lead_days / days
+    sigma_lt = lead_time_sigma(sigma, lead_time, mean, lead_std_days / days)
+    safety_stock, z = statistical_safety_stock(level, sigma_lt)
+
+    result = catalog[LEVELS].copy()
+    result[["Period", "Records", "Method", "File"]] = history[["Period", "Records", "Method", "File"]]
+    result["Mean Demand per Period"] = mean
+    result["Forecast Error Std"] = sigma
+    result["Service Level (%)"] = level
+    result["Lead Time (days)"] = lead_days
+    result["Lead Time Std (days)"] = lead_std_days
+    result["Z-Score"] = z
+    result["Lead Time Demand Std"] = sigma_lt
+    result["Safety Stock"] = safety_stock
+    result["Reorder Point"] = mean * lead_time + safety_stock
+    return result.sort_values("Safety Stock", ascending=False, na_position="last").reset_index(drop=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Statistical safety stock for the whole material catalog")
+    parser.add_argument("--root", default="Uploaded")
+    parser.add_argument("--catalog", default=CATALOG_FILE)
+    parser.add_argument("--params", help="CSV/xlsx with per-material service level / lead time / lead time std")
+    parser.add_argument("--method", default="auto", choices=METHODS)
+    parser.add_argument("--service-level", type=float, default=DEFAULTS["ServiceLevel"], help="%")
+    parser.add_argument("--lead-time", type=float, default=DEFAULTS["LeadTimeDays"], help="days")
+    parser.add_argument("--lead-time-std", type=float, default=DEFAULTS["LeadTimeStdDays"], help="days")
+    parser.add_argument("--output", default="catalog_safety_stock.csv", help=".csv or .xlsx")
+    args = parser.parse_args()
+
+    result = catalog_safety_stock(
+        read_excel_cached(args.catalog),
+        params=read_table(args.params) if args.params else None,
+        service_level=args.service_level, lead_time_days=args.lead_time, lead_time_std_days=args.lead_time_std,
+        method=args.method, root=args.root)
+    write_results(result, args.output)
+    print(f"{result['Safety Stock'].notna().sum()} of {len(result)} materials with demand history, written to {args.output}")
@@ -0,0 +1,100 @@
+import numpy as np
+from Inventory_Methods.EOQ.eoq import PERIODS_PER_YEAR
+
+# --------------------- Inverse Normal ---------------------
+# Wichura (1988), Algorithm AS241 PPND16: relative accuracy about 1e-16 over (0, 1).
+# Coefficients are highest order first (np.polyval order).
+_CENTRAL_NUM = [2.5090809287301226727e+3, 3.3430575583588128105e+4, 6.7265770927008700853e+4,
+                4.5921953931549871457e+4, 1.3731693765509461125e+4, 1.9715909503065514427e+3,
+                1.3314166789178437745e+2, 3.3871328727963666080e+0]
+_CENTRAL_DEN = [5.2264952788528545610e+3, 2.8729085735721942674e+4, 3.9307895800092710610e+4,
+                2.1213794301586595867e+4, 5.3941960214247511077e+3, 6.8718700749205790830e+2,
+                4.2313330701600911252e+1, 1.0]
+_INNER_NUM = [7.74545014278341407640e-4, 2.27238449892691845833e-2, 2.41780725177450611770e-1,
+              1.27045825245236838258e+0, 3.64784832476320460504e+0, 5.76949722146069140550e+0,
+              4.63033784615654529590e+0, 1.42343711074968357734e+0]
+_INNER_DEN = [1.05075007164441684324e-9, 5.47593808499534494600e-4, 1.51986665636164571966e-2,
+              1.48103976427480074590e-1, 6.89767334985100004550e-1, 1.67638483018380384940e+0,
+              2.05319162663775882187e+0, 1.0]
+_TAIL_NUM = [2.01033439929228813265e-7, 2.71155556874348757815e-5, 1.24266094738807843860e-3,
+             2.65321895265761230930e-2, 2.96560571828504891230e-1, 1.78482653991729133580e+0,
+             5.46378491116411436990e+0, 6.65790464350110377720e+0]
+_TAIL_DEN = [2.04426310338993978564e-15, 1.42151175831644588870e-7, 1.84631831751005468180e-5,
+             7.86869131145613259100e-4, 1.48753612908506148525e-2, 1.36929880922735805310e-1,
+             5.99832206555887937690e-1, 1.0]
+
+def inverse_normal(p):
+    """
+    Standard normal quantile (inverse CDF) for probabilities p in (0, 1), scalar or array.
+    0 and 1 give -inf / inf, anything outside [0, 1] gives NaN.
+    """
+    p = np.asarray(p, dtype=float)
+    q = p - 0.5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = 0.180625 - q * q
+        z = q * np.polyval(_CENTRAL_NUM, r) / np.polyval(_CENTRAL_DEN, r)
+        r = np.sqrt(-np.log(np.minimum(p, 1.0 - p)))
+        inner = np.polyval(_INNER_NUM, r - 1.6) / np.polyval(_INNER_DEN, r - 1.6)
+        tail = np.polyval(_TAIL_NUM, r - 5.0) / np.polyval(_TAIL_DEN, r - 5.0)
+    outer = np.copysign(np.where(r <= 5.0, inner, tail), q)
+    z = np.where(np.abs(q) <= 0.425, z, outer)
+    z = np.where(p == 0.0, -np.inf, np.where(p == 1.0, np.inf, z))
+    z = np.where((p < 0.0) | (p > 1.0), np.nan, z)
+    return z if z.ndim else float(z)
+
+# --------------------- Z-Score ---------------------
+def z_score(service_level):
+    """
+    Exact z-score for a cycle service level in % (any value between 0 and 100).
+    """
+    return inverse_normal(np.asarray(service_level, dtype=float) / 100)
+
+# --------------------- Demand Variability ---------------------
+PERIOD_DAYS = {period: 365 / per_year for period, per_year in PERIODS_PER_YEAR.items()}
+
+def residual_sigma(demand, forecast):
+    """
+    Standard deviation of one-period forecast errors (RMSE of demand - forecast), skipping
+    the first period whose forecast is the actual itself. demand, forecast: (..., periods)
+    """
+    errors = np.asarray(demand, dtype=float)[..., 1:] - np.asarray(forecast, dtype=float)[..., 1:]
+    with np.errstate(invalid="ignore"):
+        return np.sqrt(np.nanmean(errors * errors, axis=-1))
+
+def lead_time_sigma(sigma, lead_time, mean_demand=0.0, lead_time_std=0.0):
+    """
+    Standard deviation of demand during lead time: sqrt(L * sigma^2 + d^2 * sigma_L^2),
+    with sigma / d the per-period forecast error / mean demand and L / sigma_L the lead time
+    and its standard deviation in the same periods. Works on scalars or arrays.
+    """
+    return np.sqrt(lead_time * np.square(sigma) + np.square(mean_demand) * np.square(lead_time_std))
+
+# --------------------- Safety Stock ---------------------
+def statistical_safety_stock(service_level, std_dev_lead_demand):
+    """
+    Safety Stock = Z * standard deviation of demand during lead time
+    Returns (safety stock, z-score used); scalars or arrays (one per material).
+    """
+    z = z_score(service_level)
+    return z * std_dev_lead_demand, z
+
+def forecast_safety_stock(demand, forecast, period, service_level, lead_time_days, lead_time_std_days=0.0):
+    """
+    Safety stock from a demand history and its forecasts, lead time given in days.
+    Returns a dict with per-period sigma, lead-time sigma, z-score, safety stock and reorder
+    point (mean demand over the lead time + safety stock).
+    """
+    demand = np.asarray(demand, dtype=float)
+    days = PERIOD_DAYS[period]
+    lead_time = np.asarray(lead_time_days, dtype=float) / days
+    mean_demand = np.nanmean(demand, axis=-1)
+    sigma = residual_sigma(demand, forecast)
+    sigma_lt = lead_time_sigma(sigma, lead_time, mean_demand, np.asarray(lead_time_std_days, dtype=float) / days)
+    safety_stock, z = statistical_safety_stock(service_level, sigma_lt)
+    return {
+        "sigma": sigma,
+        "sigma_lead_time": sigma_lt,
+        "z": z,
+        "safety_stock": safety_stock,
+        "reorder_point": mean_demand * lead_time + safety_stock,
+    }
@@ -0,0 +1,107 @@
+"""
+Monte Carlo policy simulation for every material with a demand history under Uploaded/.
+
+Each material's policy is built from its finest demand history and its parameters
+(defaults below, or an optional per-material table), simulated on a process pool
+(one task per material) and summarized in one row: fill rate, stockout frequency and
+annual cost distributions.
+
+Parameter table (CSV/xlsx): MaterialFamily, MaterialType, MaterialGrade and any of
+    OrderingCost, HoldingCost, ServiceLevel, LeadTimeDays, LeadTimeStdDays
+
+Run from the repository root:
+    python -m Inventory_Methods.Simulation.catalog_simulation --policy "(R, S)" --replications 2000 --workers 4
+"""
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from Data_Storage.catalog import LEVELS
+from Data_Storage.storage import read_series
+from Batch_Forecasting.batch import write_results
+from Inventory_Methods.EOQ.catalog_eoq import finest_series, read_table, _key
+from Inventory_Methods.Simulation.simulation import POLICIES, SAMPLERS, build_policy, run_simulation
+
+DEFAULTS = {"OrderingCost": 200.0, "HoldingCost": 25.0, "ServiceLevel": 95.0, "LeadTimeDays": 7.0,
+            "LeadTimeStdDays": 0.0}
+
+# --------------------- One Material ---------------------
+def simulate_material(job, values, policy="(s, Q)", replications=1_000, sampler="bootstrap", backorders=True,
+                      seed=0, demand_col="Demand"):
+    """
+    Build and simulate the policy of one material. Never raises: failures are
+    reported in the 'Error' column of the returned row.
+    """
+    row = {level: job[name] for level, name in zip(LEVELS, ("family", "type", "grade"))}
+    row["Period"] = job["period"]
+    try:
+        demand = read_series(job["file"])[demand_col].to_numpy(dtype=float)
+        demand = demand[~np.isnan(demand)]
+        if demand.size < 2:
+            raise ValueError(f"fewer than 2 '{demand_col}' values")
+        params = build_policy(demand, job["period"], values["OrderingCost"], values["HoldingCost"],
+                              values["ServiceLevel"], values["LeadTimeDays"], values["LeadTimeStdDays"], policy)
+        results = run_simulation(demand, params, replications, sampler=sampler, backorders=backorders, seed=seed)
+        row.update({name: params[name] for name in ("s", "Q", "R", "S") if name in params})
+        row["Lead Time (periods)"] = params["lead_time"]
+        row["Fill Rate (mean)"] = results["Fill Rate"].mean()
+        row["Fill Rate (P5)"] = results["Fill Rate"].quantile(0.05)
+        row["Stockout Frequency (mean)"] = results["Stockout Frequency"].mean()
+        row["Average On Hand"] = results["Average On Hand"].mean()
+        row["Total Cost (mean)"] = results["Total Cost"].mean()
+        row["Total Cost (P95)"] = results["Total Cost"].quantile(0.95)
+        row["Error"] = ""
+    except Exception as e:
+        row["Error"] = str(e)
+    return row
+
+def _simulate_job(args):
+    job, values, options = args
+    return simulate_material(job, values, **options)
+
+# --------------------- Catalog ---------------------
+def catalog_simulation(params=None, root="Uploaded", workers=None, **options):
+    """
+    Simulate every material under root on a process pool (workers=1 runs inline).
+    options are passed to simulate_material (policy, replications, sampler, backorders, seed).
+    Returns (results DataFrame sorted by mean fill rate, stats dict).
+    """
+    overrides = {}
+    if params is not None and len(params):
+        for record in params.to_dict("records"):
+            overrides[_key(*(record[level] for level in LEVELS))] = {
+                k: float(v) for k, v in record.items() if k in DEFAULTS and pd.notna(v)}
+    tasks = [(job, {**DEFAULTS, **overrides.get(key, {})}, options) for key, job in finest_series(root).items()]
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        rows = [_simulate_job(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(_simulate_job, tasks))
+    elapsed = time.perf_counter() - start
+    results = pd.DataFrame(rows)
+    if "Fill Rate (mean)" in results.columns:
+        results = results.sort_values("Fill Rate (mean)", na_position="last").reset_index(drop=True)
+    return results, {"materials": len(tasks), "seconds": elapsed}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo inventory policy simulation for the whole catalog")
+    parser.add_argument("--root", default="Uploaded")
+    parser.add_argument("--params", help="CSV/xlsx with per-material S/H/service level/lead time")
+    parser.add_argument("--policy", default="(s, Q)", choices=POLICIES)
+    parser.add_argument("--sampler", default="bootstrap", choices=SAMPLERS)
+    parser.add_argument("--replications", type=int, default=1_000)
+    parser.add_argument("--lost-sales", action="store_true", help="unmet demand is lost instead of backordered")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: CPU count)")
+    parser.add_argument("--output", default="catalog_simulation.csv", help=".csv or .xlsx")
+    args = parser.parse_args()
+
+    results, stats = catalog_simulation(
+        read_table(args.params) if args.params else None, root=args.root, workers=args.workers,
+        policy=args.policy, replications=args.replications, sampler=args.sampler,
+        backorders=not args.lost_sales, seed=args.seed)
+    write_results(results, args.output)
+    print(f"{stats['materials']} materials x {args.replications} replications in {stats['seconds']:.2f}s, "
+          f"written to {args.output}")
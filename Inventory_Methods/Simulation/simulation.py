@@ -0,0 +1,192 @@
+"""
+Monte Carlo inventory policy simulator.
+
+Replays or bootstraps a demand history against an (s, Q) policy (order Q whenever the
+inventory position drops to s) or an (R, S) policy (every R periods order up to S) and
+reports fill rate, stockouts and cost per replication. All replications advance together
+as NumPy arrays, one period per step; large runs are split across a process pool.
+
+    from Inventory_Methods.Simulation.simulation import build_policy, run_simulation, summarize
+    policy = build_policy(demand, "Weekly", ordering_cost=200, holding_cost=25, service_level=95, lead_time_days=14)
+    summarize(run_simulation(demand, policy, replications=5000, workers=4))
+"""
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from Inventory_Methods.EOQ.eoq import PERIODS_PER_YEAR, calculate_eoq
+from Inventory_Methods.Safety_Stock.safety_stock import PERIOD_DAYS, z_score, residual_sigma, lead_time_sigma
+
+POLICIES = ["(s, Q)", "(R, S)"]
+SAMPLERS = ["bootstrap", "block bootstrap", "replay"]
+DEFAULT_BLOCK = 4
+REPLICATIONS_PER_TASK = 2_000
+METRICS = ["Fill Rate", "Stockout Periods", "Stockout Frequency", "Orders", "Average On Hand",
+           "Holding Cost", "Ordering Cost", "Total Cost"]
+
+# --------------------- Demand Scenarios ---------------------
+def sample_demand(history, replications, horizon, sampler="bootstrap", rng=None, block=DEFAULT_BLOCK):
+    """
+    (replications, horizon) demand paths drawn from a history:
+    bootstrap - periods drawn independently with replacement
+    block bootstrap - consecutive blocks of the history (keeps short-term correlation and seasonality runs)
+    replay - the history itself in order, each replication starting at a random period (wrapping around)
+    """
+    history = np.asarray(history, dtype=float)
+    history = history[~np.isnan(history)]
+    if history.size == 0:
+        raise ValueError("demand history is empty")
+    rng = rng if rng is not None else np.random.default_rng()
+    n = history.size
+    if sampler == "bootstrap":
+        return history[rng.integers(0, n, (replications, horizon))]
+    if sampler == "block bootstrap":
+        blocks = -(-horizon // block)
+        starts = rng.integers(0, n, (replications, blocks, 1))
+        return history[((starts + np.arange(block)) % n).reshape(replications, -1)[:, :horizon]]
+    if sampler == "replay":
+        starts = rng.integers(0, n, (replications, 1))
+        return history[(starts + np.arange(horizon)) % n]
+    raise ValueError(f"Unknown sampler '{sampler}', choose from {SAMPLERS}")
+
+# --------------------- Policy ---------------------
+def lead_time_periods(lead_time_days, period):
+    """
+    Lead time in whole history periods (at least one: an order arrives at the earliest next period).
+    """
+    return max(1, int(np.rint(lead_time_days / PERIOD_DAYS[period])))
+
+def build_policy(demand, period, ordering_cost, holding_cost, service_level, lead_time_days,
+                 lead_time_std_days=0.0, policy="(s, Q)", forecast=None, review_periods=None):
+    """
+    Policy parameters from the EOQ / reorder point / safety stock formulas on pages 5 and 6.
+    (s, Q): Q = EOQ, s = mean demand over the lead time + z * sigma_LT.
+    (R, S): R = EOQ / mean demand (periods, unless review_periods is given),
+            S = mean demand over R + L + z * sigma over R + L.
+    sigma is the residual std of forecast (default: the naive forecast) per period.
+    """
+    demand = np.asarray(demand, dtype=float)
+    demand = demand[~np.isnan(demand)]
+    if forecast is None:
+        forecast = np.concatenate([demand[:1], demand[:-1]])
+    mean = float(demand.mean())
+    sigma = float(residual_sigma(demand, forecast))
+    lead = lead_time_periods(lead_time_days, period)
+    lead_std = lead_time_std_days / PERIOD_DAYS[period]
+    z = float(z_score(service_level))
+    order_qty = float(calculate_eoq(mean * PERIODS_PER_YEAR[period], ordering_cost, holding_cost))
+    params = {"policy": policy, "period": period, "lead_time": lead, "lead_time_std": lead_std,
+              "ordering_cost": float(ordering_cost), "holding_cost": float(holding_cost), "z": z}
+    if policy == "(s, Q)":
+        params.update(s=mean * lead + z * float(lead_time_sigma(sigma, lead, mean, lead_std)), Q=max(order_qty, 1.0))
+    elif policy == "(R, S)":
+        review = review_periods or (max(1, int(np.rint(order_qty / mean))) if mean > 0 else 1)
+        exposure = review + lead
+        params.update(R=int(review), S=mean * exposure + z * float(lead_time_sigma(sigma, exposure, mean, lead_std)))
+    else:
+        raise ValueError(f"Unknown policy '{policy}', choose from {POLICIES}")
+    return params
+
+# --------------------- Simulation Kernel ---------------------
+def simulate_policy(demand, policy, rng=None, backorders=True, initial=None):
+    """
+    Run one policy against (replications, horizon) demand paths.
+    Each period: receive arrivals, serve demand (unmet demand is backordered or lost),
+    review the inventory position and place orders arriving lead_time periods later.
+    Returns a dict of per-replication arrays (METRICS), costs annualized.
+    """
+    demand = np.asarray(demand, dtype=float)
+    reps, horizon = demand.shape
+    rng = rng if rng is not None else np.random.default_rng()
+    lead, lead_std = policy["lead_time"], policy.get("lead_time_std", 0.0)
+    max_lead = lead + int(np.ceil(4 * lead_std)) + 1
+    arrivals = np.zeros((reps, horizon + max_lead + 1))
+    rows = np.arange(reps)
+    sq = policy["policy"] == "(s, Q)"
+    start = policy["s"] + policy["Q"] if sq else policy["S"]
+    on_hand = np.full(reps, float(start if initial is None else initial))
+    on_order = np.zeros(reps)
+    served = np.zeros(reps)
+    stockouts = np.zeros(reps)
+    orders = np.zeros(reps)
+    held = np.zeros(reps)
+
+    for t in range(horizon):
+        on_hand += arrivals[:, t]
+        on_order -= arrivals[:, t]
+        d = demand[:, t]
+        available = np.maximum(on_hand, 0.0)
+        served += np.minimum(d, available)
+        stockouts += d > available
+        on_hand = on_hand - d if backorders else np.maximum(on_hand - d, 0.0)
+        held += np.maximum(on_hand, 0.0)
+
+        position = on_hand + on_order
+        if sq:
+            qty = np.where(position <= policy["s"],
+                           (np.floor((policy["s"] - position) / policy["Q"]) + 1) * policy["Q"], 0.0)
+        elif t % policy["R"] == 0:
+            qty = np.maximum(policy["S"] - position, 0.0)
+        else:
+            continue
+        placed = qty > 0
+        if not placed.any():
+            continue
+        if lead_std > 0:
+            delay = np.clip(np.rint(rng.normal(lead, lead_std, reps)), 1, max_lead).astype(int)
+        else:
+            delay = lead
+        arrivals[rows, t + delay] += qty
+        on_order += qty
+        orders += placed
+
+    total = demand.sum(axis=1)
+    years = horizon / PERIODS_PER_YEAR[policy["period"]]
+    holding = held / horizon * policy["holding_cost"]
+    ordering = orders * policy["ordering_cost"] / years
+    return {
+        "Fill Rate": np.divide(served, total, out=np.ones(reps), where=total > 0),
+        "Stockout Periods": stockouts,
+        "Stockout Frequency": stockouts / horizon,
+        "Orders": orders,
+        "Average On Hand": held / horizon,
+        "Holding Cost": holding,
+        "Ordering Cost": ordering,
+        "Total Cost": holding + ordering,
+    }
+
+# --------------------- Runner ---------------------
+def _simulate_chunk(args):
+    history, policy, replications, horizon, sampler, backorders, seed = args
+    rng = np.random.default_rng(seed)
+    return simulate_policy(sample_demand(history, replications, horizon, sampler, rng), policy, rng, backorders)
+
+def run_simulation(history, policy, replications=1_000, horizon=None, sampler="bootstrap", backorders=True,
+                   seed=None, workers=1, per_task=REPLICATIONS_PER_TASK):
+    """
+    Simulate replications of the policy against demand paths drawn from history
+    (horizon defaults to the history length). Chunks of per_task replications run on a
+    process pool when workers > 1; every chunk gets an independent random stream, so
+    results depend on the seed and per_task but not on the number of workers.
+    Returns a DataFrame with one row per replication.
+    """
+    history = np.asarray(history, dtype=float)
+    horizon = horizon or history.size
+    sizes = [per_task] * (replications // per_task) + ([replications % per_task] if replications % per_task else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(history, policy, size, horizon, sampler, backorders, s) for size, s in zip(sizes, seeds)]
+    if workers == 1 or len(tasks) <= 1:
+        chunks = [_simulate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_simulate_chunk, tasks))
+    return pd.DataFrame({metric: np.concatenate([c[metric] for c in chunks]) for metric in METRICS})
+
+def summarize(results, percentiles=(5, 50, 95)):
+    """
+    Mean and percentiles of every metric over the replications.
+    """
+    table = pd.DataFrame({"Mean": results.mean()})
+    for p in percentiles:
+        table[f"P{p}"] = results.quantile(p / 100)
+    table.index.name = "Metric"
+    return table.reset_index()
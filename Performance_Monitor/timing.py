@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import logging
+import threading
+import functools
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+LOG_FILE = "logs/timings.jsonl"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+
+_local = threading.local()
+_noop = nullcontext()
+_logger = None
+_logger_guard = threading.Lock()
+
+# --------------------- Rerun Scope ---------------------
+def begin_rerun(enabled):
+    """
+    Start collecting stage timings for the current script run (one Streamlit rerun runs on
+    one thread). When disabled, every stage()/@timed call is a single attribute check.
+    """
+    _local.records = [] if enabled else None
+    _local.depth = 0
+    _local.started = time.perf_counter()
+
+def is_enabled():
+    return getattr(_local, "records", None) is not None
+
+def end_rerun(**context):
+    """
+    Stop collecting, append the rerun's timings to the rotating JSONL log and return them
+    as {"stage", "ms", "start_ms", "depth"} dicts in start order (empty when instrumentation was off).
+    """
+    records = getattr(_local, "records", None)
+    _local.records = None
+    if records is None:
+        return []
+    total = (time.perf_counter() - _local.started) * 1000
+    records = sorted(records, key=lambda r: r["start_ms"]) + [{"stage": "total rerun", "ms": total, "start_ms": 0.0, "depth": 0}]
+    _log({"ts": datetime.now().isoformat(timespec="milliseconds"), **context, "stages": records})
+    return records
+
+# --------------------- Stages ---------------------
+@contextmanager
+def _timed_stage(name):
+    records = _local.records
+    depth = _local.depth
+    _local.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.depth = depth
+        records.append({
+            "stage": name,
+            "ms": (time.perf_counter() - start) * 1000,
+            "start_ms": (start - _local.started) * 1000,
+            "depth": depth,
+        })
+
+def stage(name):
+    """
+    Context manager timing one stage of the current rerun (no-op when instrumentation is off).
+    """
+    if getattr(_local, "records", None) is None:
+        return _noop
+    return _timed_stage(name)
+
+def record_stage(name, start, seconds):
+    """
+    Add a stage measured elsewhere (e.g. on a worker thread, whose own stages are not
+    collected) to the current rerun. start is a time.perf_counter() value.
+    """
+    records = getattr(_local, "records", None)
+    if records is not None:
+        records.append({"stage": name, "ms": seconds * 1000, "start_ms": (start - _local.started) * 1000,
+                        "depth": _local.depth})
+
+def timed(name=None):
+    """
+    Decorator version of stage(); the stage name defaults to the function name.
+    """
+    def decorator(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if getattr(_local, "records", None) is None:
+                return fn(*args, **kwargs)
+            with _timed_stage(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# --------------------- Log ---------------------
+def _log(entry):
+    global _logger
+    with _logger_guard:
+        if _logger is None:
+            os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+            handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _logger = logging.getLogger("stage_timings")
+            _logger.setLevel(logging.INFO)
+            _logger.propagate = False
+            _logger.addHandler(handler)
+    _logger.info(json.dumps(entry, default=str))
@@ -0,0 +1,79 @@
+"""
+Coarser-period series derived from one finest-grain demand history.
+
+Only the finest series (e.g. Weekly) has to be uploaded: Monthly, Quarterly, Semi-Annual
+and Annual tables are sums over consecutive buckets of it. Weeks roll up to months on a
+4-4-5 calendar (13-week quarters, 52-week years); every other step is a whole number of
+periods. An incomplete trailing bucket is left out so the last period is not understated.
+
+All rollups of a workbook are computed together from one cumulative sum and cached under
+its data signature (size, mtime, journal size), so switching periods is a cache lookup and
+an edit to the finest series is picked up on the next access. Rollups have their own cache,
+so forecast results filling the forecast cache never evict them.
+"""
+import numpy as np
+import pandas as pd
+from Data_Storage.storage import read_series, signature
+from Forecasting_Cache.result_cache import ForecastCache, make_key
+from Performance_Monitor.timing import timed
+
+PERIODS = ["Weekly", "Monthly", "Quarterly", "Semi-Annual", "Annual"]
+PERIOD_COLUMNS = {"Weekly": "Week", "Monthly": "Month", "Quarterly": "Quarter", "Semi-Annual": "Half", "Annual": "Year"}
+PERIODS_PER_YEAR = {"Weekly": 52, "Monthly": 12, "Quarterly": 4, "Semi-Annual": 2, "Annual": 1}
+WEEKS_PER_MONTH = [4, 4, 5]
+ROLLUP_CACHE_BYTES = 32 * 1024 * 1024
+
+rollup_cache = ForecastCache(max_bytes=ROLLUP_CACHE_BYTES)
+
+# --------------------- Buckets ---------------------
+def bucket_edges(periods, source, target):
+    """
+    Start offsets of the complete target buckets in a source series of length periods,
+    plus the end of the last one: sums are cum[edges[1:]] - cum[edges[:-1]].
+    """
+    if PERIODS.index(target) < PERIODS.index(source):
+        raise ValueError(f"Cannot derive {target} from the coarser {source} series")
+    if source == "Weekly" and target == "Monthly":
+        pattern = WEEKS_PER_MONTH
+    else:
+        pattern = [PERIODS_PER_YEAR[source] // PERIODS_PER_YEAR[target]]
+    sizes = np.resize(pattern, periods // min(pattern) + 1)
+    edges = np.concatenate([[0], np.cumsum(sizes)])
+    return edges[edges <= periods]
+
+def rollup_frame(df, source, target, first_col=None):
+    """
+    Sum every numeric column of a source-period table over complete target-period buckets.
+    The period number column (first_col, default the source's) becomes the target's, numbered 1..n.
+    """
+    first_col = first_col or PERIOD_COLUMNS[source]
+    values = df.drop(columns=[first_col], errors="ignore").select_dtypes("number")
+    edges = bucket_edges(len(df), source, target)
+    cum = np.zeros((len(df) + 1, values.shape[1]))
+    np.cumsum(values.to_numpy(dtype=float), axis=0, out=cum[1:])
+    sums = cum[edges[1:]] - cum[edges[:-1]]
+    result = pd.DataFrame(sums, columns=values.columns)
+    result.insert(0, PERIOD_COLUMNS[target], np.arange(1, len(result) + 1))
+    return result
+
+# --------------------- Cached Rollups ---------------------
+@timed("rollup: all periods")
+def rollups(file_path, source):
+    """
+    {period: DataFrame} for the source period and every coarser one, cached per data signature.
+    file_path is a workbook path or a database key (Data_Storage.storage).
+    """
+    def compute():
+        df = read_series(file_path).fillna(0).reset_index(drop=True)
+        tables = {source: df}
+        for target in PERIODS[PERIODS.index(source) + 1:]:
+            tables[target] = rollup_frame(df, source, target, df.columns[0])
+        return tables
+    key = make_key(repr(signature(file_path)), "rollups", {"source": source})
+    return rollup_cache.get_or_compute(key, compute, file_path)
+
+def derived_table(file_path, source, target):
+    """
+    The target-period table derived from a source-period workbook (a copy, safe to modify).
+    """
+    return rollups(file_path, source)[target].copy()
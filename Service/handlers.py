@@ -0,0 +1,170 @@
+"""
+Request handlers of the HTTP service. Pure functions over JSON-ready dicts built on
+Compute_Core (the same logic as the forecasting, EOQ and safety stock pages), so they
+run in worker processes without streamlit or matplotlib.
+"""
+import numpy as np
+from Compute_Core.core import (
+    ARRAY_FORECASTERS, METRICS, SIGNED_METRICS, tune_parameters, error_metrics,
+    calculate_eoq, calculate_reorder_point, days_between_orders, statistical_safety_stock,
+    PERIOD_DAYS, residual_sigma, forecast_safety_stock)
+
+DEFAULT_MA_N = 3
+DEFAULT_ALPHA = 0.3
+
+def _demand(item):
+    demand = np.asarray(item.get("demand", []), dtype=float)
+    if demand.ndim != 1 or demand.size < 2:
+        raise ValueError("'demand' must be a list of at least 2 numbers")
+    if not np.isfinite(demand).all():
+        raise ValueError("'demand' must not contain missing or infinite values")
+    return demand
+
+def _records(names, metrics):
+    return {name: {metric: float(metrics[metric][i]) for metric in METRICS} for i, name in enumerate(names)}
+
+# --------------------- Forecast ---------------------
+def next_period_forecast(method, demand, forecast, ma_n=DEFAULT_MA_N, alpha=DEFAULT_ALPHA):
+    """
+    One-step-ahead forecast after the last observed period.
+    """
+    if method == "Naive":
+        return float(demand[-1])
+    if method == "Moving Average":
+        return float(demand[-ma_n:].mean())
+    return float(alpha * demand[-1] + (1 - alpha) * forecast[-1])
+
+def forecast(item):
+    """
+    {"demand": [...], "method": "auto" | "Naive" | "Moving Average" | "Exponential Smoothing",
+     "criteria": "MAD" | "MSE" | ..., "n": 3, "alpha": 0.3, "tune": false}
+    "auto" runs every method and returns the best one by criteria, like page_forecasting;
+    the signed Bias and Tracking Signal rank by absolute value (closest to zero wins).
+    """
+    demand = _demand(item)
+    method = item.get("method", "auto")
+    criteria = item.get("criteria", "MAD")
+    if method != "auto" and method not in ARRAY_FORECASTERS:
+        raise ValueError(f"Unknown method '{method}', choose 'auto' or one of {list(ARRAY_FORECASTERS)}")
+    if criteria not in METRICS:
+        raise ValueError(f"Unknown criteria '{criteria}', choose from {METRICS}")
+    ma_n, alpha = int(item.get("n", DEFAULT_MA_N)), float(item.get("alpha", DEFAULT_ALPHA))
+    if item.get("tune"):
+        tuned = tune_parameters(demand, criteria="MSE" if criteria in ("MSE", "RMSE") else "MAD")
+        ma_n, alpha = int(tuned["ma_n"]), float(tuned["alpha"])
+    if ma_n < 1 or not 0 < alpha <= 1:
+        raise ValueError("'n' must be >= 1 and 'alpha' in (0, 1]")
+    params = {"Naive": {}, "Moving Average": {"n": ma_n}, "Exponential Smoothing": {"alpha": alpha}}
+    methods = list(ARRAY_FORECASTERS) if method == "auto" else [method]
+    forecasts = {m: ARRAY_FORECASTERS[m](demand, **params[m]) for m in methods}
+    metrics = error_metrics(demand, np.column_stack(list(forecasts.values())))
+    scores = np.abs(metrics[criteria]) if criteria in SIGNED_METRICS else metrics[criteria]
+    best = methods[int(np.argmin(scores))]
+    return {
+        "method": best,
+        "params": params[best],
+        "forecast": forecasts[best].tolist(),
+        "next_forecast": next_period_forecast(best, demand, forecasts[best], ma_n, alpha),
+        "criteria": criteria,
+        "errors": _records(methods, metrics),
+    }
+
+# --------------------- Error Metrics ---------------------
+def errors(item):
+    """
+    {"demand": [...], "forecasts": {"name": [...], ...}} -> every metric for every forecast.
+    """
+    demand = _demand(item)
+    forecasts = item.get("forecasts") or {}
+    if not isinstance(forecasts, dict) or not forecasts:
+        raise ValueError("'forecasts' must be an object of {name: [values]}")
+    matrix = np.column_stack([np.asarray(values, dtype=float) for values in forecasts.values()])
+    if matrix.shape[0] != demand.size:
+        raise ValueError("every forecast must have the same length as 'demand'")
+    return {"errors": _records(list(forecasts), error_metrics(demand, matrix))}
+
+# --------------------- EOQ ---------------------
+def eoq(item):
+    """
+    {"annual_demand", "ordering_cost", "holding_cost", "lead_time_days", "daily_demand" (default D / 365)}
+    """
+    annual_demand = float(item["annual_demand"])
+    ordering_cost = float(item["ordering_cost"])
+    holding_cost = float(item["holding_cost"])
+    if not annual_demand >= 0:
+        raise ValueError("Annual demand (D) must not be negative.")
+    if not ordering_cost >= 0:
+        raise ValueError("Ordering cost (S) must not be negative.")
+    if not holding_cost > 0:
+        raise ValueError("Holding cost (H) must be greater than zero.")
+    daily_demand = float(item.get("daily_demand", annual_demand / 365))
+    order_quantity = calculate_eoq(annual_demand, ordering_cost, holding_cost)
+    return {
+        "eoq": order_quantity,
+        "reorder_point": calculate_reorder_point(daily_demand, float(item.get("lead_time_days", 7))),
+        "days_between_orders": days_between_orders(order_quantity, daily_demand),
+    }
+
+# --------------------- Safety Stock ---------------------
+def safety_stock(item):
+    """
+    {"fixed": units}, {"service_level": %, "std_dev_lead_demand": units} or, to derive the
+    variability from forecast errors, {"service_level": %, "demand": [...], "method": "auto" | name,
+    "period": "Weekly", "lead_time_days": 7, "lead_time_std_days": 0, "n": 3, "alpha": 0.3}
+    """
+    if "fixed" in item:
+        return {"safety_stock": float(item["fixed"]), "method": "fixed"}
+    service_level = float(item.get("service_level", 95.0))
+    if not 0 < service_level < 100:
+        raise ValueError("'service_level' must be between 0 and 100 (exclusive)")
+    if "demand" not in item:
+        value, z = statistical_safety_stock(service_level, float(item["std_dev_lead_demand"]))
+        return {"safety_stock": value, "z_score": z, "method": "statistical"}
+    demand = _demand(item)
+    period = item.get("period", "Weekly")
+    if period not in PERIOD_DAYS:
+        raise ValueError(f"Unknown period '{period}', choose from {list(PERIOD_DAYS)}")
+    method = item.get("method", "auto")
+    if method != "auto" and method not in ARRAY_FORECASTERS:
+        raise ValueError(f"Unknown method '{method}', choose 'auto' or one of {list(ARRAY_FORECASTERS)}")
+    params = {"Moving Average": {"n": int(item.get("n", DEFAULT_MA_N))},
+              "Exponential Smoothing": {"alpha": float(item.get("alpha", DEFAULT_ALPHA))}}
+    methods = list(ARRAY_FORECASTERS) if method == "auto" else [method]
+    forecasts = {m: ARRAY_FORECASTERS[m](demand, **params.get(m, {})) for m in methods}
+    best = min(methods, key=lambda m: residual_sigma(demand, forecasts[m]))
+    stats = forecast_safety_stock(demand, forecasts[best], period, service_level,
+                                  float(item.get("lead_time_days", 7)), float(item.get("lead_time_std_days", 0)))
+    return {
+        "safety_stock": float(stats["safety_stock"]),
+        "z_score": float(stats["z"]),
+        "sigma": float(stats["sigma"]),
+        "sigma_lead_time": float(stats["sigma_lead_time"]),
+        "reorder_point": float(stats["reorder_point"]),
+        "forecast_method": best,
+        "method": "statistical",
+    }
+
+ENDPOINTS = {
+    "/forecast": forecast,
+    "/errors": errors,
+    "/eoq": eoq,
+    "/safety-stock": safety_stock,
+}
+
+def run_items(path, items):
+    """
+    Handle a chunk of batch items in one worker call. Never raises: a failing item
+    gets {"error": message} in its slot so the rest of the batch still succeeds.
+    """
+    handler = ENDPOINTS[path]
+    results = []
+    for item in items:
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("each item must be a JSON object")
+            results.append(handler(item))
+        except KeyError as e:
+            results.append({"error": f"missing field {e}"})
+        except (ValueError, TypeError) as e:
+            results.append({"error": str(e)})
+    return results
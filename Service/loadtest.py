@@ -0,0 +1,121 @@
+"""
+Load test for the HTTP service: N concurrent keep-alive clients send requests with
+synthetic SKUs and the script reports p50/p99 latency and throughput.
+
+Run from the repository root (start the server first, or pass --spawn):
+    python -m Service.loadtest --endpoint /forecast --requests 2000 --concurrency 32 --batch 10
+    python -m Service.loadtest --spawn --workers 4
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import subprocess
+import numpy as np
+from Service.server import DEFAULT_PORT
+
+# --------------------- Payloads ---------------------
+def make_item(endpoint, rng, periods):
+    if endpoint == "/forecast":
+        return {"demand": rng.poisson(20, periods).tolist(), "method": "auto", "criteria": "MAD"}
+    if endpoint == "/errors":
+        demand = rng.poisson(20, periods)
+        return {"demand": demand.tolist(), "forecasts": {"naive": np.roll(demand, 1).tolist()}}
+    if endpoint == "/eoq":
+        return {"annual_demand": float(rng.uniform(1e3, 1e5)), "ordering_cost": float(rng.uniform(50, 500)),
+                "holding_cost": float(rng.uniform(1, 50)), "lead_time_days": int(rng.integers(1, 30))}
+    return {"service_level": float(rng.uniform(80, 99.9)), "std_dev_lead_demand": float(rng.uniform(1, 100))}
+
+def make_body(endpoint, batch, periods, seed):
+    rng = np.random.default_rng(seed)
+    items = [make_item(endpoint, rng, periods) for _ in range(batch)]
+    return json.dumps({"items": items} if batch > 1 else items[0]).encode("utf-8")
+
+# --------------------- Client ---------------------
+async def request(reader, writer, host, endpoint, body):
+    writer.write(f"POST {endpoint} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status = int(head.split(" ", 2)[1])
+    length = next(int(line.split(":", 1)[1]) for line in head.split("\r\n") if line.lower().startswith("content-length"))
+    await reader.readexactly(length)
+    return status
+
+async def client(host, port, endpoint, bodies, counter, total, latencies, failures):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < total:
+            i = counter[0]
+            counter[0] += 1
+            start = time.perf_counter()
+            status = await request(reader, writer, host, endpoint, bodies[i % len(bodies)])
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+async def run_load(host, port, endpoint, total, concurrency, batch, periods):
+    bodies = [make_body(endpoint, batch, periods, seed) for seed in range(16)]
+    latencies, failures, counter = [], [], [0]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, endpoint, bodies, counter, total, latencies, failures)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    ms = np.array(latencies) * 1e3
+    return {
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "failures": len(failures),
+        "concurrency": concurrency,
+        "items_per_request": batch,
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+        "requests_per_s": len(latencies) / elapsed,
+        "items_per_s": len(latencies) * batch / elapsed,
+    }
+
+async def wait_for_server(host, port, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP service load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--endpoint", default="/forecast", choices=["/forecast", "/errors", "/eoq", "/safety-stock"])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch", type=int, default=1, help="SKUs per request")
+    parser.add_argument("--periods", type=int, default=156, help="demand history length per SKU")
+    parser.add_argument("--spawn", action="store_true", help="start a server for the duration of the test")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes of the spawned server")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        command = [sys.executable, "-m", "Service.server", "--host", args.host, "--port", str(args.port)]
+        if args.workers:
+            command += ["--workers", str(args.workers)]
+        server = subprocess.Popen(command)
+    try:
+        asyncio.run(wait_for_server(args.host, args.port))
+        report = asyncio.run(run_load(args.host, args.port, args.endpoint, args.requests,
+                                      args.concurrency, args.batch, args.periods))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    for key, value in report.items():
+        print(f"{key:<18} {value:,.2f}" if isinstance(value, float) else f"{key:<18} {value}")
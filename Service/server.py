@@ -0,0 +1,168 @@
+"""
+Local HTTP/JSON service for forecasts, error metrics, EOQ and safety stock.
+
+asyncio handles the connections (HTTP/1.1 with keep-alive); the number crunching
+runs on a bounded process pool. Every POST endpoint takes either one JSON object
+or {"items": [...]} for many SKUs in one call.
+
+    POST /forecast       {"demand": [...], "method": "auto", "criteria": "MAD"}
+    POST /errors         {"demand": [...], "forecasts": {"name": [...]}}
+    POST /eoq            {"annual_demand": 12000, "ordering_cost": 200, "holding_cost": 25, "lead_time_days": 7}
+    POST /safety-stock   {"service_level": 95, "std_dev_lead_demand": 50}
+                         {"service_level": 99.9, "demand": [...], "period": "Weekly", "lead_time_days": 14}
+    GET  /health
+
+Run from the repository root:
+    python -m Service.server --port 8765 --workers 4
+"""
+import os
+import math
+import json
+import signal
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from Service.handlers import ENDPOINTS, run_items
+
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_BATCH_ITEMS = 10_000
+ITEMS_PER_TASK = 64
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def json_safe(value):
+    """
+    value with NaN and infinities replaced by None (JSON has no literal for them, e.g. the
+    MAPE of an all-zero demand history).
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(v) for v in value]
+    return value
+
+# --------------------- Service ---------------------
+class ForecastService:
+    """
+    One process pool shared by all connections; at most max_pending chunks are queued
+    on it at once, so a burst of requests waits in asyncio instead of piling up work.
+    """
+    def __init__(self, workers=None, max_pending=None, items_per_task=ITEMS_PER_TASK):
+        self.workers = workers or os.cpu_count() or 1
+        self.items_per_task = items_per_task
+        self.pool = ProcessPoolExecutor(self.workers)
+        self.slots = asyncio.Semaphore(max_pending or self.workers * 4)
+        self.requests = 0
+
+    async def _run_chunk(self, path, items):
+        async with self.slots:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, run_items, path, items)
+
+    async def dispatch(self, method, path, body):
+        if path == "/health":
+            return {"status": "ok", "workers": self.workers, "requests": self.requests}
+        if path not in ENDPOINTS:
+            raise HTTPError(404, f"Unknown endpoint '{path}', choose from {sorted(ENDPOINTS) + ['/health']}")
+        if method != "POST":
+            raise HTTPError(405, f"{path} expects POST")
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON: {e}")
+        batch = isinstance(payload, dict) and "items" in payload
+        items = payload["items"] if batch else [payload]
+        if not isinstance(items, list) or len(items) > MAX_BATCH_ITEMS:
+            raise HTTPError(400, f"'items' must be a list of at most {MAX_BATCH_ITEMS} objects")
+        chunks = [items[i:i + self.items_per_task] for i in range(0, len(items), self.items_per_task)]
+        results = [r for chunk in await asyncio.gather(*(self._run_chunk(path, c) for c in chunks)) for r in chunk]
+        if batch:
+            return {"results": results}
+        if "error" in results[0]:
+            raise HTTPError(400, results[0]["error"])
+        return results[0]
+
+    # ----- HTTP -----
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                # The body of a bad request cannot be skipped reliably, so the connection is closed
+                if length < 0:
+                    status, response, keep_alive = 400, {"error": "Content-Length must be a non-negative integer"}, False
+                elif length > MAX_BODY_BYTES:
+                    status, response, keep_alive = 413, {"error": f"Body larger than {MAX_BODY_BYTES} bytes"}, False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    self.requests += 1
+                    try:
+                        status, response = 200, await self.dispatch(method, target.split("?", 1)[0], body)
+                    except HTTPError as e:
+                        status, response = e.status, {"error": str(e)}
+                    except Exception as e:
+                        status, response = 500, {"error": f"{type(e).__name__}: {e}"}
+                data = json.dumps(json_safe(response), allow_nan=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """
+        Serve until SIGINT/SIGTERM, then shut the worker pool down so no worker outlives the server.
+        """
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving on http://{host}:{port} with {self.workers} worker process(es)", flush=True)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Forecasting / inventory HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=None, help="chunks queued on the pool at once")
+    args = parser.parse_args()
+    asyncio.run(ForecastService(args.workers, args.max_pending).serve(args.host, args.port))
@@ -1,8 +1,34 @@
 # app.py
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
-import matplotlib.pyplot as plt
+import uuid
+from functools import partial
+from Data_Storage.storage import (
+    read_series, append_op, undo_last, history, compact, list_series, finer_sources, save_upload,
+    using_database, is_database_key, signature, DATABASE)
+from Data_Storage.catalog import get_catalog
+from Data_Storage.shared import shared_datasets
+from Compute_Core.core import (
+    run_naive_forecasting, run_moving_average_forecasting, run_exponential_forecasting, run_holt_forecasting,
+    run_holt_winters_forecasting, FORECAST_COLUMNS, seasonal_fit, tune_parameters, tune_holt, tune_holt_winters,
+    error_table, calculate_eoq, calculate_reorder_point, days_between_orders, inventory_level,
+    statistical_safety_stock, forecast_safety_stock, annual_demand_from_history, ARRAY_FORECASTERS,
+    backtest, best_per_method, BACKTEST_HORIZON)
+from Inventory_Methods.EOQ.catalog_eoq import catalog_eoq, read_table
+from Inventory_Methods.Safety_Stock.catalog_safety_stock import catalog_safety_stock, METHODS as SAFETY_STOCK_METHODS
+from Inventory_Methods.Simulation.simulation import (
+    POLICIES as SIM_POLICIES, SAMPLERS as SIM_SAMPLERS, REPLICATIONS_PER_TASK as SIM_PER_TASK,
+    build_policy, run_simulation, summarize)
+from Compute_Core.evaluation import evaluate_concurrently, DEFAULT_BUDGET_SECONDS
+from Forecasting_Cache.result_cache import forecast_cache, frame_digest, make_key
+from Forecasting_Cache.session_results import ForecastResults, session_memory
+from Forecasting_Methods.Incremental_Method.incremental import (
+    record_append, record_rewrite, state_for, METHODS as INCREMENTAL_METHODS)
+from Chart_Rendering.charts import line_chart, chart_cache
+from Period_Rollup.rollup import derived_table, rollup_cache
+from Performance_Monitor.timing import begin_rerun, end_rerun, stage, timed, record_stage
 # ================= External Styling =================
 with open("style.css") as css_file:
     st.markdown(f"<style>{css_file.read()}</style>", unsafe_allow_html=True)
@@ -31,9 +57,12 @@ if "show_table" not in st.session_state:
     st.session_state.show_table = False
 if "editing" not in st.session_state:
     st.session_state.editing = False
+if "timing_history" not in st.session_state:
+    st.session_state.timing_history = []
+begin_rerun(st.session_state.get("debug_timings", False))
 # ================= Load Material Classification =================
 try:
-    df_class = pd.read_excel("Database/Classification-of-Material.xlsx")
+    catalog = get_catalog("Database/Classification-of-Material.xlsx")
 except Exception as e:
     st.error(f"Cannot read 'Classification-of-Material.xlsx': {e}")
     st.stop()
@@ -48,17 +77,15 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ================= Helper Functions =================
-def select_material(df):
+def select_material(catalog):
     st.markdown("## Select a Target Material")
     c1, c2, c3 = st.columns(3)
     with c1:
-        family = st.selectbox("Material Family", sorted(df["MaterialFamily"].unique()), key="fam_sel")
-    family_df = df[df["MaterialFamily"] == family]
+        family = st.selectbox("Material Family", catalog.families(), key="fam_sel")
     with c2:
-        m_type = st.selectbox("Material Type", sorted(family_df["MaterialType"].unique()), key="type_sel")
-    type_df = family_df[family_df["MaterialType"] == m_type]
+        m_type = st.selectbox("Material Type", catalog.types(family), key="type_sel")
     with c3:
-        grade = st.selectbox("Material Grade", sorted(type_df["MaterialGrade"].unique()), key="grade_sel")
+        grade = st.selectbox("Material Grade", catalog.grades(family, m_type), key="grade_sel")
     st.caption(f"Selected → **{family} / {m_type} / {grade}**")
     st.divider()
     return {"family": family, "type": m_type, "grade": grade}
@@ -70,29 +97,41 @@ def select_period():
 def choose_data_source(period, family, m_type, grade):
     st.markdown("## Data Source")
     source = st.radio("Choose source", ["Upload Excel File", "Choose Existing File"], horizontal=True, key="data_source_radio")
-    folder = f"Uploaded/{family}/{m_type}/{grade}/{period}"
-    os.makedirs(folder, exist_ok=True)
-    selected_file = None
+    selected_file = derived_from = None
     if source == "Upload Excel File":
         uploaded = st.file_uploader("Upload your Excel file", type=["xlsx"], key="file_uploader")
         if uploaded:
-            path = os.path.join(folder, uploaded.name)
-            with open(path, "wb") as f:
-                f.write(uploaded.getbuffer())
+            # Store each upload once: reruns keep the widget's file and must not overwrite later edits
+            saved = st.session_state.setdefault("saved_uploads", {})
+            upload_id = (uploaded.file_id, family, m_type, grade, period)
+            if upload_id not in saved:
+                try:
+                    saved[upload_id] = save_upload(family, m_type, grade, period, uploaded)
+                except ValueError as e:
+                    st.error(f"Cannot store this file: {e}")
+                    return None, None
             st.success("File uploaded successfully ✅")
-            selected_file = path
+            selected_file = saved[upload_id]
     else:
-        files = [f for f in os.listdir(folder) if f.endswith(".xlsx")]
-        if files:
-            name = st.selectbox("Choose existing file", files, key="existing_file_select")
-            selected_file = os.path.join(folder, name)
+        files = list_series(family, m_type, grade, period)
+        derived = finer_sources(family, m_type, grade, period)
+        options = [name for name, _ in files] + [f"{name} (derived from {p})" for p, name, _ in derived]
+        if options:
+            choice = options.index(st.selectbox("Choose existing file", options, key="existing_file_select"))
+            if choice < len(files):
+                selected_file = files[choice][1]
+            else:
+                derived_from, _, selected_file = derived[choice - len(files)]
+                st.caption(f"{period} totals are summed from the {derived_from.lower()} history; "
+                           f"edit the {derived_from} data to change them.")
         else:
             st.info("No uploaded files found for this period yet.")
-    return selected_file
+    return selected_file, derived_from
 
+@timed("load_table")
 def load_table(file_path):
     try:
-        df = pd.read_excel(file_path)
+        df = read_series(file_path)
         df = df.fillna(0)
         df.reset_index(drop=True, inplace=True)
         return df
@@ -100,6 +139,42 @@ def load_table(file_path):
         st.error(f"Error loading file: {e}")
         return None
 
+FORECAST_RUN_KEYS = ["forecast_ran", "best_method", "best_error", "all_results", "all_errors", "selected_criteria",
+                     "method_params", "backtest", "backtest_skipped", "method_status"]
+
+def clear_forecast_run():
+    """
+    Drop the last forecasting run's results (they belong to the table it ran on).
+    """
+    for key in FORECAST_RUN_KEYS:
+        if key in st.session_state:
+            del st.session_state[key]
+
+def open_table(file_path, derived_from=None, period=None):
+    """
+    Point st.session_state.df at the process-wide shared, read-only copy of a table
+    (the directly loaded one, or the period derived from a finer series). The session
+    holds a lease on it until it opens another table. Returns the table, None on error.
+    """
+    if derived_from:
+        load = lambda: derived_table(file_path, derived_from, period)
+    else:
+        load = lambda: load_table(file_path)
+    lease = shared_datasets.acquire((file_path, derived_from, period), load, signature(file_path))
+    clear_forecast_run()
+    st.session_state.dataset_lease = lease
+    st.session_state.df = None if lease is None else lease.frame
+    return st.session_state.df
+
+def keep_private(df):
+    """
+    Copy-on-write: after an edit the session holds its own table and drops the shared one.
+    """
+    clear_forecast_run()
+    st.session_state.dataset_lease = None
+    st.session_state.df = df
+
+@timed("view_table (Styler render)")
 def view_table():
     st.subheader("Table Preview")
     styled_df = st.session_state.df.style.set_properties(**{
@@ -122,35 +197,113 @@ def renumber_first_column(df, first_col):
     df[first_col] = range(1, len(df) + 1)
     return df
 
-# ================= Forecasting Functions =================
-def run_naive_forecasting(df, first_col):
-    df = df.copy()
-    df["Naive Forecast"] = df["Demand"].shift(1).fillna(df["Demand"].iloc[0])
-    return df
+# ================= Cached Method Evaluation =================
+DEFAULT_PARAMS = {
+    "Naive": {},
+    "Moving Average": {"n": 3},
+    "Exponential Smoothing": {"alpha": 0.3},
+    "Holt": {"alpha": 0.3, "beta": 0.1},
+    "Holt-Winters": {"alpha": 0.3, "beta": 0.1, "gamma": 0.1, "seasonal": "additive"},
+}
+METHOD_RUNNERS = {
+    "Naive": run_naive_forecasting,
+    "Moving Average": run_moving_average_forecasting,
+    "Exponential Smoothing": run_exponential_forecasting,
+    "Holt": run_holt_forecasting,
+    "Holt-Winters": run_holt_winters_forecasting,
+}
 
-def run_moving_average_forecasting(df, first_col, n=3):
-    df = df.copy()
-    df["Moving Avg Forecast"] = df["Demand"].rolling(n, min_periods=1).mean().shift(1).fillna(df["Demand"].iloc[0])
-    return df
+def evaluate_method(df, digest, source, method, run_fn, first_col, **params):
+    """
+    Run one forecasting method through the shared forecast cache. Returns the forecast df.
+    """
+    with stage(f"evaluate: {method}"):
+        return forecast_cache.get_or_compute(
+            make_key(digest, method, params), lambda: run_fn(df, first_col, **params), source)
 
-def run_exponential_forecasting(df, first_col, alpha=0.3):
-    df = df.copy()
-    fc = [df["Demand"].iloc[0]]
-    for d in df["Demand"].iloc[1:]:
-        fc.append(alpha * d + (1 - alpha) * fc[-1])
-    df["Exponential Forecast"] = fc
-    return df
+def running_errors(source, demand, params):
+    """
+    Error metrics of the Naive / Moving Average / Exponential Smoothing runs kept by the
+    incremental state of a workbook ("➕ Add Row" updates it in O(1)), for the methods run
+    at the state's parameters. {} for database and derived tables, which it does not track.
+    """
+    derived_from = st.session_state.get("loaded_source", (None, None))[1]
+    if not source or derived_from or is_database_key(source):
+        return {}
+    fc = state_for(source, demand, DEFAULT_PARAMS["Moving Average"]["n"],
+                   DEFAULT_PARAMS["Exponential Smoothing"]["alpha"])
+    metrics = fc.metrics()
+    return {method: metrics[method] for method in INCREMENTAL_METHODS
+            if params.get(method) == DEFAULT_PARAMS[method]}
 
-# ================= Error Calculations =================
-def calculate_mad(df, actual_col="Demand", forecast_col="Forecast"):
-    df = df.copy()
-    df["Abs Error"] = (df[actual_col] - df[forecast_col]).abs()
-    return df["Abs Error"].mean()
+def rank_methods(demand, results, forecast_cols, digest, source, params, known=None):
+    """
+    Score every method's forecast column in one pass of the error engine (cached per
+    data digest and parameters). known: {method: {metric: value}} already scored (the
+    incremental state); only the other methods go through the engine.
+    Returns the error table, one row per method.
+    """
+    known = {method: values for method, values in (known or {}).items() if method in results}
+    rest = [m for m in results if m not in known]
+    key = make_key(digest, "Error Engine", params, tuple(results))
 
-def calculate_mse(df, actual_col="Demand", forecast_col="Forecast"):
-    df = df.copy()
-    df["Squared Error"] = (df[actual_col] - df[forecast_col]) ** 2
-    return df["Squared Error"].mean()
+    def score():
+        tables = [pd.DataFrame([{"Method": m, **known[m]} for m in known])] if known else []
+        if rest:
+            matrix = pd.concat([results[m][forecast_cols[m]] for m in rest], axis=1).to_numpy(dtype=float)
+            tables.append(error_table(demand, matrix, rest))
+        return pd.concat(tables, ignore_index=True).set_index("Method").loc[list(results)].reset_index()
+    return forecast_cache.get_or_compute(key, score, source)
+
+def flat_params(params):
+    """
+    {method: {name: value}} as one flat, hashable dict for cache keys.
+    """
+    return {f"{method}: {name}": value for method, values in params.items() for name, value in values.items()}
+
+def params_label(values):
+    symbols = {"n": "n", "alpha": "α", "beta": "β", "gamma": "γ"}
+    return ", ".join(f"{symbols[k]} = {v:g}" if k in symbols else str(v) for k, v in values.items())
+
+def tuned_params(method, demand, digest, source, criteria, season_length):
+    """
+    MAD/MSE-optimal parameters of one method (cached per data digest).
+    """
+    if method in ("Moving Average", "Exponential Smoothing"):
+        tuned = forecast_cache.get_or_compute(make_key(digest, "Auto-tune", metric=criteria),
+                                              lambda: tune_parameters(demand, criteria=criteria), source)
+        return {"n": tuned["ma_n"]} if method == "Moving Average" else {"alpha": tuned["alpha"]}
+    if method == "Holt":
+        tuned = forecast_cache.get_or_compute(make_key(digest, "Auto-tune: Holt", metric=criteria),
+                                              lambda: tune_holt(demand, criteria=criteria), source)
+        return {"alpha": tuned["alpha"], "beta": tuned["beta"]}
+    if method == "Holt-Winters":
+        tuned = forecast_cache.get_or_compute(
+            make_key(digest, "Auto-tune: Holt-Winters", {"season_length": season_length}, criteria),
+            lambda: tune_holt_winters(demand, season_length, criteria=criteria), source)
+        return {k: tuned[k] for k in ("alpha", "beta", "gamma", "seasonal")}
+    return {}
+
+def evaluate_candidate(df, demand, digest, source, method, first_col, criteria, season_length, auto_tune):
+    """
+    Parameters (tuned when auto_tune) and forecast table of one method. Runs on the shared
+    evaluation pool, so it must not touch st.* or session state.
+    """
+    params = tuned_params(method, demand, digest, source, criteria, season_length) if auto_tune else DEFAULT_PARAMS[method]
+    extra = {"season_length": season_length} if method == "Holt-Winters" else {}
+    return params, evaluate_method(df, digest, source, method, METHOD_RUNNERS[method], first_col, **params, **extra)
+
+def backtest_methods(demand, digest, source, params, horizon, season_length=None):
+    """
+    Rolling-origin backtest of the methods at the parameters in use and over the whole
+    parameter grid (cached per data digest). Returns (table, grid table).
+    """
+    configs = list(params.items())
+    with stage("backtest"):
+        return forecast_cache.get_or_compute(
+            make_key(digest, "Backtest", {**flat_params(params), "season_length": season_length}, horizon),
+            lambda: (backtest(demand, horizon, configs=configs, season_length=season_length),
+                     backtest(demand, horizon, season_length=season_length)), source)
 
 # ================= Edit Table Function =================
 def edit_table(file_path, period):
@@ -179,8 +332,13 @@ def edit_table(file_path, period):
         new_data = {col: [len(df) + 1 if col == first_col else new_row[col]] for col in df.columns}
         new_df = pd.DataFrame(new_data)
         df = pd.concat([df, new_df], ignore_index=True)
-        df.to_excel(file_path, index=False)
-        st.session_state.df = df
+        append_op(file_path, "add", row={col: values[0] for col, values in new_data.items()})
+        if "Demand" in df.columns and not is_database_key(file_path):
+            record_append(file_path, df["Demand"].to_numpy(dtype=float))
+        forecast_cache.invalidate(file_path)
+        chart_cache.invalidate(file_path)
+        rollup_cache.invalidate(file_path)
+        keep_private(df)
         st.success("New row added successfully!")
         st.rerun()
     st.divider()
@@ -201,8 +359,13 @@ def edit_table(file_path, period):
         for col, val in edited_values.items():
             df.loc[row_idx, col] = val
         df = renumber_first_column(df, first_col)
-        df.to_excel(file_path, index=False)
-        st.session_state.df = df
+        append_op(file_path, "edit", index=int(row_idx), values=edited_values, first_col=first_col)
+        if "Demand" in df.columns and not is_database_key(file_path):
+            record_rewrite(file_path, df["Demand"].to_numpy(dtype=float))
+        forecast_cache.invalidate(file_path)
+        chart_cache.invalidate(file_path)
+        rollup_cache.invalidate(file_path)
+        keep_private(df)
         st.success("Changes saved!")
         st.rerun()
     st.divider()
@@ -215,15 +378,44 @@ def edit_table(file_path, period):
         c1, c2 = st.columns(2)
         with c1:
             if st.button("🗑 Confirm Delete", type="primary"):
-                df = df[df[first_col] != delete_key].reset_index(drop=True)
+                delete_idx = df.index[df[first_col] == delete_key][0]
+                df = df.drop(index=delete_idx).reset_index(drop=True)
                 df = renumber_first_column(df, first_col)
-                df.to_excel(file_path, index=False)
-                st.session_state.df = df
+                append_op(file_path, "delete", index=int(delete_idx), first_col=first_col)
+                if "Demand" in df.columns and not is_database_key(file_path):
+                    record_rewrite(file_path, df["Demand"].to_numpy(dtype=float))
+                forecast_cache.invalidate(file_path)
+                chart_cache.invalidate(file_path)
+                rollup_cache.invalidate(file_path)
+                keep_private(df)
                 st.success("Row deleted!")
                 st.rerun()
         with c2:
             if st.button("Cancel"):
                 st.rerun()
+    st.divider()
+    # Edit History
+    st.markdown("### 🕘 Edit History")
+    ops = history(file_path)
+    if ops:
+        st.dataframe(pd.DataFrame([{"Time": op["ts"], "Operation": op["op"], "Row": str(op["index"] + 1) if "index" in op else "new"}
+                                   for op in reversed(ops)]), use_container_width=True)
+    else:
+        st.caption("No pending edits — the workbook is up to date.")
+    h1, h2 = st.columns(2)
+    with h1:
+        if st.button("↩ Undo Last Edit", disabled=not ops, key="undo_edit_btn"):
+            undo_last(file_path)
+            forecast_cache.invalidate(file_path)
+            chart_cache.invalidate(file_path)
+            rollup_cache.invalidate(file_path)
+            open_table(file_path)
+            st.rerun()
+    with h2:
+        label = "🗜 Clear Edit History" if is_database_key(file_path) else "🗜 Save Edits into Workbook"
+        if st.button(label, disabled=not ops, key="compact_btn"):
+            compact(file_path)
+            st.rerun()
 
 # ================= SIDEBAR: Navigation & Current Selection Info =================
 with st.sidebar:
@@ -237,7 +429,7 @@ with st.sidebar:
     st.subheader("Navigation")
     if st.button("🏠 Material Selection", use_container_width=True):
         st.session_state.page = 1
-        st.session_state.df = None
+        st.session_state.df = st.session_state.dataset_lease = None
         st.session_state.file = None
         st.session_state.editing = False
         st.rerun()
@@ -258,13 +450,36 @@ with st.sidebar:
             st.session_state.page = 6
             st.rerun()
     st.markdown("---")
+    st.checkbox("🐞 Debug timings", key="debug_timings")
+    st.caption(f"Storage: SQLite ({DATABASE})" if using_database() else "Storage: Excel files (Uploaded/)")
+    cache_stats = forecast_cache.stats()
+    st.caption(
+        f"Forecast cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses · "
+        f"{cache_stats['entries']} entries · {cache_stats['bytes'] / 1024 ** 2:.1f} of "
+        f"{cache_stats['max_bytes'] / 1024 ** 2:.0f} MB"
+    )
+    chart_stats = chart_cache.stats()
+    st.caption(
+        f"Chart cache: {chart_stats['hits']} hits / {chart_stats['misses']} misses · "
+        f"{chart_stats['entries']} charts · {chart_stats['bytes'] / 1024 ** 2:.1f} MB"
+    )
+    rollup_stats = rollup_cache.stats()
+    st.caption(
+        f"Rollup cache: {rollup_stats['hits']} hits / {rollup_stats['misses']} misses · "
+        f"{rollup_stats['entries']} workbooks · {rollup_stats['bytes'] / 1024 ** 2:.1f} MB"
+    )
+    shared_stats = shared_datasets.stats()
+    st.caption(
+        f"Shared tables: {shared_stats['tables']} tables · {shared_stats['leases']} sessions · "
+        f"{shared_stats['bytes'] / 1024 ** 2:.1f} MB" + (" (memory-mapped)" if shared_stats["mmap"] else "")
+    )
     st.caption("Forecasting & Inventory Management System © 2025")
 
 # ================= SCREEN 1: Material Selection =================
 def page_material_selection():
     st.title("Welcome to Forecasting & Inventory Management System")
     st.markdown("### Step 1: Select the Material you want to analyze")
-    st.session_state.material = select_material(df_class)
+    st.session_state.material = select_material(catalog)
     if st.button("Next ➜", type="primary"):
         st.session_state.page = 2
         st.rerun()
@@ -277,22 +492,29 @@ def page_selected_material():
     family = st.session_state.material['family']
     m_type = st.session_state.material['type']
     grade = st.session_state.material['grade']
-    st.session_state.file = choose_data_source(st.session_state.period, family, m_type, grade)
-    if st.session_state.file and st.session_state.df is None:
-        st.session_state.df = load_table(st.session_state.file)
+    st.session_state.file, derived_from = choose_data_source(st.session_state.period, family, m_type, grade)
+    source = (st.session_state.file, derived_from, st.session_state.period)
+    if st.session_state.file and (st.session_state.df is None or st.session_state.get("loaded_source") != source):
+        if derived_from:
+            with stage("load derived period"):
+                open_table(st.session_state.file, derived_from, st.session_state.period)
+            st.session_state.editing = False
+        else:
+            open_table(st.session_state.file)
         if st.session_state.df is None:
             st.stop()
+        st.session_state.loaded_source = source
     c1, c2, c3, c4 = st.columns(4)
     with c1:
         st.session_state.show_table = st.checkbox("Show Table", value=st.session_state.show_table)
     with c2:
-        if st.button("✏ Edit Table" if not st.session_state.editing else "✏ Editing..."):
+        if st.button("✏ Edit Table" if not st.session_state.editing else "✏ Editing...", disabled=bool(derived_from)):
             st.session_state.editing = not st.session_state.editing
             st.rerun()
     with c3:
         if st.button("⬅ Back"):
             st.session_state.page = 1
-            st.session_state.df = st.session_state.file = None
+            st.session_state.df = st.session_state.file = st.session_state.dataset_lease = None
             st.session_state.editing = False
             st.rerun()
     with c4:
@@ -348,7 +570,8 @@ def page_forecasting():
     mat = st.session_state.material
     period_name = st.session_state.period
     first_col = PERIOD_COLUMN_MAP[period_name]
-    df_base = st.session_state.df.copy()
+    # Shared and read-only: the method runners work on their own copies
+    df_base = st.session_state.df
     st.markdown(
         f"""
         **Material:** {mat['family']} / {mat['type']} / {mat['grade']}   |  
@@ -362,37 +585,78 @@ def page_forecasting():
     if not st.session_state.forecast_ran:
         st.subheader("Select Evaluation Criteria")
         criteria = st.radio("Choose the error metric:", ["MAD", "MSE"], horizontal=True)
+        auto_tune = st.checkbox("Auto-tune parameters (Moving Average window, α, β, γ)", key="auto_tune")
+        use_backtest = st.checkbox("Choose the best method by rolling-origin backtest (out-of-sample errors)",
+                                   key="use_backtest")
+        horizon = st.number_input("Backtest horizon (periods ahead)", min_value=1, max_value=52,
+                                  value=BACKTEST_HORIZON, key="backtest_horizon", disabled=not use_backtest)
+        budget = st.number_input("Time budget per method (seconds)", min_value=0.1, max_value=600.0,
+                                 value=DEFAULT_BUDGET_SECONDS, step=0.5, key="method_budget",
+                                 help="Methods still running after this long are left out of the ranking")
         if st.button("RUN FORECASTING", type="primary", use_container_width=True):
             st.session_state.selected_criteria = criteria
             with st.spinner("Running forecasting models..."):
-                results = {}
-                errors = []
-                # Naive
-                df_n = run_naive_forecasting(df_base.copy(), first_col)
-                mad_n = calculate_mad(df_n, forecast_col="Naive Forecast")
-                mse_n = calculate_mse(df_n, forecast_col="Naive Forecast")
-                results["Naive"] = df_n
-                errors.append({"Method": "Naive", "MAD": mad_n, "MSE": mse_n})
-                # Moving Average
-                ma_n = 3
-                df_ma = run_moving_average_forecasting(df_base.copy(), first_col, n=ma_n)
-                mad_ma = calculate_mad(df_ma, forecast_col="Moving Avg Forecast")
-                mse_ma = calculate_mse(df_ma, forecast_col="Moving Avg Forecast")
-                results["Moving Average"] = df_ma
-                errors.append({"Method": "Moving Average", "MAD": mad_ma, "MSE": mse_ma})
-                # Exponential Smoothing
-                alpha = 0.3
-                df_exp = run_exponential_forecasting(df_base.copy(), first_col, alpha=alpha)
-                mad_exp = calculate_mad(df_exp, forecast_col="Exponential Forecast")
-                mse_exp = calculate_mse(df_exp, forecast_col="Exponential Forecast")
-                results["Exponential Smoothing"] = df_exp
-                errors.append({"Method": "Exponential Smoothing", "MAD": mad_exp, "MSE": mse_exp})
-                error_df = pd.DataFrame(errors).round(4)
-                st.session_state.all_results = results
+                digest = frame_digest(df_base)
+                source = st.session_state.file
+                demand = df_base["Demand"].to_numpy(dtype=float)
+                # Holt-Winters needs two full seasons of the period's season length
+                season_length = seasonal_fit(len(df_base), period_name)
+                methods = [m for m in DEFAULT_PARAMS if season_length or m != "Holt-Winters"]
+                # Every method (and its tuning) runs on the shared pool; the table fills in as they finish
+                tasks = {method: partial(evaluate_candidate, df_base, demand, digest, source, method, first_col,
+                                         criteria, season_length, auto_tune) for method in methods}
+                rows = {method: {"Method": method, "Status": "running", "Seconds": None, criteria: None}
+                        for method in methods}
+                progress = st.empty()
+                progress.dataframe(pd.DataFrame(rows.values()).set_index("Method"), use_container_width=True)
+
+                def show(record, value):
+                    method = record["Method"]
+                    record_stage(f"evaluate: {method}", record["Start"], record["Seconds"])
+                    rows[method].update(Status=record["Status"], Seconds=round(record["Seconds"], 3))
+                    if value is not None:
+                        forecast = value[1][FORECAST_COLUMNS[method]].to_numpy(dtype=float)
+                        rows[method][criteria] = round(float(error_table(demand, forecast[:, None], [method])[criteria].iat[0]), 4)
+                    progress.dataframe(pd.DataFrame(rows.values()).set_index("Method"), use_container_width=True)
+
+                # Methods left running past their budget count against this session only
+                if "eval_owner" not in st.session_state:
+                    st.session_state.eval_owner = uuid.uuid4().hex
+                finished, status = evaluate_concurrently(tasks, budget=float(budget), on_result=show,
+                                                         owner=st.session_state.eval_owner)
+                st.session_state.method_status = [record for record in status if record["Status"] != "done"]
+                if not finished:
+                    st.error(f"No forecasting method finished within the time budget: {status[-1]['Error']}. "
+                             "Raise the budget and run again.")
+                    st.stop()
+                params = {method: finished[method][0] for method in methods if method in finished}
+                results = {method: finished[method][1] for method in methods if method in finished}
+                st.session_state.method_params = {
+                    method: params_label(values) + (f", m = {season_length}" if method == "Holt-Winters" else "")
+                    for method, values in params.items() if values}
+                # Errors: all methods and metrics in one pass, the untuned basic methods from the incremental state
+                known = running_errors(source, demand, params)
+                error_df = rank_methods(demand, results, FORECAST_COLUMNS, digest, source, flat_params(params),
+                                        known).round(4)
                 st.session_state.all_errors = error_df
                 best_row = error_df.loc[error_df[criteria].idxmin()]
+                st.session_state.backtest = None
+                st.session_state.backtest_skipped = None
+                if use_backtest:
+                    try:
+                        table, grid = backtest_methods(demand, digest, source, params, int(horizon), season_length)
+                        table = table.round(4)
+                        st.session_state.backtest = (int(horizon), table, best_per_method(grid, criteria).round(4))
+                        best_row = table.loc[table[criteria].idxmin()]
+                    except ValueError as e:
+                        st.session_state.backtest_skipped = str(e)
                 st.session_state.best_method = best_row["Method"]
                 st.session_state.best_error = best_row[criteria]
+                # Keep the demand once and float32 forecasts, best method first
+                ranked = error_df.sort_values(criteria)["Method"].tolist()
+                order = [best_row["Method"]] + [m for m in ranked if m != best_row["Method"]]
+                st.session_state.all_results = ForecastResults.from_frames(df_base, first_col, results,
+                                                                           FORECAST_COLUMNS, order, digest=digest)
                 st.session_state.forecast_ran = True
                 st.rerun()
     if st.session_state.forecast_ran:
@@ -400,57 +664,60 @@ def page_forecasting():
         best_method = st.session_state.best_method
         best_error = st.session_state.best_error
         results = st.session_state.all_results
-        st.success(f"Best Method according to {criteria}: **{best_method}** ({criteria} = {best_error:.4f})")
-        df_best = results[best_method]
-        fc_best = [col for col in df_best.columns if "Forecast" in col][0]
+        backtested = st.session_state.get("backtest")
+        basis = f"out-of-sample {criteria} ({backtested[0]}-period backtest)" if backtested else criteria
+        st.success(f"Best Method according to {basis}: **{best_method}** ({criteria} = {best_error:.4f})")
+        params = st.session_state.get("method_params", {})
+        st.caption(" | ".join(f"{method}: {value}" for method, value in params.items()))
+        for record in st.session_state.get("method_status", []):
+            st.warning(f"{record['Method']} left out of the ranking ({record['Status']}): {record['Error']}")
+        st.dataframe(st.session_state.all_errors.set_index("Method"), use_container_width=True)
+        if backtested:
+            horizon, table, grid = backtested
+            st.markdown(f"**Rolling-origin backtest** – {table['Origins'].iat[0]} origins, "
+                        f"1 to {horizon} periods ahead")
+            st.dataframe(table.drop(columns=["Origins"]).set_index("Method"), use_container_width=True)
+            with st.expander("Best setting of each method over the parameter grid"):
+                st.dataframe(grid.drop(columns=["Origins"]).set_index("Method"), use_container_width=True)
+        elif st.session_state.get("backtest_skipped"):
+            st.warning(f"Backtest skipped, ranked in-sample: {st.session_state.backtest_skipped}")
         st.divider()
         st.subheader(f"📋 Forecast Table – {best_method}")
-        table_best = df_base[[first_col, "Demand"]].copy()
-        table_best["Forecast"] = df_best[fc_best]
+        table_best = results.table(best_method)
         st.dataframe(table_best.style.format("{:.2f}"), use_container_width=True)
         st.subheader(f"📊 Forecast Chart – {best_method}")
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.plot(table_best[first_col], table_best["Demand"], 'o-', label="Actual Demand", color="blue")
-        ax.plot(table_best[first_col], table_best["Forecast"], 's--', label="Forecast", color="red")
-        ax.set_title(f"{best_method} vs Actual Demand")
-        ax.set_xlabel(period_name)
-        ax.set_ylabel("Demand")
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
+        with stage("chart: forecast"):
+            png = line_chart(
+                table_best[first_col].to_numpy(),
+                [{"y": table_best["Demand"], "fmt": "o-", "label": "Actual Demand", "color": "blue"},
+                 {"y": table_best["Forecast"], "fmt": "s--", "label": "Forecast", "color": "red"}],
+                key=make_key(frame_digest(table_best), "chart: forecast", {"method": best_method}),
+                source=st.session_state.file,
+                title=f"{best_method} vs Actual Demand", xlabel=period_name, ylabel="Demand")
+            st.image(png, use_container_width=True)
         st.info(f"**{criteria} for {best_method}: {best_error:.4f}**")
         st.divider()
         st.subheader("🔍 View Other Forecasting Methods")
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            show_naive = st.checkbox("Naive", key="chk_naive")
-        with c2:
-            show_ma = st.checkbox("Moving Average", key="chk_ma")
-        with c3:
-            show_exp = st.checkbox("Exponential Smoothing", key="chk_exp")
+        checkbox_keys = {"Naive": "chk_naive", "Moving Average": "chk_ma", "Exponential Smoothing": "chk_exp",
+                         "Holt": "chk_holt", "Holt-Winters": "chk_hw"}
         selected = []
-        if show_naive:
-            selected.append("Naive")
-        if show_ma:
-            selected.append("Moving Average")
-        if show_exp:
-            selected.append("Exponential Smoothing")
+        for column, method in zip(st.columns(len(results)), results):
+            with column:
+                if st.checkbox(method, key=checkbox_keys[method]):
+                    selected.append(method)
+        if results.dropped:
+            st.caption(f"Not kept in this session (memory budget of {results.max_bytes / 1024 ** 2:.0f} MB): "
+                       + ", ".join(results.dropped))
         for method in selected:
             if method == best_method:
                 continue
-            df_o = results[method]
-            fc_o = [col for col in df_o.columns if "Forecast" in col][0]
             st.markdown(f"#### {method} Table")
-            table_o = df_base[[first_col, "Demand"]].copy()
-            table_o["Forecast"] = df_o[fc_o]
+            table_o = results.table(method)
             st.dataframe(table_o.style.format("{:.2f}"), use_container_width=True)
         st.divider()
     st.divider()
     if st.button("⬅ Back to Analysis"):
-        keys_to_clear = ["forecast_ran", "best_method", "best_error", "all_results", "all_errors", "selected_criteria"]
-        for key in keys_to_clear:
-            if key in st.session_state:
-                del st.session_state[key]
+        clear_forecast_run()
         st.session_state.page = 3
         st.rerun()
 
@@ -462,8 +729,14 @@ def page_eoq():
     st.divider()
     st.subheader("EOQ Parameters")
     col1, col2, col3 = st.columns(3)
+    history_d = None
+    if st.session_state.df is not None and "Demand" in st.session_state.df.columns:
+        history_d = annual_demand_from_history(st.session_state.df["Demand"], st.session_state.period)
     with col1:
-        D = st.number_input("Annual Demand (D)", min_value=1.0, value=12000.0, step=100.0)
+        D = st.number_input("Annual Demand (D)", min_value=1.0, step=100.0,
+                            value=round(history_d, 2) if history_d and history_d >= 1 else 12000.0)
+        if history_d:
+            st.caption(f"From the loaded {st.session_state.period.lower()} history: {history_d:,.2f} per year")
     with col2:
         S = st.number_input("Ordering Cost per Order (S)", min_value=0.0, value=200.0, step=10.0)
     with col3:
@@ -481,9 +754,9 @@ def page_eoq():
         if H <= 0:
             st.error("Holding cost (H) must be greater than zero.")
         else:
-            EOQ = ((2 * D * S) / H) ** 0.5
-            reorder_point = daily_demand * lead_time_days
-            days_between_orders = EOQ / daily_demand if daily_demand > 0 else 0
+            EOQ = calculate_eoq(D, S, H)
+            reorder_point = calculate_reorder_point(daily_demand, lead_time_days)
+            order_cycle = days_between_orders(EOQ, daily_demand)
             st.success("Calculation completed successfully!")
             col_eoq, col_rop, col_cycle = st.columns(3)
             with col_eoq:
@@ -491,21 +764,42 @@ def page_eoq():
             with col_rop:
                 st.metric("Reorder Point", f"{reorder_point:.2f} units")
             with col_cycle:
-                st.metric("Order Every", f"{days_between_orders:.1f} days")
+                st.metric("Order Every", f"{order_cycle:.1f} days")
             st.divider()
             st.subheader("📊 Inventory Level During Lead Time")
-            days = list(range(0, int(lead_time_days + 10)))
-            inventory_level = [EOQ - daily_demand * d for d in days]
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(days, inventory_level, 'o-', label="Inventory Level", color="purple", linewidth=2)
-            ax.axhline(y=reorder_point, color="red", linestyle="--", linewidth=2, label=f"Reorder Point ({reorder_point:.2f})")
-            ax.axhline(y=0, color="black", linewidth=1)
-            ax.set_title("Inventory Level During Lead Time")
-            ax.set_xlabel("Days")
-            ax.set_ylabel("Inventory Quantity")
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            st.pyplot(fig)
+            days = np.arange(0, int(lead_time_days + 10))
+            levels = inventory_level(EOQ, daily_demand, days)
+            with stage("chart: EOQ inventory level"):
+                png = line_chart(
+                    days,
+                    [{"y": levels, "fmt": "o-", "label": "Inventory Level", "color": "purple", "linewidth": 2}],
+                    hlines=[{"y": reorder_point, "color": "red", "linestyle": "--", "linewidth": 2,
+                             "label": f"Reorder Point ({reorder_point:.2f})"},
+                            {"y": 0, "color": "black", "linewidth": 1}],
+                    key=make_key(None, "chart: EOQ inventory level",
+                                 {"eoq": EOQ, "daily_demand": daily_demand, "lead_time": lead_time_days,
+                                  "reorder_point": reorder_point}),
+                    title="Inventory Level During Lead Time", xlabel="Days", ylabel="Inventory Quantity")
+                st.image(png, use_container_width=True)
+    st.divider()
+    with st.expander("📚 Catalog-wide EOQ (all materials)"):
+        st.caption("Demand comes from each material's history in Uploaded/. Optional tables (CSV/xlsx) keyed by "
+                   "MaterialFamily / MaterialType / MaterialGrade: parameters (OrderingCost, HoldingCost, HoldingRate, "
+                   "LeadTimeDays, UnitPrice) and quantity price breaks (MinQty, UnitPrice). Missing S/H/lead time "
+                   "use the defaults 200 / 25 / 7.")
+        params_file = st.file_uploader("Parameter table", type=["csv", "xlsx"], key="eoq_params_file")
+        discounts_file = st.file_uploader("Quantity discount table", type=["csv", "xlsx"], key="eoq_discounts_file")
+        if st.button("Calculate for the Whole Catalog", key="catalog_eoq_btn"):
+            with st.spinner("Computing EOQ for every material..."), stage("catalog EOQ"):
+                st.session_state.catalog_eoq = catalog_eoq(
+                    catalog.df,
+                    params=read_table(params_file) if params_file else None,
+                    discounts=read_table(discounts_file) if discounts_file else None)
+        if st.session_state.get("catalog_eoq") is not None:
+            result = st.session_state.catalog_eoq
+            st.dataframe(result.drop(columns=["File"]), use_container_width=True, hide_index=True)
+            st.download_button("⬇ Download CSV", result.to_csv(index=False).encode("utf-8"),
+                               file_name="catalog_eoq.csv", mime="text/csv", key="catalog_eoq_download")
     st.divider()
     if st.button("⬅ Back to Analysis"):
         st.session_state.page = 3
@@ -528,34 +822,157 @@ def page_safety_stock():
             st.metric("Safety Stock", f"{fixed_ss:.2f} units")
     else:
         st.subheader("Statistical Safety Stock Parameters")
-        col1, col2 = st.columns(2)
+        df = st.session_state.df
+        has_history = df is not None and "Demand" in df.columns and len(df) > 1
+        sources = (["Forecast errors of a method", "Enter manually"] if has_history else ["Enter manually"])
+        sigma_source = st.radio("Demand variability from:", sources, horizontal=True)
+        col1, col2, col3 = st.columns(3)
         with col1:
-            service_level = st.slider("Desired Service Level (%)", min_value=80.0, max_value=99.9, value=95.0, step=0.1)
-        with col2:
-            std_dev_lead_demand = st.number_input("Standard Deviation of Demand During Lead Time", min_value=0.0, value=50.0, step=1.0)
-        z_map = {80: 0.84, 90: 1.28, 95: 1.65, 97.5: 1.96, 99: 2.33, 99.9: 3.09}
-        z_score = z_map.get(round(service_level), 1.65)
+            service_level = st.number_input("Desired Service Level (%)", min_value=50.0, max_value=99.999,
+                                            value=95.0, step=0.1, format="%.3f")
+        if sigma_source == "Enter manually":
+            with col2:
+                std_dev_lead_demand = st.number_input("Standard Deviation of Demand During Lead Time",
+                                                      min_value=0.0, value=50.0, step=1.0)
+        else:
+            results = st.session_state.get("all_results")
+            # Only forecasts of this very table; otherwise recompute from its demand
+            if not results or not results.matches(df):
+                results = {}
+            methods = [m for m in FORECAST_COLUMNS if m in results or m in ARRAY_FORECASTERS]
+            best = st.session_state.get("best_method")
+            with col2:
+                method = st.selectbox("Forecast method", methods, index=methods.index(best) if best in methods else 0)
+            with col3:
+                lead_time_days = st.number_input("Lead Time (days)", min_value=0.0, value=7.0, step=1.0)
+                lead_time_std_days = st.number_input("Lead Time Std Dev (days)", min_value=0.0, value=0.0, step=0.5)
+            demand = df["Demand"].to_numpy(dtype=float)
+            if method in results:
+                forecast = results.forecast(method).astype(float)
+            else:
+                forecast = ARRAY_FORECASTERS[method](np.nan_to_num(demand))
+            stats = forecast_safety_stock(np.nan_to_num(demand), forecast, st.session_state.period,
+                                          service_level, lead_time_days, lead_time_std_days)
+            std_dev_lead_demand = float(stats["sigma_lead_time"])
+            st.caption(f"{method} forecast error std: {stats['sigma']:.2f} per {st.session_state.period.lower()} "
+                       f"period → {std_dev_lead_demand:.2f} over the lead time")
         if st.button("Calculate Safety Stock", type="primary"):
-            safety_stock = z_score * std_dev_lead_demand
+            safety_stock, z_score = statistical_safety_stock(service_level, std_dev_lead_demand)
             st.success("Statistical Safety Stock Calculated!")
             st.metric("Safety Stock", f"{safety_stock:.2f} units")
-            st.info(f"Z-Score used for {service_level}% service level: {z_score:.2f}")
+            if sigma_source != "Enter manually":
+                st.metric("Reorder Point", f"{stats['reorder_point']:.2f} units")
+            st.info(f"Z-Score used for {service_level}% service level: {z_score:.4f}")
+    st.divider()
+    with st.expander("📚 Catalog-wide Safety Stock (all materials)"):
+        st.caption("Forecast error std comes from each material's history in Uploaded/ and is scaled to the lead "
+                   "time. An optional table (CSV/xlsx) keyed by MaterialFamily / MaterialType / MaterialGrade can "
+                   "set ServiceLevel, LeadTimeDays and LeadTimeStdDays per material; the rest use the values below.")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            catalog_level = st.number_input("Service Level (%)", min_value=50.0, max_value=99.999, value=95.0,
+                                            step=0.1, format="%.3f", key="catalog_ss_level")
+        with col2:
+            catalog_lead = st.number_input("Lead Time (days)", min_value=0.0, value=7.0, step=1.0, key="catalog_ss_lead")
+        with col3:
+            catalog_lead_std = st.number_input("Lead Time Std (days)", min_value=0.0, value=0.0, step=0.5,
+                                               key="catalog_ss_lead_std")
+        with col4:
+            catalog_method = st.selectbox("Method", SAFETY_STOCK_METHODS, key="catalog_ss_method")
+        params_file = st.file_uploader("Parameter table", type=["csv", "xlsx"], key="ss_params_file")
+        if st.button("Calculate for the Whole Catalog", key="catalog_ss_btn"):
+            with st.spinner("Computing safety stock for every material..."), stage("catalog safety stock"):
+                st.session_state.catalog_safety_stock = catalog_safety_stock(
+                    catalog.df, params=read_table(params_file) if params_file else None,
+                    service_level=catalog_level, lead_time_days=catalog_lead, lead_time_std_days=catalog_lead_std,
+                    method=catalog_method)
+        if st.session_state.get("catalog_safety_stock") is not None:
+            result = st.session_state.catalog_safety_stock
+            st.dataframe(result.drop(columns=["File"]), use_container_width=True, hide_index=True)
+            st.download_button("⬇ Download CSV", result.to_csv(index=False).encode("utf-8"),
+                               file_name="catalog_safety_stock.csv", mime="text/csv", key="catalog_ss_download")
+    df = st.session_state.df
+    if df is not None and "Demand" in df.columns and df["Demand"].notna().sum() > 1:
+        with st.expander("🎲 Policy Simulation (Monte Carlo)"):
+            st.caption("Replays or bootstraps this material's demand history against an inventory policy built from "
+                       "the EOQ, reorder point and safety stock formulas, and reports the fill rate, stockouts and "
+                       "annual costs it actually achieves.")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                sim_policy = st.selectbox("Policy", SIM_POLICIES, key="sim_policy")
+                sim_sampler = st.selectbox("Demand scenarios", SIM_SAMPLERS, key="sim_sampler")
+            with col2:
+                sim_S = st.number_input("Ordering Cost (S)", min_value=0.0, value=200.0, step=10.0, key="sim_S")
+                sim_H = st.number_input("Holding Cost / Unit / Year (H)", min_value=0.01, value=25.0, step=1.0,
+                                        key="sim_H")
+            with col3:
+                sim_level = st.number_input("Service Level (%)", min_value=50.0, max_value=99.999, value=95.0,
+                                            step=0.1, format="%.3f", key="sim_level")
+                sim_lead = st.number_input("Lead Time (days)", min_value=0.0, value=7.0, step=1.0, key="sim_lead")
+            with col4:
+                sim_lead_std = st.number_input("Lead Time Std (days)", min_value=0.0, value=0.0, step=0.5,
+                                               key="sim_lead_std")
+                sim_reps = st.number_input("Replications", min_value=100, max_value=100_000, value=2_000, step=500,
+                                           key="sim_reps")
+            sim_lost = st.checkbox("Unmet demand is lost (otherwise backordered)", key="sim_lost")
+            if st.button("Run Simulation", key="sim_btn"):
+                demand = df["Demand"].to_numpy(dtype=float)
+                demand = demand[~np.isnan(demand)]
+                policy = build_policy(demand, st.session_state.period, sim_S, sim_H, sim_level, sim_lead,
+                                      sim_lead_std, sim_policy)
+                with st.spinner("Simulating..."), stage("policy simulation"):
+                    results = run_simulation(demand, policy, int(sim_reps), sampler=sim_sampler,
+                                             backorders=not sim_lost, seed=0,
+                                             workers=min(os.cpu_count() or 1, int(sim_reps) // SIM_PER_TASK) or 1)
+                st.session_state.simulation = (policy, summarize(results))
+            if st.session_state.get("simulation") is not None:
+                policy, summary = st.session_state.simulation
+                shown = {k: policy[k] for k in ("s", "Q", "R", "S") if k in policy}
+                st.markdown(f"**Policy {policy['policy']}:** " + ", ".join(f"{k} = {v:,.2f}" for k, v in shown.items())
+                            + f" · lead time {policy['lead_time']} period(s)")
+                st.dataframe(summary.round(4), use_container_width=True, hide_index=True)
     st.divider()
     if st.button("⬅ Back to Analysis"):
         st.session_state.page = 3
         st.rerun()
 
 # ================= Main Navigation =================
-if st.session_state.page == 1:
-    page_material_selection()
-elif st.session_state.page == 2:
-    page_selected_material()
-elif st.session_state.page == 3:
-    page_analysis()
-elif st.session_state.page == 4:
-    page_forecasting()
-elif st.session_state.page == 5:
-    page_eoq()
-elif st.session_state.page == 6:
-    page_safety_stock()
+try:
+    if st.session_state.page == 1:
+        page_material_selection()
+    elif st.session_state.page == 2:
+        page_selected_material()
+    elif st.session_state.page == 3:
+        page_analysis()
+    elif st.session_state.page == 4:
+        page_forecasting()
+    elif st.session_state.page == 5:
+        page_eoq()
+    elif st.session_state.page == 6:
+        page_safety_stock()
+finally:
+    # Reruns cut short by st.rerun() are still logged and kept in the history
+    timings = end_rerun(page=st.session_state.page, file=st.session_state.file)
+    if timings:
+        st.session_state.timing_history = (st.session_state.timing_history + [
+            {"page": st.session_state.page, "stages": timings}])[-5:]
+
+# ================= Debug Timings Panel =================
+if st.session_state.get("debug_timings") and st.session_state.timing_history:
+    with st.sidebar:
+        st.subheader("🐞 Stage Timings")
+        runs = st.session_state.timing_history
+        run_idx = st.selectbox("Rerun", range(len(runs)), index=len(runs) - 1,
+                               format_func=lambda i: f"#{i + 1} – page {runs[i]['page']}", key="timing_run_select")
+        st.dataframe(pd.DataFrame([
+            {"Stage": "  " * r["depth"] + r["stage"], "ms": round(r["ms"], 2)} for r in runs[run_idx]["stages"]
+        ]), use_container_width=True, hide_index=True)
+        st.subheader("🧠 Session Memory")
+        results = st.session_state.get("all_results")
+        if results:
+            st.caption(f"Forecast results: {results.nbytes / 1024 ** 2:.2f} of {results.max_bytes / 1024 ** 2:.0f} MB"
+                       f" · {len(results)} methods kept" + (f", {len(results.dropped)} dropped" if results.dropped else ""))
+        memory = pd.DataFrame(session_memory(st.session_state))
+        st.caption(f"Session state: {memory['MB'].sum():.2f} MB")
+        st.dataframe(memory.head(10), use_container_width=True, hide_index=True)
 
@@ -0,0 +1,77 @@
+"""
+Rolling-origin backtest (Forecasting_Methods.Backtesting) against refitting every origin.
+"""
+import numpy as np
+import pytest
+from Forecasting_Methods.Backtesting.backtest import backtest, backtest_group, best_per_method, origin_starts
+from Forecasting_Methods.Holt_Method.holt import holt_paths
+from Forecasting_Methods.HoltWinters_Method.holtwinters import holt_winters_paths
+
+CONFIGS = [("Naive", {}), ("Moving Average", {"n": 3}), ("Exponential Smoothing", {"alpha": 0.4}),
+           ("Holt", {"alpha": 0.5, "beta": 0.1}),
+           ("Holt-Winters", {"alpha": 0.3, "beta": 0.1, "gamma": 0.2, "seasonal": "additive"})]
+
+
+def refit_forecast(history, method, params, horizon, season_length):
+    """
+    Forecasts of the next horizon periods from a model fitted on history alone.
+    """
+    if method == "Naive":
+        return np.full(horizon, history[-1])
+    if method == "Moving Average":
+        return np.full(horizon, history[-params["n"]:].mean())
+    if method == "Exponential Smoothing":
+        level = history[0]
+        for actual in history:
+            level = params["alpha"] * actual + (1 - params["alpha"]) * level
+        return np.full(horizon, level)
+    if method == "Holt":
+        return holt_paths(history, params["alpha"], params["beta"], horizon)[-1]
+    return holt_winters_paths(history, params["alpha"], params["beta"], params["gamma"], season_length,
+                              params["seasonal"], horizon)[-1]
+
+
+@pytest.fixture
+def demand():
+    rng = np.random.default_rng(21)
+    t = np.arange(36)
+    return 40 + 0.5 * t + 8 * np.sin(2 * np.pi * t / 4) + rng.normal(0, 2, t.size)
+
+
+@pytest.mark.parametrize("horizon, step", [(1, 1), (4, 1), (3, 2)])
+def test_matches_refitting_every_origin(demand, horizon, step):
+    table = backtest(demand, horizon=horizon, step=step, configs=CONFIGS, season_length=4)
+    starts = origin_starts(demand.size, horizon, step=step)
+    for (_, row), (method, params) in zip(table.iterrows(), CONFIGS):
+        errors = np.array([demand[t:t + horizon] - refit_forecast(demand[:t], method, params, horizon, 4)
+                           for t in starts])
+        assert row["Origins"] == len(starts)
+        assert row["MAD"] == pytest.approx(np.abs(errors).mean(), rel=1e-9)
+        assert row["MSE"] == pytest.approx((errors ** 2).mean(), rel=1e-9)
+        assert row["Bias"] == pytest.approx(errors.mean(), rel=1e-9, abs=1e-12)
+        assert row[f"MAD h={horizon}"] == pytest.approx(np.abs(errors[:, -1]).mean(), rel=1e-9)
+
+
+def test_chunked_configs_give_the_same_table(demand):
+    full = backtest(demand, season_length=4)
+    chunked = backtest(demand, season_length=4, max_elements=500)
+    assert full[["Method", "Params"]].equals(chunked[["Method", "Params"]])
+    numbers = full.select_dtypes("number").columns
+    np.testing.assert_allclose(chunked[numbers], full[numbers], rtol=1e-12)
+
+
+def test_group_picks_the_best_of_each_series(demand):
+    rng = np.random.default_rng(4)
+    series = np.stack([demand, demand[::-1], rng.poisson(30, demand.size).astype(float)])
+    rows = backtest_group(series, horizon=2, season_length=4)
+    for values, row in zip(series, rows):
+        best = best_per_method(backtest(values, horizon=2, season_length=4))
+        assert row["Best Method"] == best["Method"].iat[0]
+        assert row["Best MAD"] == pytest.approx(best["MAD"].iat[0], rel=1e-9)
+        for method, mad in zip(best["Method"], best["MAD"]):
+            assert row[f"{method} MAD"] == pytest.approx(mad, rel=1e-9)
+
+
+def test_too_short_history_is_rejected():
+    with pytest.raises(ValueError, match="no origin"):
+        backtest(np.arange(5.0), horizon=4)
@@ -0,0 +1,34 @@
+"""
+Batch forecasting (Batch_Forecasting.batch) over either storage backend.
+"""
+import numpy as np
+import pytest
+import pandas as pd
+from Batch_Forecasting.batch import run_batch
+from Data_Storage import database, storage
+
+
+def demand_table():
+    return pd.DataFrame({"Week": np.arange(1, 21), "Demand": np.linspace(10.0, 48.0, 20)})
+
+
+def test_batch_reads_workbook_tree(tmp_path):
+    folder = tmp_path / "F" / "T" / "G" / "Weekly"
+    folder.mkdir(parents=True)
+    demand_table().to_excel(folder / "Demand.xlsx", index=False)
+    results, stats = run_batch(str(tmp_path), workers=1)
+    assert stats["series"] == 1 and stats["failed"] == 0
+    assert results["file"].iat[0].endswith("Demand.xlsx")
+
+
+def test_batch_follows_the_sqlite_backend(tmp_path, monkeypatch):
+    path = str(tmp_path / "demand.sqlite")
+    key = database.write_series("F", "T", "G", "Weekly", "Demand.xlsx", demand_table(), path)
+    database.append_op(key, "add", path, row={"Week": 21, "Demand": 50.0})
+    monkeypatch.setattr(storage, "BACKEND", "sqlite")
+    monkeypatch.setattr(storage, "DATABASE", path)
+    results, stats = run_batch(str(tmp_path / "Uploaded"), workers=1)
+    assert stats["failed"] == 0
+    assert results["file"].tolist() == [key]
+    assert results["Records"].tolist() == [21]
+    assert results["Naive MAD"].iat[0] == pytest.approx(2.0 * 20 / 21)
@@ -0,0 +1,110 @@
+"""
+In-place edits, position shifts and undo of the SQLite storage (Data_Storage.database).
+"""
+import sqlite3
+import numpy as np
+import pandas as pd
+import pytest
+from Data_Storage import database
+
+
+@pytest.fixture
+def stored(tmp_path):
+    path = str(tmp_path / "demand.sqlite")
+    df = pd.DataFrame({"Week": np.arange(1, 7), "Demand": [10.0, np.nan, 30.0, 40.0, 50.0, 60.0]})
+    key = database.write_series("F", "T", "G", "Weekly", "Demand.xlsx", df, path)
+    return key, path, df
+
+
+def test_round_trip_keeps_nan_and_integers(stored):
+    key, path, df = stored
+    result = database.read_series(key, path)
+    pd.testing.assert_frame_equal(result, df)
+    assert result["Week"].dtype == np.int64
+
+
+def test_delete_shifts_positions_and_undo_restores(stored):
+    key, path, df = stored
+    database.append_op(key, "delete", path, index=2, first_col="Week")
+    expected = df.drop(index=2).reset_index(drop=True).assign(Week=np.arange(1, 6))
+    pd.testing.assert_frame_equal(database.read_series(key, path), expected)
+    assert database.undo_last(key, path)
+    pd.testing.assert_frame_equal(database.read_series(key, path), df)
+
+
+def test_delete_first_and_last_rows(stored):
+    key, path, df = stored
+    database.append_op(key, "delete", path, index=0, first_col="Week")
+    database.append_op(key, "delete", path, index=4, first_col="Week")
+    assert database.read_series(key, path)["Demand"].tolist()[1:] == [30.0, 40.0, 50.0]
+    assert database.undo_last(key, path) and database.undo_last(key, path)
+    pd.testing.assert_frame_equal(database.read_series(key, path), df)
+
+
+def test_add_and_edit_undo_in_reverse_order(stored):
+    key, path, df = stored
+    database.append_op(key, "add", path, row={"Week": 7, "Demand": 70.0})
+    database.append_op(key, "edit", path, index=1, values={"Demand": 25.0}, first_col="Week")
+    edited = database.read_series(key, path)
+    assert len(edited) == 7 and edited["Demand"].iat[1] == 25.0 and edited["Demand"].iat[6] == 70.0
+    assert len(database.history(key, path)) == 2
+    assert database.undo_last(key, path)
+    assert np.isnan(database.read_series(key, path)["Demand"].iat[1])
+    assert database.undo_last(key, path)
+    pd.testing.assert_frame_equal(database.read_series(key, path), df)
+    assert not database.undo_last(key, path)
+
+
+def test_every_edit_changes_the_signature(stored):
+    key, path, _ = stored
+    before = database.signature(key, path)
+    database.append_op(key, "edit", path, index=0, values={"Demand": 11.0}, first_col="Week")
+    after = database.signature(key, path)
+    database.undo_last(key, path)
+    assert len({repr(before), repr(after), repr(database.signature(key, path))}) == 3
+
+
+def test_out_of_range_edit_leaves_the_table_unchanged(stored):
+    key, path, df = stored
+    with pytest.raises(IndexError):
+        database.append_op(key, "delete", path, index=6, first_col="Week")
+    pd.testing.assert_frame_equal(database.read_series(key, path), df)
+    assert database.history(key, path) == []
+
+
+@pytest.mark.parametrize("period", [
+    pd.Series(["2024-W01", "007", None, "2024-W04"]),
+    pd.Series(pd.to_datetime(["2024-01-01", "2024-01-08", None, "2024-01-22"])),
+])
+def test_round_trip_keeps_text_and_date_periods(tmp_path, period):
+    path = str(tmp_path / "demand.sqlite")
+    df = pd.DataFrame({"Period": period, "Week": np.arange(1, 5), "Demand": [1.5, 2.0, np.nan, 4.0],
+                       "Promo": [True, False, False, True]})
+    key = database.write_series("F", "T", "G", "Weekly", "Demand.xlsx", df, path)
+    pd.testing.assert_frame_equal(database.read_series(key, path), df)
+    database.append_op(key, "delete", path, index=0, first_col="Week")
+    assert database.read_series(key, path)["Period"].iloc[0] == df["Period"].iat[1]
+
+
+def test_mixed_column_is_rejected_before_writing(tmp_path):
+    path = str(tmp_path / "demand.sqlite")
+    df = pd.DataFrame({"Week": [1, 2], "Mix": [1, "a"]})
+    with pytest.raises(ValueError, match="Mix"):
+        database.write_series("F", "T", "G", "Weekly", "Demand.xlsx", df, path)
+    assert database.list_series("F", "T", "G", "Weekly", path) == []
+
+
+def test_real_typed_database_is_migrated(tmp_path):
+    path = str(tmp_path / "demand.sqlite")
+    conn = sqlite3.connect(path)
+    conn.executescript(database.SCHEMA.replace("    value,", "    value REAL,"))
+    conn.execute("INSERT INTO series (id, family, type, grade, period, name, columns, dtypes, rows) "
+                 "VALUES (1, 'F', 'T', 'G', 'Weekly', 'Demand.xlsx', '[\"Week\"]', '[\"int\"]', 2)")
+    conn.executemany("INSERT INTO observations VALUES (1, 0, ?, ?)", [(0, 1.0), (1, 2.0)])
+    conn.commit()
+    conn.close()
+    key = database.list_series("F", "T", "G", "Weekly", path)[0][1]
+    assert database.read_series(key, path)["Week"].tolist() == [1, 2]
+    df = pd.DataFrame({"Label": ["007", "8"]})
+    key = database.write_series("F", "T", "G", "Weekly", "Labels.xlsx", df, path)
+    pd.testing.assert_frame_equal(database.read_series(key, path), df)
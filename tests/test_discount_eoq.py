@@ -0,0 +1,69 @@
+"""
+All-units quantity discount EOQ (Inventory_Methods.EOQ) against a brute-force order quantity scan.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from Inventory_Methods.EOQ.eoq import calculate_eoq, quantity_discount_eoq
+from Inventory_Methods.EOQ.catalog_eoq import catalog_eoq
+
+LEVELS = ["MaterialFamily", "MaterialType", "MaterialGrade"]
+
+
+def scan_total_cost(D, S, min_qty, price, holding_cost=None, holding_rate=None):
+    """
+    Cheapest total annual cost over every whole order quantity, each paying the price of its break.
+    """
+    quantity = np.arange(1.0, 20001.0)
+    index = np.searchsorted(min_qty, quantity, side="right") - 1
+    ok = index >= 0
+    quantity, unit = quantity[ok], np.asarray(price)[index[ok]]
+    H = unit * holding_rate if holding_rate is not None else holding_cost
+    total = D * S / quantity + quantity / 2 * H + D * unit
+    best = np.argmin(total)
+    return quantity[best], unit[best], total[best]
+
+
+@pytest.mark.parametrize("D, S, min_qty, price, holding_cost, holding_rate", [
+    (1200.0, 100.0, [0, 500, 1000], [5.0, 4.8, 4.75], 2.0, None),
+    (10000.0, 50.0, [0, 300, 2000], [10.0, 9.5, 9.0], None, 0.2),
+    (800.0, 400.0, [0, 100], [3.0, 2.5], None, 0.25),
+    (50.0, 20.0, [0, 5000], [20.0, 15.0], 4.0, None),
+])
+def test_discount_eoq_matches_quantity_scan(D, S, min_qty, price, holding_cost, holding_rate):
+    q, p, total = quantity_discount_eoq(
+        [D], [S], [min_qty], [price],
+        None if holding_cost is None else [holding_cost], None if holding_rate is None else [holding_rate])
+    _, scan_price, scan_total = scan_total_cost(D, S, np.asarray(min_qty, float), price, holding_cost, holding_rate)
+    assert p[0] == scan_price
+    assert total[0] == pytest.approx(scan_total, rel=1e-4)
+    assert total[0] <= scan_total + 1e-9
+
+
+def test_padded_breaks_and_materials_without_prices():
+    nan = np.nan
+    q, p, total = quantity_discount_eoq(
+        [1200.0, 1200.0, 1200.0], [100.0] * 3,
+        [[0, 500, 1000], [0, nan, nan], [nan, nan, nan]],
+        [[5.0, 4.8, 4.75], [5.0, nan, nan], [nan, nan, nan]], [2.0] * 3)
+    assert q[1] == pytest.approx(calculate_eoq(1200.0, 100.0, 2.0))
+    assert p[1] == 5.0
+    assert np.isnan(q[2]) and np.isnan(p[2]) and np.isnan(total[2])
+
+
+def test_catalog_eoq_applies_breaks_per_material():
+    catalog = pd.DataFrame({"MaterialFamily": ["F", "F"], "MaterialType": ["T", "T"], "MaterialGrade": [1, 2]})
+    demand = {("F", "T", str(g)): {"Period": "Weekly", "File": f"{g}.xlsx", "Records": 52, "Annual Demand": 1200.0}
+              for g in (1, 2)}
+    params = pd.DataFrame({**{level: catalog[level] for level in LEVELS}, "OrderingCost": 100.0,
+                           "HoldingRate": 0.4, "UnitPrice": 5.0})
+    discounts = pd.DataFrame({"MaterialFamily": "F", "MaterialType": "T", "MaterialGrade": [2, 2],
+                              "MinQty": [0, 500], "UnitPrice": [5.0, 4.8]})
+    result = catalog_eoq(catalog, demand, params, discounts).set_index("MaterialGrade")
+    assert result.at[1, "Unit Price"] == 5.0
+    assert result.at[1, "EOQ"] == pytest.approx(calculate_eoq(1200.0, 100.0, 2.0))
+    expected = quantity_discount_eoq([1200.0], [100.0], [[0, 500]], [[5.0, 4.8]], [np.nan], [0.4])
+    assert result.at[2, "EOQ"] == pytest.approx(expected[0][0])
+    assert result.at[2, "Unit Price"] == expected[1][0]
+    assert result.at[2, "Holding Cost (H)"] == pytest.approx(0.4 * expected[1][0])
+    assert result.at[2, "Total Annual Cost"] == pytest.approx(expected[2][0])
@@ -0,0 +1,67 @@
+"""
+Fused error engine (Forecasting_Error.Error_Engine) against the per-metric definitions.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from Forecasting_Error.Error_Engine.engine import METRICS, error_metrics, score_frame
+from Forecasting_Error.MAD.mad import calculate_mad
+from Forecasting_Error.MSE.mse import calculate_mse
+
+
+def reference_metrics(demand, forecast):
+    """
+    Every metric computed on its own, one method at a time.
+    """
+    error = demand - forecast
+    mad = np.mean(np.abs(error))
+    nonzero = demand != 0
+    return {
+        "MAD": mad,
+        "MSE": np.mean(error ** 2),
+        "RMSE": np.sqrt(np.mean(error ** 2)),
+        "MAPE": np.mean(np.abs(error[nonzero]) / np.abs(demand[nonzero])) * 100,
+        "Bias": np.mean(error),
+        "Tracking Signal": error.sum() / mad if mad > 0 else 0.0,
+    }
+
+
+@pytest.fixture
+def demand():
+    rng = np.random.default_rng(12)
+    values = rng.integers(0, 40, 25).astype(float)
+    values[[3, 11]] = 0.0
+    return values
+
+
+def test_matrix_matches_per_method_metrics(demand):
+    rng = np.random.default_rng(3)
+    forecasts = demand[:, None] + rng.normal(0, 5, (len(demand), 4))
+    forecasts[:, 3] = demand
+    result = error_metrics(demand, forecasts)
+    for j in range(forecasts.shape[1]):
+        expected = reference_metrics(demand, forecasts[:, j])
+        for metric in METRICS:
+            assert result[metric][j] == pytest.approx(expected[metric], rel=1e-12, abs=1e-12)
+
+
+def test_single_forecast_returns_floats(demand):
+    result = error_metrics(demand, demand + 2.0)
+    assert set(result) == set(METRICS)
+    assert all(isinstance(value, float) for value in result.values())
+    assert result["Bias"] == pytest.approx(-2.0)
+    assert result["Tracking Signal"] == pytest.approx(-len(demand))
+
+
+def test_score_frame_agrees_with_mad_and_mse_pages(demand):
+    df = pd.DataFrame({"Demand": demand, "Naive": np.r_[demand[0], demand[:-1]], "Flat": demand.mean()})
+    table = score_frame(df, {"Naive Method": "Naive", "Flat Line": "Flat"})
+    assert table["Method"].tolist() == ["Naive Method", "Flat Line"]
+    for row, col in zip(table.itertuples(index=False), ["Naive", "Flat"]):
+        assert row.MAD == pytest.approx(calculate_mad(df, forecast_col=col)[0], rel=1e-12)
+        assert row.MSE == pytest.approx(calculate_mse(df, forecast_col=col)[0], rel=1e-12)
+
+
+def test_score_frame_reports_missing_columns(demand):
+    with pytest.raises(KeyError, match="Missing"):
+        score_frame(pd.DataFrame({"Demand": demand}), ["Missing"])
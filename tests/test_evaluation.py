@@ -0,0 +1,83 @@
+"""
+Concurrent method evaluation (Compute_Core.evaluation): budgets, failures and per-owner stragglers.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from Compute_Core.evaluation import MAX_ABANDONED, abandoned, evaluate_concurrently
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=8)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.fixture
+def release():
+    """
+    An event that blocking tasks wait on; set at teardown so no worker is left hanging.
+    """
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_slow_method_is_dropped_and_counted_until_it_finishes(executor, release):
+    seen = []
+    tasks = {"Naive": lambda: 1, "Holt": lambda: release.wait(10) and 2}
+    results, status = evaluate_concurrently(tasks, budget=0.2, executor=executor, owner="a",
+                                            on_result=lambda record, value: seen.append((record["Method"], value)))
+    assert results == {"Naive": 1}
+    assert {r["Method"]: r["Status"] for r in status} == {"Naive": "done", "Holt": "timed out"}
+    assert seen == [("Naive", 1), ("Holt", None)]
+    assert abandoned("a") == 1
+    release.set()
+    assert wait_until(lambda: abandoned("a") == 0)
+
+
+def test_failures_are_reported_not_raised(executor):
+    def broken():
+        raise ValueError("no demand column")
+    results, status = evaluate_concurrently({"Broken": broken, "Naive": lambda: 3}, budget=2.0, executor=executor)
+    assert results == {"Naive": 3}
+    failed = next(r for r in status if r["Method"] == "Broken")
+    assert failed["Status"] == "failed" and failed["Error"] == "no demand column"
+
+
+def test_queued_method_past_its_budget_is_cancelled(release):
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        _, status = evaluate_concurrently({"Slow": lambda: release.wait(10), "Queued": lambda: 1},
+                                          budget=0.2, executor=pool, owner="b")
+        queued = next(r for r in status if r["Method"] == "Queued")
+        assert queued["Status"] == "timed out" and queued["Error"] == "never started within the budget"
+        assert abandoned("b") == 1
+    finally:
+        release.set()
+        pool.shutdown(wait=True)
+
+
+def test_owner_with_too_many_stragglers_is_skipped_alone(executor, release):
+    slow = {f"Slow {i}": (lambda: release.wait(10)) for i in range(MAX_ABANDONED)}
+    evaluate_concurrently(slow, budget=0.1, executor=executor, owner="c")
+    assert abandoned("c") == MAX_ABANDONED
+
+    results, status = evaluate_concurrently({"Naive": lambda: 1}, budget=0.2, executor=executor, owner="c")
+    assert results == {} and [r["Status"] for r in status] == ["skipped"]
+    other, _ = evaluate_concurrently({"Naive": lambda: 1}, budget=0.2, executor=executor, owner="d")
+    assert other == {"Naive": 1}
+
+    release.set()
+    assert wait_until(lambda: abandoned("c") == 0)
+    results, _ = evaluate_concurrently({"Naive": lambda: 1}, budget=0.2, executor=executor, owner="c")
+    assert results == {"Naive": 1}
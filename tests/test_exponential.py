@@ -0,0 +1,56 @@
+"""
+Prefix-scan exponential smoothing kernel against the plain scalar SES loop.
+"""
+import numpy as np
+import pytest
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import (
+    exponential_smoothing_levels, exponential_smoothing_kernel)
+
+
+def scalar_ses(demand, alpha, initial_level=None):
+    """
+    (levels, forecasts) one period at a time; Level(0) = Actual(0) unless initial_level is given.
+    """
+    levels, forecasts = [], []
+    level = initial_level
+    for actual in demand:
+        forecasts.append(actual if level is None else level)
+        level = actual if level is None else alpha * actual + (1 - alpha) * level
+        levels.append(level)
+    return np.array(levels), np.array(forecasts)
+
+
+@pytest.fixture
+def demand():
+    return np.random.default_rng(11).uniform(0, 100, (4, 37))
+
+
+@pytest.mark.parametrize("alpha", [1e-9, 0.01, 0.3, 0.999999, 1.0])
+def test_matches_scalar_loop(demand, alpha):
+    for series in demand:
+        levels, forecasts = scalar_ses(series, alpha)
+        np.testing.assert_allclose(exponential_smoothing_levels(series, alpha), levels, rtol=1e-10)
+        np.testing.assert_allclose(exponential_smoothing_kernel(series, alpha), forecasts, rtol=1e-10)
+
+
+def test_alpha_one_is_naive(demand):
+    np.testing.assert_array_equal(exponential_smoothing_kernel(demand, 1.0)[:, 1:], demand[:, :-1])
+
+
+def test_2d_input_and_one_alpha_per_series(demand):
+    alphas = np.array([0.1, 0.3, 0.6, 0.9])[:, None]
+    batched = exponential_smoothing_kernel(demand, alphas)
+    for i, series in enumerate(demand):
+        np.testing.assert_allclose(batched[i], scalar_ses(series, alphas[i, 0])[1], rtol=1e-10)
+
+
+def test_initial_level(demand):
+    levels = exponential_smoothing_levels(demand[0], 0.2, initial_level=50.0)
+    np.testing.assert_allclose(levels, scalar_ses(demand[0], 0.2, initial_level=50.0)[0], rtol=1e-10)
+
+
+@pytest.mark.parametrize("shape", [(0,), (1,), (3, 0), (3, 1)])
+def test_short_series(shape):
+    demand = np.arange(np.prod(shape), dtype=float).reshape(shape) + 5
+    assert exponential_smoothing_levels(demand, 0.3).shape == shape
+    np.testing.assert_array_equal(exponential_smoothing_kernel(demand, 0.3), demand)
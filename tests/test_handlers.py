@@ -0,0 +1,22 @@
+"""
+HTTP service handlers (Service.handlers): input validation.
+"""
+import pytest
+from Service.handlers import eoq
+
+
+@pytest.mark.parametrize("field, value", [
+    ("annual_demand", -1), ("annual_demand", "nan"), ("ordering_cost", -5), ("ordering_cost", "nan"),
+    ("holding_cost", 0), ("holding_cost", -2), ("holding_cost", "nan"),
+])
+def test_eoq_rejects_invalid_costs(field, value):
+    item = {"annual_demand": 1200, "ordering_cost": 100, "holding_cost": 2, field: value}
+    with pytest.raises(ValueError):
+        eoq(item)
+
+
+def test_eoq_result():
+    result = eoq({"annual_demand": 1200, "ordering_cost": 100, "holding_cost": 2, "lead_time_days": 10})
+    assert result["eoq"] == pytest.approx(346.41, abs=0.01)
+    assert result["reorder_point"] == pytest.approx(1200 / 365 * 10)
+    assert result["days_between_orders"] == pytest.approx(346.41 / (1200 / 365), rel=1e-4)
@@ -0,0 +1,55 @@
+"""
+Incremental forecaster state (Forecasting_Methods.Incremental_Method) against a full recompute.
+"""
+import numpy as np
+import pytest
+from Forecasting_Methods.Incremental_Method import incremental
+from Forecasting_Methods.Incremental_Method.incremental import IncrementalForecaster
+from Forecasting_Error.Error_Engine.engine import error_metrics
+
+
+@pytest.fixture
+def demand():
+    rng = np.random.default_rng(3)
+    demand = rng.integers(0, 40, 30).astype(float)
+    demand[4] = 0.0
+    return demand
+
+
+def test_appends_match_full_recompute(demand):
+    fc = IncrementalForecaster.from_series(demand[:10])
+    for actual in demand[10:]:
+        fc.append(actual)
+    full = IncrementalForecaster.from_series(demand)
+    for method, values in full.metrics().items():
+        for metric, value in values.items():
+            assert fc.metrics()[method][metric] == pytest.approx(value, rel=1e-12)
+    assert fc.next_forecasts() == pytest.approx(full.next_forecasts(), rel=1e-12)
+
+
+def test_metrics_match_error_engine(demand):
+    fc = IncrementalForecaster.from_series(demand, ma_n=4, alpha=0.2)
+    naive = np.concatenate([demand[:1], demand[:-1]])
+    ma = np.array([demand[0]] + [demand[max(0, t - 4):t].mean() for t in range(1, len(demand))])
+    level, ses = demand[0], []
+    for actual in demand:
+        ses.append(level)
+        level = 0.2 * actual + 0.8 * level
+    expected = error_metrics(demand, np.column_stack([naive, ma, ses]))
+    for j, method in enumerate(incremental.METHODS):
+        for metric, values in expected.items():
+            assert fc.metrics()[method][metric] == pytest.approx(values[j], rel=1e-12)
+
+
+def test_record_append_updates_and_rewrite_rebuilds(tmp_path, demand):
+    path = str(tmp_path / "Demand.xlsx")
+    with open(path, "wb") as f:
+        f.write(b"workbook")
+    incremental.record_rewrite(path, demand[:-1])
+    fc = incremental.record_append(path, demand)
+    assert fc.count == len(demand)
+    assert incremental.state_for(path, demand).metrics() == fc.metrics()
+    edited = demand.copy()
+    edited[0] += 5
+    rebuilt = incremental.record_rewrite(path, edited)
+    assert rebuilt.metrics() == IncrementalForecaster.from_series(edited).metrics()
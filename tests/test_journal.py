@@ -0,0 +1,94 @@
+"""
+Edit journal of the xlsx storage (Data_Storage.journal): replay, undo and compaction.
+"""
+import threading
+import pandas as pd
+import pytest
+from Data_Storage import journal
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = str(tmp_path / "Demand.xlsx")
+    df = pd.DataFrame({"Week": [1, 2, 3], "Demand": [10.0, 20.0, 30.0]})
+    df.to_excel(path, index=False)
+    return path, pd.read_excel(path)
+
+
+def add(path, week, demand):
+    journal.append_op(path, "add", row={"Week": week, "Demand": demand})
+
+
+def compact_with(path, monkeypatch, during):
+    """
+    compact() with during() run while the temporary workbook is being written.
+    """
+    to_excel = pd.DataFrame.to_excel
+    calls = []
+
+    def write(self, *args, **kwargs):
+        if not calls:
+            during()
+        calls.append(1)
+        return to_excel(self, *args, **kwargs)
+    monkeypatch.setattr(pd.DataFrame, "to_excel", write)
+    return journal.compact(path)
+
+
+def test_replay_and_undo(workbook):
+    path, df = workbook
+    add(path, 4, 40.0)
+    journal.append_op(path, "edit", index=0, values={"Demand": 15.0}, first_col="Week")
+    assert journal.read_journaled(path)["Demand"].tolist() == [15.0, 20.0, 30.0, 40.0]
+    assert journal.undo_last(path) and journal.undo_last(path)
+    pd.testing.assert_frame_equal(journal.read_journaled(path), df)
+    assert not journal.undo_last(path)
+
+
+def test_compaction_folds_journal_into_workbook(workbook):
+    path, df = workbook
+    add(path, 4, 40.0)
+    assert journal.compact(path) == 1
+    assert journal.read_ops(path) == []
+    assert pd.read_excel(path)["Demand"].tolist() == [10.0, 20.0, 30.0, 40.0]
+
+
+def test_undo_during_compaction_cancels_folded_op(workbook, monkeypatch):
+    path, df = workbook
+    add(path, 4, 40.0)
+    compact_with(path, monkeypatch, lambda: journal.undo_last(path))
+    pd.testing.assert_frame_equal(journal.read_journaled(path), df)
+    assert journal.history(path) == []
+
+
+def test_ops_during_compaction_are_carried_over(workbook, monkeypatch):
+    path, df = workbook
+    add(path, 4, 40.0)
+
+    def edits():
+        add(path, 5, 50.0)
+        add(path, 6, 60.0)
+        journal.undo_last(path)
+    compact_with(path, monkeypatch, edits)
+    assert pd.read_excel(path)["Demand"].tolist() == [10.0, 20.0, 30.0, 40.0]
+    assert [op["row"]["Demand"] for op in journal.history(path)] == [50.0]
+    assert journal.read_journaled(path)["Demand"].tolist() == [10.0, 20.0, 30.0, 40.0, 50.0]
+    assert journal.undo_last(path)
+    assert journal.read_journaled(path)["Demand"].tolist() == [10.0, 20.0, 30.0, 40.0]
+
+
+@pytest.mark.skipif(journal.fcntl is None, reason="POSIX file locks")
+def test_append_waits_for_lock_held_by_another_process(workbook):
+    path, df = workbook
+    add(path, 4, 40.0)
+    lock = journal._lock_for(path)
+    # A separate open file stands in for another process holding the workbook lock
+    with open(lock.path, "a+b") as other:
+        journal.fcntl.flock(other.fileno(), journal.fcntl.LOCK_EX)
+        writer = threading.Thread(target=add, args=(path, 5, 50.0))
+        writer.start()
+        writer.join(0.3)
+        assert writer.is_alive()
+        journal.fcntl.flock(other.fileno(), journal.fcntl.LOCK_UN)
+    writer.join(5)
+    assert journal.read_journaled(path)["Demand"].tolist() == [10.0, 20.0, 30.0, 40.0, 50.0]
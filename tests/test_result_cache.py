@@ -0,0 +1,58 @@
+"""
+Forecast result cache (Forecasting_Cache.result_cache): keys, LRU budget and invalidation.
+"""
+import numpy as np
+import pandas as pd
+from Forecasting_Cache.result_cache import ForecastCache, frame_digest, make_key
+
+
+def test_digest_follows_content_not_index():
+    df = pd.DataFrame({"Week": [1, 2, 3], "Demand": [10.0, 12.0, 11.0]})
+    assert frame_digest(df) == frame_digest(df.set_axis([7, 8, 9]))
+    assert frame_digest(df) != frame_digest(df.assign(Demand=[10.0, 12.0, 11.5]))
+    assert frame_digest(df) != frame_digest(df.rename(columns={"Demand": "Sales"}))
+
+
+def test_key_ignores_parameter_order():
+    assert make_key("d", "Holt", {"alpha": 0.3, "beta": 0.1}) == make_key("d", "Holt", {"beta": 0.1, "alpha": 0.3})
+    assert make_key("d", "Holt", {"alpha": 0.3}) != make_key("d", "Holt", {"alpha": 0.3}, "MAD")
+
+
+def test_get_or_compute_only_computes_on_a_miss():
+    cache, calls = ForecastCache(), []
+    compute = lambda: calls.append(1) or np.arange(4.0)
+    first = cache.get_or_compute("k", compute)
+    second = cache.get_or_compute("k", compute)
+    assert second is first and len(calls) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_keeps_recently_used_within_budget():
+    block = np.zeros(100)
+    cache = ForecastCache(max_bytes=2 * block.nbytes)
+    cache.put("a", block.copy())
+    cache.put("b", block.copy())
+    cache.get("a")
+    cache.put("c", block.copy())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["bytes"] <= stats["max_bytes"]
+
+
+def test_oversized_value_is_returned_but_not_stored():
+    cache = ForecastCache(max_bytes=10)
+    value = np.zeros(100)
+    assert cache.put("big", value) is value
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalidate_drops_only_the_edited_source():
+    cache = ForecastCache()
+    cache.put("x1", 1.0, source="x.xlsx")
+    cache.put("x2", 2.0, source="x.xlsx")
+    cache.put("y1", 3.0, source="y.xlsx")
+    assert cache.invalidate("x.xlsx") == 2
+    assert cache.get("x1") is None and cache.get("y1") == 3.0
+    assert cache.invalidate() == 1
+    assert cache.stats()["bytes"] == 0
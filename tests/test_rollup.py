@@ -0,0 +1,79 @@
+"""
+Coarser-period rollups (Period_Rollup.rollup) against a bucket-by-bucket groupby.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from Data_Storage import storage
+from Forecasting_Cache.result_cache import forecast_cache
+from Period_Rollup.rollup import bucket_edges, derived_table, rollup_cache, rollup_frame
+
+
+def weekly_table(weeks):
+    rng = np.random.default_rng(19)
+    return pd.DataFrame({"Week": np.arange(1, weeks + 1), "Demand": rng.integers(0, 50, weeks).astype(float),
+                         "Note": ["x"] * weeks})
+
+
+def month_of_week(weeks):
+    """
+    Month number of every week on a 4-4-5 calendar.
+    """
+    months = [m for m, size in enumerate([4, 4, 5] * (weeks // 4 + 1)) for _ in range(size)]
+    return np.array(months[:weeks])
+
+
+def test_weekly_to_monthly_follows_445_calendar():
+    df = weekly_table(60)
+    expected = df.groupby(month_of_week(60))["Demand"].sum()
+    complete = expected[np.bincount(month_of_week(60)) == np.resize([4, 4, 5], expected.size)]
+    result = rollup_frame(df, "Weekly", "Monthly")
+    assert result.columns.tolist() == ["Month", "Demand"]
+    assert result["Month"].tolist() == list(range(1, len(complete) + 1))
+    np.testing.assert_allclose(result["Demand"], complete.to_numpy())
+    assert len(result) == 14
+
+
+@pytest.mark.parametrize("source, target, size", [
+    ("Weekly", "Quarterly", 13), ("Weekly", "Annual", 52), ("Monthly", "Quarterly", 3), ("Quarterly", "Semi-Annual", 2),
+])
+def test_even_buckets_drop_incomplete_tail(source, target, size):
+    df = weekly_table(110).rename(columns={"Week": "Period"})
+    result = rollup_frame(df, source, target, "Period")
+    full = len(df) // size
+    np.testing.assert_allclose(result["Demand"], df["Demand"].to_numpy()[:full * size].reshape(full, size).sum(axis=1))
+
+
+def test_finer_target_is_rejected():
+    with pytest.raises(ValueError):
+        bucket_edges(12, "Monthly", "Weekly")
+
+
+def test_derived_tables_follow_edits(tmp_path):
+    path = str(tmp_path / "Demand.xlsx")
+    weekly = weekly_table(39).drop(columns="Note")
+    weekly.to_excel(path, index=False)
+    quarters = derived_table(path, "Weekly", "Quarterly")
+    np.testing.assert_allclose(quarters["Demand"], weekly["Demand"].to_numpy().reshape(3, 13).sum(axis=1))
+    assert derived_table(path, "Weekly", "Annual").empty
+
+    storage.append_op(path, "edit", index=0, values={"Demand": 100.0})
+    for week in range(40, 53):
+        storage.append_op(path, "add", row={"Week": week, "Demand": 1.0})
+    quarters = derived_table(path, "Weekly", "Quarterly")
+    assert quarters["Demand"].iat[0] == pytest.approx(weekly["Demand"][1:13].sum() + 100.0)
+    assert quarters["Demand"].iat[3] == 13.0
+    assert derived_table(path, "Weekly", "Annual")["Demand"].iat[0] == pytest.approx(quarters["Demand"].sum())
+
+
+def test_forecast_cache_pressure_does_not_evict_rollups(tmp_path):
+    path = str(tmp_path / "Demand.xlsx")
+    weekly_table(52).drop(columns="Note").to_excel(path, index=False)
+    derived_table(path, "Weekly", "Monthly")
+    filler = np.zeros(forecast_cache.max_bytes // (8 * 4))
+    for i in range(8):
+        forecast_cache.put(("filler", i), filler.copy())
+    forecast_cache.invalidate()
+    misses = rollup_cache.stats()["misses"]
+    derived_table(path, "Weekly", "Annual")
+    assert rollup_cache.stats()["misses"] == misses
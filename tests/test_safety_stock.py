@@ -0,0 +1,44 @@
+"""
+Accuracy of the AS241 normal quantile behind the safety stock z-scores.
+"""
+import numpy as np
+import pytest
+from Inventory_Methods.Safety_Stock.safety_stock import inverse_normal, z_score
+
+# Reference quantiles of the standard normal distribution
+KNOWN = {
+    1e-10: -6.361340902404056,
+    1e-9: -5.997807015007687,
+    0.001: -3.090232306167813,
+    0.05: -1.6448536269514729,
+    0.5: 0.0,
+    0.8: 0.8416212335729143,
+    0.95: 1.6448536269514722,
+    0.975: 1.959963984540054,
+    0.99: 2.3263478740408408,
+    0.999: 3.090232306167813,
+}
+
+
+@pytest.mark.parametrize("p, expected", KNOWN.items())
+def test_known_quantiles(p, expected):
+    assert inverse_normal(p) == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_matches_scipy_on_a_grid():
+    stats = pytest.importorskip("scipy.stats")
+    p = np.concatenate([np.logspace(-300, -1, 200), np.linspace(0.01, 0.99, 199)])
+    p = np.concatenate([p, 1 - p[p > 1e-15]])
+    np.testing.assert_allclose(inverse_normal(p), stats.norm.ppf(p), rtol=1e-13, atol=1e-13)
+
+
+def test_symmetry_and_edges():
+    p = np.linspace(0.001, 0.499, 50)
+    np.testing.assert_allclose(inverse_normal(p), -inverse_normal(1 - p), rtol=1e-12)
+    assert inverse_normal(0.0) == -np.inf and inverse_normal(1.0) == np.inf
+    assert np.isnan(inverse_normal(-0.1)) and np.isnan(inverse_normal(1.1))
+
+
+def test_z_score_takes_percent():
+    assert z_score(95) == pytest.approx(1.6448536269514722, rel=1e-12)
+    np.testing.assert_allclose(z_score([90, 99]), inverse_normal([0.9, 0.99]))
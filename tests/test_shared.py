@@ -0,0 +1,76 @@
+"""
+Shared read-only tables (Data_Storage.shared): leases, copy-on-write and memory-mapped versions.
+"""
+import gc
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from Data_Storage.shared import SharedDatasets
+
+
+def table(scale=1.0):
+    return pd.DataFrame({"Week": np.arange(1, 6), "Demand": np.arange(5.0) * scale, "Note": list("abcde")})
+
+
+def is_mapped(values):
+    while values is not None and not isinstance(values, np.memmap):
+        values = values.base
+    return values is not None
+
+
+def counting_load(df):
+    calls = []
+    return calls, lambda: calls.append(1) or df
+
+
+def test_sessions_share_one_read_only_frame():
+    shared = SharedDatasets(mmap=False)
+    calls, load = counting_load(table())
+    first, second = shared.acquire("k", load, 1), shared.acquire("k", load, 1)
+    assert first.frame is second.frame and len(calls) == 1
+    assert shared.stats()["leases"] == 2 and shared.stats()["hits"] == 1
+    with pytest.raises(ValueError):
+        first.frame["Demand"].to_numpy()[0] = 99.0
+    edited = first.frame.copy()
+    edited.loc[0, "Demand"] = 99.0
+    assert first.frame["Demand"].iat[0] == 0.0
+
+
+def test_table_is_dropped_with_its_last_lease():
+    shared = SharedDatasets(mmap=False)
+    first = shared.acquire("k", lambda: table(), 1)
+    second = shared.acquire("k", lambda: table(), 1)
+    first.release()
+    first.release()
+    assert shared.stats()["tables"] == 1 and shared.stats()["leases"] == 1
+    del second
+    gc.collect()
+    assert shared.stats() == {"tables": 0, "leases": 0, "bytes": 0, "mmap": False, "hits": 1, "misses": 1}
+
+
+def test_new_signature_reloads_while_old_holders_keep_their_version():
+    shared = SharedDatasets(mmap=False)
+    old = shared.acquire("k", lambda: table(), 1)
+    new = shared.acquire("k", lambda: table(2.0), 2)
+    assert old.frame["Demand"].iat[1] == 1.0 and new.frame["Demand"].iat[1] == 2.0
+    assert shared.stats()["tables"] == 1
+    assert shared.acquire("k", lambda: None, 3) is None
+
+
+def test_mapped_versions_are_removed_after_their_last_lease(tmp_path):
+    shared = SharedDatasets(mmap=True, folder=str(tmp_path))
+    old = shared.acquire("k", lambda: table(), 1)
+    assert is_mapped(old.frame["Demand"].to_numpy()) and not is_mapped(old.frame["Note"].to_numpy())
+    assert old.frame["Note"].tolist() == list("abcde")
+    old_folder = shared._folder("k", 1)
+    assert sorted(os.listdir(old_folder)) == ["c0.npy", "c1.npy"]
+
+    new = shared.acquire("k", lambda: table(2.0), 2)
+    assert os.path.isdir(old_folder)
+    old.release()
+    assert not os.path.exists(old_folder)
+    new.release()
+    assert os.path.isdir(shared._folder("k", 2))
+    again = shared.acquire("k", lambda: table(2.0), 2)
+    np.testing.assert_array_equal(again.frame["Demand"], table(2.0)["Demand"])
@@ -0,0 +1,43 @@
+"""
+Workbook reads through the columnar sidecar (Data_Storage.sidecar) equal pd.read_excel.
+"""
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from Data_Storage.sidecar import read_excel_cached, sidecar_paths
+
+
+def write_workbook(tmp_path, df):
+    path = str(tmp_path / "Demand.xlsx")
+    df.to_excel(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("df", [
+    pd.DataFrame({"Week": [1, 2, 3], "Demand": [10.5, np.nan, 30.0], "Label": ["a", None, "c"]}),
+    pd.DataFrame({"Month": pd.to_datetime(["2024-01-01", "2024-02-01", None]), 2023: [1.0, 2.0, 3.0]}),
+    pd.DataFrame({2023: [1, 2], "Mix": [1, "a"]}),
+])
+def test_warm_read_equals_cold_read(tmp_path, df):
+    path = write_workbook(tmp_path, df)
+    cold = read_excel_cached(path)
+    pd.testing.assert_frame_equal(cold, pd.read_excel(path))
+    warm = read_excel_cached(path)
+    pd.testing.assert_frame_equal(warm, cold)
+    assert warm.columns.tolist() == cold.columns.tolist()
+    assert [type(c) for c in warm.columns.tolist()] == [type(c) for c in cold.columns.tolist()]
+
+
+def test_mixed_object_column_gets_no_sidecar(tmp_path):
+    path = write_workbook(tmp_path, pd.DataFrame({2023: [1, 2], "Mix": [1, "a"]}))
+    read_excel_cached(path)
+    assert not any(os.path.exists(p) for p in sidecar_paths(path))
+    assert read_excel_cached(path)["Mix"].tolist() == [1, "a"]
+
+
+def test_text_table_is_served_from_sidecar(tmp_path):
+    path = write_workbook(tmp_path, pd.DataFrame({"Week": [1, 2], "Period": ["W1", "W2"]}))
+    read_excel_cached(path)
+    assert all(os.path.exists(p) for p in sidecar_paths(path))
+    assert read_excel_cached(path)["Period"].tolist() == ["W1", "W2"]
@@ -0,0 +1,70 @@
+"""
+Monte Carlo policy simulator (Inventory_Methods.Simulation) against a one-replication loop.
+"""
+import numpy as np
+import pytest
+from Inventory_Methods.Simulation.simulation import METRICS, sample_demand, simulate_policy, run_simulation
+
+SQ = {"policy": "(s, Q)", "period": "Weekly", "lead_time": 2, "ordering_cost": 200.0, "holding_cost": 25.0,
+      "s": 40.0, "Q": 30.0}
+RS = {"policy": "(R, S)", "period": "Weekly", "lead_time": 2, "ordering_cost": 200.0, "holding_cost": 25.0,
+      "R": 3, "S": 90.0}
+
+
+def scalar_simulation(demand, policy, backorders=True):
+    """
+    One replication, one period and one order at a time.
+    """
+    lead = policy["lead_time"]
+    sq = policy["policy"] == "(s, Q)"
+    on_hand = policy["s"] + policy["Q"] if sq else policy["S"]
+    pipeline = {}
+    served = stockouts = orders = held = 0.0
+    for t, d in enumerate(demand):
+        on_hand += pipeline.pop(t, 0.0)
+        available = max(on_hand, 0.0)
+        served += min(d, available)
+        stockouts += d > available
+        on_hand = on_hand - d if backorders else max(on_hand - d, 0.0)
+        held += max(on_hand, 0.0)
+        position = on_hand + sum(pipeline.values())
+        qty = 0.0
+        if sq:
+            while position + qty <= policy["s"]:
+                qty += policy["Q"]
+        elif t % policy["R"] == 0:
+            qty = max(policy["S"] - position, 0.0)
+        if qty > 0:
+            pipeline[t + lead] = pipeline.get(t + lead, 0.0) + qty
+            orders += 1
+    years = len(demand) / 52
+    return {"Fill Rate": served / sum(demand), "Stockout Periods": stockouts, "Orders": orders,
+            "Average On Hand": held / len(demand), "Ordering Cost": orders * policy["ordering_cost"] / years}
+
+
+@pytest.mark.parametrize("policy", [SQ, RS], ids=["sQ", "RS"])
+@pytest.mark.parametrize("backorders", [True, False])
+def test_vectorized_replications_match_scalar_loop(policy, backorders):
+    rng = np.random.default_rng(18)
+    demand = rng.poisson(15, (6, 40)).astype(float)
+    result = simulate_policy(demand, policy, backorders=backorders)
+    for i, path in enumerate(demand):
+        expected = scalar_simulation(path, policy, backorders)
+        for metric, value in expected.items():
+            assert result[metric][i] == pytest.approx(value, rel=1e-12)
+
+
+def test_replay_keeps_history_order():
+    history = np.arange(10.0)
+    paths = sample_demand(history, 5, 25, "replay", np.random.default_rng(1))
+    assert paths.shape == (5, 25)
+    assert ((np.diff(paths, axis=1) % 10) == 1).all()
+
+
+def test_results_depend_on_seed_not_on_workers():
+    history = np.random.default_rng(2).poisson(20, 52).astype(float)
+    serial = run_simulation(history, SQ, replications=250, seed=7, per_task=100)
+    parallel = run_simulation(history, SQ, replications=250, seed=7, per_task=100, workers=2)
+    assert list(serial.columns) == METRICS and len(serial) == 250
+    assert serial.equals(parallel)
+    assert not serial.equals(run_simulation(history, SQ, replications=250, seed=8, per_task=100))
@@ -0,0 +1,94 @@
+"""
+Batched Holt and Holt-Winters kernels agree with one series and one parameter set at a time
+and with a plain scalar recursion of the textbook equations.
+"""
+import numpy as np
+import pytest
+from Forecasting_Methods.Holt_Method.holt import holt_kernel, holt_paths
+from Forecasting_Methods.HoltWinters_Method.holtwinters import holt_winters_kernel, holt_winters_paths
+
+
+@pytest.fixture
+def demand():
+    rng = np.random.default_rng(7)
+    periods = np.arange(60)
+    season = 1 + 0.3 * np.sin(2 * np.pi * periods / 12)
+    return (20 + 0.5 * periods) * season * rng.uniform(0.8, 1.2, (5, 60))
+
+
+def test_holt_2d_matches_each_series(demand):
+    batched = holt_kernel(demand, 0.4, 0.2)
+    for i, series in enumerate(demand):
+        np.testing.assert_allclose(batched[i], holt_kernel(series, 0.4, 0.2), rtol=1e-12)
+
+
+@pytest.mark.parametrize("seasonal", ["additive", "multiplicative"])
+def test_holt_winters_2d_matches_each_series(demand, seasonal):
+    batched = holt_winters_kernel(demand, 0.3, 0.1, 0.2, 12, seasonal)
+    for i, series in enumerate(demand):
+        np.testing.assert_allclose(batched[i], holt_winters_kernel(series, 0.3, 0.1, 0.2, 12, seasonal), rtol=1e-12)
+
+
+@pytest.mark.parametrize("seasonal", ["additive", "multiplicative"])
+def test_holt_winters_parameter_grid_matches_each_setting(demand, seasonal):
+    alphas = np.array([0.1, 0.5, 0.9])[:, None, None]
+    gammas = np.array([0.05, 0.3, 0.6])[:, None, None]
+    grid = holt_winters_paths(demand, alphas, 0.1, gammas, 12, seasonal, horizon=3)
+    assert grid.shape == (3, 5, 61, 3)
+    for k in range(3):
+        single = holt_winters_paths(demand[2], alphas[k, 0, 0], 0.1, gammas[k, 0, 0], 12, seasonal, horizon=3)
+        np.testing.assert_allclose(grid[k, 2], single, rtol=1e-12)
+
+
+def test_holt_horizon_paths_extend_the_trend(demand):
+    paths = holt_paths(demand[0], 0.4, 0.2, horizon=4)
+    steps = np.diff(paths[1:], axis=-1)
+    np.testing.assert_allclose(steps, steps[:, :1].repeat(3, axis=-1), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(paths[:-1, 0], holt_kernel(demand[0], 0.4, 0.2))
+
+
+def scalar_holt(demand, alpha, beta):
+    """
+    Textbook Holt recursion, one period at a time: Forecast(t) = Level(t-1) + Trend(t-1).
+    """
+    level, trend = demand[0], 0.0
+    forecasts = [demand[0]]
+    for actual in demand[1:]:
+        forecasts.append(level + trend)
+        previous = level
+        level = alpha * actual + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous) + (1 - beta) * trend
+    return np.array(forecasts)
+
+
+def scalar_holt_winters(demand, alpha, beta, gamma, m, seasonal):
+    """
+    Textbook Holt-Winters recursion: Naive forecasts through the first season, which
+    initializes Level = its mean, Trend = 0 and each period's seasonal index.
+    """
+    multiplicative = seasonal == "multiplicative"
+    forecasts = [demand[0]] + list(demand[:m - 1])
+    level, trend = float(np.mean(demand[:m])), 0.0
+    season = [d / level if multiplicative else d - level for d in demand[:m]]
+    for t in range(m, len(demand)):
+        s = season[t % m]
+        forecasts.append((level + trend) * s if multiplicative else level + trend + s)
+        previous = level
+        actual = demand[t]
+        level = alpha * (actual / s if multiplicative else actual - s) + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous) + (1 - beta) * trend
+        season[t % m] = gamma * (actual / level if multiplicative else actual - level) + (1 - gamma) * s
+    return np.array(forecasts)
+
+
+def test_holt_matches_scalar_recursion(demand):
+    batched = holt_kernel(demand, 0.4, 0.2)
+    for i, series in enumerate(demand):
+        np.testing.assert_allclose(batched[i], scalar_holt(series, 0.4, 0.2), rtol=1e-10)
+
+
+@pytest.mark.parametrize("seasonal", ["additive", "multiplicative"])
+def test_holt_winters_matches_scalar_recursion(demand, seasonal):
+    batched = holt_winters_kernel(demand, 0.3, 0.1, 0.2, 12, seasonal)
+    for i, series in enumerate(demand):
+        np.testing.assert_allclose(batched[i], scalar_holt_winters(series, 0.3, 0.1, 0.2, 12, seasonal), rtol=1e-10)
@@ -0,0 +1,63 @@
+"""
+Vectorized parameter tuning (Forecasting_Methods.Parameter_Tuning) against brute force.
+"""
+import numpy as np
+import pytest
+from Forecasting_Methods.Parameter_Tuning.tuning import (
+    moving_average_grid, tune_parameters, tune_holt, TREND_ALPHAS, TREND_BETAS)
+from Forecasting_Methods.ExponentialSmoothing_Method.exponential import exponential_smoothing_kernel
+from Forecasting_Methods.Holt_Method.holt import holt_kernel
+
+
+@pytest.fixture
+def demand():
+    rng = np.random.default_rng(5)
+    return 50 + np.cumsum(rng.normal(0, 4, (3, 30)), axis=-1)
+
+
+def scalar_moving_average(series, n):
+    return np.array([series[0]] + [series[max(0, t - n):t].mean() for t in range(1, len(series))])
+
+
+def mad(series, forecast):
+    return np.mean(np.abs(series - forecast))
+
+
+def test_moving_average_grid_matches_loop(demand):
+    windows = [1, 3, 7]
+    grid = moving_average_grid(demand, windows)
+    assert grid.shape == (3, 3, 30)
+    for k, n in enumerate(windows):
+        for i, series in enumerate(demand):
+            np.testing.assert_allclose(grid[k, i], scalar_moving_average(series, n), rtol=1e-12)
+
+
+def test_tune_parameters_finds_brute_force_optimum(demand):
+    windows, alphas = np.arange(1, 11), np.round(np.arange(0.05, 1.0001, 0.05), 2)
+    for series in demand:
+        tuned = tune_parameters(series, windows=windows, alphas=alphas)
+        ma_errors = [mad(series, scalar_moving_average(series, n)) for n in windows]
+        es_errors = [mad(series, exponential_smoothing_kernel(series, a)) for a in alphas]
+        assert tuned["ma_n"] == windows[np.argmin(ma_errors)]
+        assert tuned["ma_error"] == pytest.approx(min(ma_errors), rel=1e-12)
+        assert tuned["alpha"] == alphas[np.argmin(es_errors)]
+        assert tuned["alpha_error"] == pytest.approx(min(es_errors), rel=1e-12)
+
+
+@pytest.mark.parametrize("criteria", ["MAD", "MSE"])
+def test_batched_and_chunked_tuning_match_single_series(demand, criteria):
+    batched = tune_parameters(demand, criteria=criteria)
+    chunked = tune_parameters(demand, criteria=criteria, max_elements=100)
+    for i, series in enumerate(demand):
+        single = tune_parameters(series, criteria=criteria)
+        for key, value in single.items():
+            assert batched[key][i] == pytest.approx(value, rel=1e-12)
+            assert chunked[key][i] == pytest.approx(value, rel=1e-12)
+
+
+def test_tune_holt_finds_brute_force_optimum(demand):
+    tuned = tune_holt(demand[0])
+    errors = {(a, b): mad(demand[0], holt_kernel(demand[0], a, b)) for a in TREND_ALPHAS for b in TREND_BETAS}
+    best = min(errors, key=errors.get)
+    assert (tuned["alpha"], tuned["beta"]) == pytest.approx(best)
+    assert tuned["error"] == pytest.approx(errors[best], rel=1e-12)